@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.security import principal_cache
 from app.models.admin_user import AdminUser, UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
@@ -13,6 +14,11 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db),
     token: str = Depends(oauth2_scheme)
 ) -> AdminUser:
+    cached = principal_cache.get(token)
+    if cached is not None:
+        # Attach to this request's session without a query, so relationships resolve locally
+        return await db.merge(cached, load=False)
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -30,6 +36,7 @@ async def get_current_user(
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    principal_cache.put(token, user, payload.get("exp"))
     return user
 
 async def get_superadmin(
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
@@ -11,6 +11,8 @@ from app.core.config import settings
 from app.models.analytics import DailyStats, DailyStationStats, DailyCountryStats
 from app.models.admin_user import AdminUser
 from app.api.v1.deps import get_current_user
+from app.api.v1.endpoints.stations import STATIONS_KEY
+from app.dependencies import get_cdn_purger, get_station_service
 from app.schemas.analytics import (
     AdminOverviewResponse,
     StationStatsResponse,
@@ -19,6 +21,8 @@ from app.schemas.analytics import (
 )
 
 router = APIRouter()
+station_service = get_station_service()
+cdn_purger = get_cdn_purger()
 
 def get_date_range(time_range: TimeRange) -> Optional[date]:
     today = date.today()
@@ -127,3 +131,13 @@ async def get_top_stations(
         StationStatsResponse(station_id=row[0], play_count=row[1]) 
         for row in result.all()
     ]
+
+@router.post("/admin/cache/purge")
+async def purge_station_cache(
+    background_tasks: BackgroundTasks,
+    current_user: AdminUser = Depends(get_current_user)
+):
+    """Flush the station cache and purge every cached station response from the CDN."""
+    await station_service.flush_cache()
+    background_tasks.add_task(cdn_purger.purge, [STATIONS_KEY])
+    return {"status": "success", "message": "Cache purged"}
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.core.security import create_access_token, verify_password
+from app.core.security import create_access_token, verify_password_async
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.admin_user import AdminUser
@@ -26,7 +26,7 @@ async def login_for_access_token(
         result = await db.execute(select(AdminUser).where(AdminUser.username == form_data.username))
         user = result.scalar_one_or_none()
         
-        if user is None or not verify_password(form_data.password, user.hashed_password):
+        if user is None or not await verify_password_async(form_data.password, user.hashed_password):
             # This is NOT a 500, it's a 401
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
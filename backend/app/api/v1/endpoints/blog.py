@@ -1,21 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 
+from app.core.content import compile_post
 from app.core.database import get_db
 from app.models.blog import BlogPost
 from app.models.admin_user import AdminUser
-from app.schemas.blog import BlogCreate, BlogUpdate, BlogResponse
+from app.schemas.blog import BlogCreate, BlogUpdate, BlogResponse, BlogSummaryPage
+from app.application.blog import list_post_summaries
+from app.application.static_export import export_static_site
+from app.core.cdn import BLOG_KEY, SITE_PAGES, set_cache_headers, set_no_store, surrogate_key
+from app.core.config import settings
 from app.api.v1.deps import get_current_user
+from app.dependencies import get_cdn_purger, get_page_cache
 
 router = APIRouter()
+page_cache = get_page_cache()
+cdn_purger = get_cdn_purger()
+
+def publish_changes(background_tasks: BackgroundTasks):
+    """Drop cached SSR pages, purge them from the CDN and, if configured, refresh the static export after the response."""
+    page_cache.invalidate()
+    background_tasks.add_task(cdn_purger.purge, [BLOG_KEY])
+    if settings.STATIC_EXPORT_DIR:
+        background_tasks.add_task(export_static_site)
 
 # --- Public Endpoints ---
 
 @router.get("/", response_model=List[BlogResponse])
 async def list_posts(
+    response: Response,
     skip: int = 0, 
     limit: int = 10, 
     published_only: bool = True,
@@ -27,12 +43,33 @@ async def list_posts(
     stmt = select(BlogPost).options(selectinload(BlogPost.author)).order_by(desc(BlogPost.created_at)).offset(skip).limit(limit)
     if published_only:
         stmt = stmt.where(BlogPost.is_published == True)
+        set_cache_headers(response, SITE_PAGES, [BLOG_KEY])
+    else:
+        # Drafts are never handed to a shared cache
+        set_no_store(response)
         
     result = await db.execute(stmt)
     return result.scalars().all()
 
+@router.get("/summaries", response_model=BlogSummaryPage)
+async def list_post_summaries_page(
+    response: Response,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Lightweight published post cards, newest first. Pass `next_cursor` back as `cursor` for the next page.
+    """
+    try:
+        items, next_cursor = await list_post_summaries(db, limit=min(limit, 100), cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_cache_headers(response, SITE_PAGES, [BLOG_KEY])
+    return BlogSummaryPage(items=items, next_cursor=next_cursor)
+
 @router.get("/{slug}", response_model=BlogResponse)
-async def get_post_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
+async def get_post_by_slug(slug: str, response: Response, db: AsyncSession = Depends(get_db)):
     """
     Get a single post by slug for SSR.
     """
@@ -40,6 +77,11 @@ async def get_post_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
     post = result.scalar_one_or_none()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
+    if post.is_published:
+        set_cache_headers(response, SITE_PAGES, [BLOG_KEY, surrogate_key("post", slug)])
+    else:
+        # Drafts are never handed to a shared cache
+        set_no_store(response)
     return post
 
 # --- Admin Endpoints (Protected) ---
@@ -47,6 +89,7 @@ async def get_post_by_slug(slug: str, db: AsyncSession = Depends(get_db)):
 @router.post("/", response_model=BlogResponse)
 async def create_post(
     post_in: BlogCreate, 
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
@@ -59,15 +102,18 @@ async def create_post(
         raise HTTPException(status_code=400, detail="Slug already exists")
         
     db_post = BlogPost(**post_in.model_dump(), author_id=current_user.id)
+    compile_post(db_post)
     db.add(db_post)
     await db.commit()
     await db.refresh(db_post)
+    publish_changes(background_tasks)
     return db_post
 
 @router.patch("/{post_id}", response_model=BlogResponse)
 async def update_post(
     post_id: int, 
     post_in: BlogUpdate, 
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
@@ -82,14 +128,18 @@ async def update_post(
     update_data = post_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_post, field, value)
+    if "content" in update_data:
+        compile_post(db_post)
         
     await db.commit()
     await db.refresh(db_post)
+    publish_changes(background_tasks)
     return db_post
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: int, 
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: AdminUser = Depends(get_current_user)
 ):
@@ -103,4 +153,5 @@ async def delete_post(
         
     await db.delete(db_post)
     await db.commit()
+    publish_changes(background_tasks)
     return None
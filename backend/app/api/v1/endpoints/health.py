@@ -1,7 +1,12 @@
 from fastapi import APIRouter
+from app.core.metrics import metrics
 
 router = APIRouter()
 
 @router.get("/health")
 async def health():
     return {"status": "ok"}
+
+@router.get("/metrics")
+async def get_metrics():
+    return metrics.collect()
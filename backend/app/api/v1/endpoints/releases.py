@@ -1,13 +1,26 @@
-from fastapi import APIRouter, HTTPException
+import hashlib
+import hmac
+import json
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
 from fastapi.responses import RedirectResponse
-from app.dependencies import get_release_service
+from app.core.cdn import RELEASE_MANIFEST
+from app.core.config import settings
+from app.core.http import etag_matches
+from app.dependencies import get_cdn_purger, get_release_service
 
 router = APIRouter()
 release_service = get_release_service()
+cdn_purger = get_cdn_purger()
+
+RELEASES_KEY = "releases"
 
 @router.get("/latest")
-async def get_latest_release():
-    return await release_service.get_latest_release()
+async def get_latest_release(request: Request):
+    body, etag = await release_service.get_latest_release_payload()
+    headers = {"ETag": etag, "Cache-Control": RELEASE_MANIFEST.header(), "Surrogate-Key": RELEASES_KEY}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.get("/download/{asset_id}")
 async def download_asset(asset_id: int):
@@ -17,3 +30,39 @@ async def download_asset(asset_id: int):
     
     raise HTTPException(status_code=400, detail="Unable to resolve download redirect")
 
+@router.post("/webhook", status_code=202)
+async def release_webhook(request: Request, background_tasks: BackgroundTasks):
+    """
+    GitHub webhook for release events, verified with X-Hub-Signature-256.
+    Rebuilds the cached updater manifest immediately instead of waiting for the next poll.
+    """
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=500, detail="GitHub webhook secret missing")
+
+    body = await request.body()
+    expected = "sha256=" + hmac.new(settings.GITHUB_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(expected, request.headers.get("x-hub-signature-256", "")):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    event = request.headers.get("x-github-event", "")
+    if event == "ping":
+        return {"status": "pong"}
+    if event != "release":
+        return {"status": "ignored"}
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Malformed webhook payload")
+    action = payload.get("action")
+    release = payload.get("release") or {}
+    if action in ("created", "published", "prereleased"):
+        # Drafts and prereleases never become latest; a published full release also sends "released"
+        return {"status": "ignored"}
+    if action == "released" and not release.get("draft") and not release.get("prerelease"):
+        await release_service.apply_release(release)
+    else:
+        # Edits, deletions and unpublishing: ask GitHub which release is latest now
+        await release_service.refresh(force=True)
+    background_tasks.add_task(cdn_purger.purge, [RELEASES_KEY])
+    return {"status": "ok"}
@@ -1,54 +1,198 @@
-from fastapi import APIRouter, Query
-from typing import List
+import json
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional, Tuple
 from app.schemas.station import Station
-from app.domain.models import Category, SummaryStats
+from app.domain.models import Category, GlobalSearchResult, StationRecord, SummaryStats
+from app.application.interfaces import StationStreamError
+from app.application.cursors import StationCursor, decode_station_cursor, encode_station_cursor, next_station_cursor
+from app.core.cdn import CachePolicy, STATION_BROWSE, STATION_LISTS, STATION_SEARCH, set_cache_headers, set_no_store, surrogate_key
+from app.core.concurrency import Superseded
+from app.core.http import ClientDisconnected, cancel_on_disconnect
 from app.dependencies import get_station_service
 
 station_service = get_station_service()
 
 router = APIRouter()
 
+# Every cacheable station response carries this key, so a flush purges them all
+STATIONS_KEY = "stations"
+NDJSON = "application/x-ndjson"
+
+def wants_stream(request: Request, stream: bool) -> bool:
+    return stream or NDJSON in request.headers.get("accept", "")
+
+def parse_cursor(cursor: Optional[str], query: Tuple) -> Optional[StationCursor]:
+    if not cursor:
+        return None
+    try:
+        return decode_station_cursor(cursor, query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def cursor_token(
+    last: Optional[StationRecord], count: int, offset: int, limit: int, query: Tuple, sort_field: str
+) -> Optional[str]:
+    after = next_station_cursor(last, count, offset, limit, sort_field)
+    return encode_station_cursor(after, query) if after else None
+
+async def ndjson_lines(
+    stations: AsyncIterator[StationRecord], limit: int, offset: int, query: Tuple, sort_field: str
+) -> AsyncIterator[bytes]:
+    """
+    One station per line, then {"next_cursor": ...} (null once the results are
+    exhausted). A stream that breaks off ends with {"error": ...} instead, so
+    clients can tell it from the end of the results.
+    """
+    count, last = 0, None
+    try:
+        async for station in stations:
+            count, last = count + 1, station
+            yield Station.model_validate(station).model_dump_json().encode() + b"\n"
+    except StationStreamError:
+        yield json.dumps({"error": "upstream stream interrupted"}).encode() + b"\n"
+        return
+    next_cursor = cursor_token(last, count, offset, limit, query, sort_field)
+    yield json.dumps({"next_cursor": next_cursor}).encode() + b"\n"
+
+def set_negotiated_cache_headers(response: Response, policy: CachePolicy, keys: List[str]):
+    # JSON and NDJSON share a URL when the format is picked by the Accept header
+    set_cache_headers(response, policy, keys)
+    response.headers["Vary"] = "Accept"
+
+def stream_response(
+    stations: AsyncIterator[StationRecord],
+    limit: int,
+    offset: int,
+    query: Tuple,
+    sort_field: str,
+    policy: CachePolicy,
+    keys: List[str]
+) -> StreamingResponse:
+    response = StreamingResponse(ndjson_lines(stations, limit, offset, query, sort_field), media_type=NDJSON)
+    set_negotiated_cache_headers(response, policy, keys)
+    return response
+
+def page_response(
+    response: Response, stations: List[StationRecord], limit: int, offset: int, query: Tuple, sort_field: str
+) -> List[StationRecord]:
+    next_cursor = cursor_token(stations[-1] if stations else None, len(stations), offset, limit, query, sort_field)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return stations
+
 @router.get("/stats", response_model=SummaryStats)
-async def get_stats():
+async def get_stats(response: Response):
+    set_cache_headers(response, STATION_LISTS, [STATIONS_KEY, "stats"])
     return await station_service.get_summary_stats()
 
 @router.get("/featured", response_model=List[Station])
-async def get_featured_stations(region: str = Query("Europe")):
+async def get_featured_stations(response: Response, region: str = Query("Europe")):
+    set_cache_headers(response, STATION_LISTS, [STATIONS_KEY, surrogate_key("featured", region)])
     return await station_service.get_featured_stations(region)
 
 @router.get("/top", response_model=List[Station])
-async def get_top_stations(limit: int = 100):
-    return await station_service.get_top_stations(limit)
+async def get_top_stations(
+    request: Request,
+    response: Response,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: str = Query(None),
+    stream: bool = Query(False)
+):
+    query = ("top",)
+    after = parse_cursor(cursor, query)
+    keys = [STATIONS_KEY, "top"]
+    if wants_stream(request, stream):
+        if after:
+            _, offset = await station_service.resume_top_stations(after, limit=0)
+        stations = station_service.stream_top_stations(limit, offset)
+        return stream_response(stations, limit, offset, query, "votes", STATION_LISTS, keys)
+
+    set_negotiated_cache_headers(response, STATION_LISTS, keys)
+    if after:
+        stations, offset = await station_service.resume_top_stations(after, limit)
+    else:
+        stations = await station_service.get_top_window(limit, offset)
+    return page_response(response, stations, limit, offset, query, "votes")
 
 @router.get("/search", response_model=List[Station])
 async def search_stations(
+    request: Request,
+    response: Response,
     name: str = Query(None), 
     country: str = Query(None), 
     countrycode: str = Query(None),
     language: str = Query(None),
     tag: str = Query(None),
     limit: int = 100,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str = Query(None),
+    stream: bool = Query(False)
 ):
-    return await station_service.search_stations(name, country, countrycode, language, tag, limit, offset)
+    """
+    Stations as a JSON array, or as NDJSON with `?stream=1` / `Accept: application/x-ndjson`.
+    Pages after the first are requested with `cursor` rather than `offset`: JSON responses
+    carry it in `X-Next-Cursor`, streams end with a {"next_cursor": ...} line.
+    """
+    query = ("search", name, country, countrycode, language, tag)
+    after = parse_cursor(cursor, query)
+    if name:
+        policy, keys = STATION_SEARCH, [STATIONS_KEY, "search"]
+    else:
+        filters = {"country": country, "countrycode": countrycode, "language": language, "tag": tag}
+        policy = STATION_BROWSE
+        keys = [STATIONS_KEY, "browse", *(surrogate_key("browse", f, v) for f, v in filters.items() if v)]
+    if wants_stream(request, stream):
+        if after:
+            _, offset = await station_service.resume_search(after, name, country, countrycode, language, tag, limit=0)
+        stations = station_service.stream_stations(name, country, countrycode, language, tag, limit, offset)
+        return stream_response(stations, limit, offset, query, "clickcount", policy, keys)
+
+    set_negotiated_cache_headers(response, policy, keys)
+    if after:
+        stations, offset = await station_service.resume_search(after, name, country, countrycode, language, tag, limit)
+    else:
+        stations = await station_service.search_stations(name, country, countrycode, language, tag, limit, offset)
+    return page_response(response, stations, limit, offset, query, "clickcount")
 
 @router.get("/countries", response_model=List[Category])
-async def get_countries(limit: int = 24, offset: int = 0, name: str = None):
+async def get_countries(response: Response, limit: int = 24, offset: int = 0, name: str = None):
+    set_cache_headers(response, STATION_BROWSE, [STATIONS_KEY, "categories:countries"])
     return await station_service.get_countries(limit, offset, name)
 
 @router.get("/languages", response_model=List[Category])
-async def get_languages(limit: int = 24, offset: int = 0, name: str = None):
+async def get_languages(response: Response, limit: int = 24, offset: int = 0, name: str = None):
+    set_cache_headers(response, STATION_BROWSE, [STATIONS_KEY, "categories:languages"])
     return await station_service.get_languages(limit, offset, name)
 
 @router.get("/tags", response_model=List[Category])
-async def get_tags(limit: int = 24, offset: int = 0, name: str = None):
+async def get_tags(response: Response, limit: int = 24, offset: int = 0, name: str = None):
+    set_cache_headers(response, STATION_BROWSE, [STATIONS_KEY, "categories:tags"])
     return await station_service.get_tags(limit, offset, name)
 
 @router.get("/global-search")
-async def search_global(query: str):
-    return await station_service.search_global(query)
+async def search_global(request: Request, response: Response, query: str):
+    # Type-ahead clients send a per-tab X-Client-Id so a newer query supersedes the one in flight
+    client_id = request.headers.get("x-client-id")
+    try:
+        result = await cancel_on_disconnect(request, station_service.search_global(query, client_id=client_id))
+    except Superseded:
+        # The client has already moved on; never cache this placeholder
+        set_no_store(response)
+        return GlobalSearchResult(countries=[], languages=[], tags=[], stations=[])
+    except ClientDisconnected:
+        return Response(status_code=499)
+    set_cache_headers(response, STATION_SEARCH, [STATIONS_KEY, "search"])
+    return result
+
+@router.get("/cache/stats")
+async def get_cache_stats(response: Response):
+    set_no_store(response)
+    return station_service.get_cache_stats()
 
 @router.post("/cache/flush")
 async def flush_cache():
-    station_service.flush_cache()
+    # Unauthenticated, so it only drops this server's cache; CDN purges need an admin (POST /admin/cache/purge)
+    await station_service.flush_cache()
     return {"status": "success", "message": "Cache flushed"}
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 from app.core.database import get_db
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async, principal_cache
 from app.models.admin_user import AdminUser, UserRole
 from app.schemas.admin_user import UserCreate, UserResponse
 from app.api.v1.deps import get_superadmin
@@ -31,7 +31,7 @@ async def create_user(
     
     user = AdminUser(
         username=user_in.username,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         role=user_in.role or UserRole.ADMIN
     )
     db.add(user)
@@ -53,4 +53,5 @@ async def delete_user(
     
     await db.delete(user)
     await db.commit()
+    principal_cache.invalidate_user(user.username)
     return None
@@ -0,0 +1,162 @@
+import re
+import time
+import unicodedata
+from bisect import bisect_left
+from heapq import merge
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+_WORD = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """Casefolded words with accents removed, so "Rádio Nürnberg" matches "radio nurnberg"."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _WORD.findall(stripped.casefold())
+
+def max_typos(token: str) -> int:
+    # Short tokens are still being typed; one typo in a two-letter prefix matches everything
+    if len(token) >= 8:
+        return 2
+    return 1 if len(token) >= 4 else 0
+
+def edit_distance(token: str, word: str, prefix: bool) -> int:
+    """
+    Edits (insertions, deletions, substitutions and swaps of adjacent letters)
+    from `token` to `word`, or to its closest prefix when `prefix` is set.
+    """
+    before, previous = None, list(range(len(word) + 1))
+    for i, a in enumerate(token, 1):
+        current = [i]
+        for j, b in enumerate(word, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a != b))
+            if before is not None and j > 1 and a == word[j - 2] and token[i - 2] == b:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        before, previous = previous, current
+    return min(previous) if prefix else previous[-1]
+
+def _trigrams(padded: str) -> Iterator[str]:
+    return (padded[i:i + 3] for i in range(len(padded) - 2))
+
+def _unique(numbers: Iterable[int]) -> Iterator[int]:
+    previous = None
+    for number in numbers:
+        if number != previous:
+            yield number
+            previous = number
+
+class _Vocabulary:
+    """Words of one kind of entry, each with its entry ids in popularity order."""
+
+    def __init__(self, entry_words: Sequence[Tuple[str, ...]]):
+        postings: Dict[str, List[int]] = {}
+        for entry, words in enumerate(entry_words):
+            for word in dict.fromkeys(words):
+                postings.setdefault(word, []).append(entry)
+        self.words = sorted(postings)
+        self.postings = [postings[word] for word in self.words]
+        trigrams: Dict[str, List[int]] = {}
+        for number, word in enumerate(self.words):
+            for gram in set(_trigrams(f"^{word}$")):
+                trigrams.setdefault(gram, []).append(number)
+        self.trigrams = trigrams
+
+    def exact(self, token: str) -> List[List[int]]:
+        position = bisect_left(self.words, token)
+        if position < len(self.words) and self.words[position] == token:
+            return [self.postings[position]]
+        return []
+
+    def prefixed(self, token: str) -> List[List[int]]:
+        return self.postings[bisect_left(self.words, token):bisect_left(self.words, token + "\uffff")]
+
+    def fuzzy(self, token: str, prefix: bool) -> List[List[int]]:
+        """
+        Postings of words within max_typos(token) edits (of a prefix of them,
+        if `prefix`). Like most type-ahead, the first letter must be right.
+        """
+        typos = max_typos(token)
+        if not typos:
+            return []
+        # Words are numbered alphabetically: those sharing the first letter are one range
+        first, last = bisect_left(self.words, token[0]), bisect_left(self.words, token[0] + "\uffff")
+        # An edit destroys at most three of the token's trigrams, a swap four
+        grams = set(_trigrams(f"^{token}" if prefix else f"^{token}$"))
+        needed = max(1, len(grams) - 4 * typos)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            numbers = self.trigrams.get(gram, [])
+            for number in numbers[bisect_left(numbers, first):bisect_left(numbers, last)]:
+                shared[number] = shared.get(number, 0) + 1
+        return [
+            self.postings[number] for number, count in shared.items()
+            if count >= needed
+            and (prefix or abs(len(self.words[number]) - len(token)) <= typos)
+            and edit_distance(token, self.words[number], prefix) <= typos
+        ]
+
+class AutocompleteIndex:
+    """
+    In-memory type-ahead over station names, countries, languages and tags.
+
+    Entries of each kind are numbered by popularity, so walking the merged
+    posting lists of the words matching the query yields the most popular
+    matches first. The last query word matches as a prefix, earlier words as
+    whole words; words within one or two typos are used when exact matches
+    don't fill the requested number of suggestions.
+
+    Building is CPU-bound: do it off the event loop. Queries are read-only.
+    """
+
+    def __init__(self, entries: Dict[str, List[Tuple[str, int, any]]]):
+        """`entries` maps a kind to (name, popularity, payload) tuples; payloads are returned by suggest()."""
+        self.built_at = time.monotonic()
+        self._kinds: Dict[str, Tuple[_Vocabulary, List[Tuple[str, ...]], List[any]]] = {}
+        for kind, items in entries.items():
+            items = sorted(items, key=lambda item: -(item[1] or 0))
+            entry_words = [tuple(tokenize(name)) for name, _, _ in items]
+            self._kinds[kind] = (_Vocabulary(entry_words), entry_words, [payload for _, _, payload in items])
+
+    def __len__(self) -> int:
+        return sum(len(payloads) for _, _, payloads in self._kinds.values())
+
+    def suggest(self, query: str, limits: Dict[str, int]) -> Dict[str, List[any]]:
+        tokens = tokenize(query)
+        results = {}
+        for kind, limit in limits.items():
+            if kind not in self._kinds or not tokens:
+                results[kind] = []
+                continue
+            vocabulary, entry_words, payloads = self._kinds[kind]
+            results[kind] = [payloads[entry] for entry in self._match(vocabulary, entry_words, tokens, limit)]
+        return results
+
+    @staticmethod
+    def _match(vocabulary: _Vocabulary, entry_words: List[Tuple[str, ...]], tokens: List[str], limit: int) -> List[int]:
+        *heads, last = tokens
+        if not heads:
+            picked = list(islice(_unique(merge(*vocabulary.prefixed(last))), limit))
+            if len(picked) < limit:
+                seen = set(picked)
+                for entry in _unique(merge(*vocabulary.fuzzy(last, prefix=True))):
+                    if entry not in seen:
+                        picked.append(entry)
+                        if len(picked) == limit:
+                            break
+            return picked
+
+        # Entries containing every complete word, then filtered on the word being typed
+        candidates = None
+        for token in heads:
+            matches = set(chain.from_iterable(vocabulary.exact(token) or vocabulary.fuzzy(token, prefix=False)))
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+        ranked = sorted(candidates)
+        picked = [entry for entry in ranked if any(word.startswith(last) for word in entry_words[entry])][:limit]
+        if len(picked) < limit:
+            seen = set(picked)
+            misspelled = set(chain.from_iterable(vocabulary.fuzzy(last, prefix=True)))
+            picked += [entry for entry in ranked if entry in misspelled and entry not in seen][:limit - len(picked)]
+        return picked
@@ -0,0 +1,76 @@
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select, desc, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.blog import BlogPost
+from app.models.admin_user import AdminUser
+from app.schemas.blog import BlogSummary
+from app.core.content import EXCERPT_LENGTH
+
+def encode_cursor(created_at: datetime, post_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{post_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, post_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(post_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+async def list_post_summaries(
+    db: AsyncSession,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    published_only: bool = True
+) -> Tuple[List[BlogSummary], Optional[str]]:
+    """
+    Newest-first post summaries using keyset pagination on (created_at, id).
+    Only the columns needed for cards are selected; the Markdown body is
+    never loaded unless a post has neither a description nor an excerpt.
+    """
+    stmt = (
+        select(
+            BlogPost.id,
+            BlogPost.slug,
+            BlogPost.title,
+            BlogPost.image_url,
+            func.coalesce(
+                BlogPost.meta_description,
+                BlogPost.excerpt,
+                func.substr(BlogPost.content, 1, EXCERPT_LENGTH)
+            ).label("excerpt"),
+            BlogPost.reading_time,
+            BlogPost.created_at,
+            AdminUser.username.label("author_name"),
+        )
+        .outerjoin(AdminUser, BlogPost.author_id == AdminUser.id)
+        .order_by(desc(BlogPost.created_at), desc(BlogPost.id))
+        .limit(limit + 1)
+    )
+    if published_only:
+        stmt = stmt.where(BlogPost.is_published == True)
+    if cursor:
+        created_at, post_id = decode_cursor(cursor)
+        # Compare against the stored value so driver datetime formatting can't skew
+        # the boundary; the cursor's own timestamp covers posts deleted since.
+        boundary = func.coalesce(
+            select(BlogPost.created_at).where(BlogPost.id == post_id).scalar_subquery(),
+            created_at
+        )
+        stmt = stmt.where(or_(
+            BlogPost.created_at < boundary,
+            and_(BlogPost.created_at == boundary, BlogPost.id < post_id)
+        ))
+
+    result = await db.execute(stmt)
+    rows = result.all()
+    items = [BlogSummary(**row._mapping) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return items, next_cursor
@@ -0,0 +1,71 @@
+import base64
+import hashlib
+import hmac
+from typing import NamedTuple, Optional, Sequence, Tuple
+from app.core.config import settings
+from app.domain.models import StationRecord
+
+class StationCursor(NamedTuple):
+    """Where a station page ended: its position in the ranked list, and the last station's sort key and uuid."""
+    position: int
+    rank: int
+    stationuuid: str
+
+def _signature(payload: str, query: Tuple) -> str:
+    message = f"{payload}|{query!r}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[:24]
+
+def encode_station_cursor(cursor: StationCursor, query: Tuple) -> str:
+    """Opaque continuation token, signed with SECRET_KEY and only valid for the same query."""
+    payload = f"{cursor.position}|{cursor.rank}|{cursor.stationuuid}"
+    raw = f"{payload}|{_signature(payload, query)}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_station_cursor(token: str, query: Tuple) -> StationCursor:
+    """
+    Raises ValueError for malformed, forged or out-of-range cursors and for
+    cursors issued for another query.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        payload, signature = raw.rsplit("|", 1)
+        position, rank, stationuuid = payload.split("|")
+        cursor = StationCursor(int(position), int(rank), stationuuid)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+    if not hmac.compare_digest(signature, _signature(payload, query)):
+        raise ValueError(f"Invalid cursor: {token}")
+    if not 0 <= cursor.position <= settings.CURSOR_MAX_POSITION:
+        raise ValueError(f"Invalid cursor: {token}")
+    return cursor
+
+def sort_value(station: StationRecord, sort_field: str) -> int:
+    return getattr(station, sort_field) or 0
+
+def next_station_cursor(
+    last: Optional[StationRecord], count: int, offset: int, limit: int, sort_field: str
+) -> Optional[StationCursor]:
+    """
+    Cursor after a page of `count` stations ending with `last`, or None when
+    the list ended within it or paging reached CURSOR_MAX_POSITION.
+    """
+    if last is None or count < limit or offset + count > settings.CURSOR_MAX_POSITION:
+        return None
+    return StationCursor(offset + count, sort_value(last, sort_field), last.stationuuid)
+
+def resume_index(window: Sequence[StationRecord], cursor: StationCursor, sort_field: str, expected: int) -> int:
+    """
+    Index in `window` of the first station after `cursor`, where `expected`
+    is the cursor position relative to the window. If the ranking shifted,
+    the page resumes after the cursor's station wherever it is now, or, once
+    it has left the window, at the first station ranked below the cursor.
+    """
+    if 0 < expected <= len(window) and window[expected - 1].stationuuid == cursor.stationuuid:
+        return expected
+    for i, station in enumerate(window):
+        if station.stationuuid == cursor.stationuuid:
+            return i + 1
+    for i, station in enumerate(window):
+        if sort_value(station, sort_field) < cursor.rank:
+            return i
+    return len(window)
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
-from app.domain.models import Station, Category
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Tuple
+from app.domain.models import StationRecord, Category
+
+class StationStreamError(Exception):
+    """A station stream broke off before the upstream response was complete."""
 
 class IRadioRepository(ABC):
     @abstractmethod
-    async def get_top_stations(self, limit: int = 100) -> List[Station]:
+    async def get_top_stations(self, limit: int = 100, offset: int = 0) -> List[StationRecord]:
         pass
 
     @abstractmethod
@@ -17,9 +20,26 @@ class IRadioRepository(ABC):
         tag: Optional[str] = None,
         limit: int = 100,
         offset: int = 0
-    ) -> List[Station]:
+    ) -> List[StationRecord]:
         pass
 
+    async def iter_search_stations(
+        self,
+        name: Optional[str] = None,
+        country: Optional[str] = None,
+        countrycode: Optional[str] = None,
+        language: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> AsyncIterator[StationRecord]:
+        """
+        search_stations() as a stream; adapters override this to yield while the
+        response is still arriving, raising StationStreamError if it breaks off.
+        """
+        for station in await self.search_stations(name, country, countrycode, language, tag, limit, offset):
+            yield station
+
     @abstractmethod
     async def get_countries(self, limit: int = 100, offset: int = 0, name: Optional[str] = None) -> List[Category]:
         pass
@@ -45,6 +65,41 @@ class ICacheRepository(ABC):
     def set(self, key: str, value: any, expire: Optional[int] = None):
         pass
 
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
     @abstractmethod
     def clear(self):
         pass
+
+    def set_many(self, items: Iterable[Tuple[str, any, Optional[int]]]):
+        for key, value, expire in items:
+            self.set(key, value, expire=expire)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {}
+
+class IAsyncCacheRepository(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[any]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: any, expire: Optional[int] = None):
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    async def clear(self):
+        pass
+
+    async def flush(self):
+        """Persist buffered writes; called at shutdown. Unbuffered caches have nothing to do."""
+        pass
+
+    def stats(self) -> Dict[str, Dict]:
+        return {}
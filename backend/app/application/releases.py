@@ -1,25 +1,155 @@
-from typing import Dict, List, Optional
+import asyncio
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
 from app.infrastructure.external.github import GitHubAdapter
 from app.core.config import settings
 
+def signed_url_expiry(url: str) -> Optional[float]:
+    """
+    Unix time at which a pre-signed download URL stops working, read from
+    its query string (S3 SigV4, legacy S3/CloudFront `Expires`, or Azure SAS
+    `se`). Returns None when the URL carries no recognizable expiry.
+    """
+    params = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+    try:
+        if "X-Amz-Date" in params and "X-Amz-Expires" in params:
+            signed_at = datetime.strptime(params["X-Amz-Date"], "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+            return signed_at.timestamp() + int(params["X-Amz-Expires"])
+        if "Expires" in params:
+            return float(params["Expires"])
+        if "se" in params:
+            return datetime.fromisoformat(params["se"].replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        pass
+    return None
+
+def version_key(tag_name: str) -> Optional[Tuple[int, ...]]:
+    """Comparable (major, minor, patch) of a "v1.2.3" style tag, or None if it isn't one."""
+    try:
+        return tuple(int(part) for part in tag_name.lstrip("v").split("-")[0].split("."))
+    except ValueError:
+        return None
+
 class ReleaseService:
-    def __init__(self, github_adapter: GitHubAdapter):
+    """
+    Serves the Tauri updater manifest from memory.
+
+    The manifest is rebuilt from GitHub at most once per `refresh_interval`
+    seconds using If-None-Match, so an unchanged release costs one 304 per
+    interval. Stale manifests are served while the refresh runs in the
+    background.
+    """
+
+    def __init__(self, github_adapter: GitHubAdapter, refresh_interval: int = settings.RELEASE_REFRESH_INTERVAL):
         self.github_adapter = github_adapter
+        self.refresh_interval = refresh_interval
+        self._manifest: Optional[Dict] = None
+        self._manifest_body: bytes = b""
+        self._manifest_etag: str = ""
+        self._github_etag: Optional[str] = None
+        self._fetched_at: float = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._redirects: Dict[int, Tuple[str, float]] = {}
+        self._redirect_tasks: Dict[int, asyncio.Task] = {}
 
     async def get_latest_release(self) -> Dict:
-        data = await self.github_adapter.get_latest_release()
+        await self._ensure_fresh()
+        return self._manifest
+
+    async def get_latest_release_payload(self) -> Tuple[bytes, str]:
+        """Pre-serialized manifest and its ETag, for the updater endpoint."""
+        await self._ensure_fresh()
+        return self._manifest_body, self._manifest_etag
+
+    async def refresh(self, force: bool = False):
+        """Re-check GitHub now. `force` skips the conditional request."""
+        if force:
+            if self._refresh_task and not self._refresh_task.done():
+                # An in-flight conditional check may predate the change we were told about
+                await asyncio.wait([self._refresh_task])
+            self._github_etag = None
+            self._redirects.clear()
+        await asyncio.shield(self._start_refresh())
+
+    async def apply_release(self, data: Dict):
+        """
+        Rebuild the manifest from a release object pushed by a webhook. A
+        release that is not newer than the one served (e.g. a backport) may
+        not be GitHub's latest, so GitHub is asked instead.
+        """
+        current = version_key(self._manifest.get("tag_name", "")) if self._manifest else None
+        released = version_key(data.get("tag_name", ""))
+        if current is None or released is None or released <= current:
+            await self.refresh(force=True)
+            return
+
+        manifest, _ = await self._build_manifest(data)
+        self._store_manifest(manifest)
+        # Next scheduled check fetches the full release and a fresh ETag
+        self._github_etag = None
+        self._fetched_at = time.monotonic()
+        self._redirects.clear()
+
+    async def _ensure_fresh(self):
+        if self._manifest is None:
+            # A cancelled caller must not cancel the refresh other callers wait on
+            await asyncio.shield(self._start_refresh())
+        elif time.monotonic() - self._fetched_at >= self.refresh_interval:
+            self._schedule_background_refresh()
+
+    def _start_refresh(self) -> asyncio.Task:
+        # Concurrent callers share one in-flight refresh
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+        return self._refresh_task
+
+    def _schedule_background_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._start_refresh().add_done_callback(self._log_refresh_failure)
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            print(f"Background release refresh failed: {task.exception()}")
+
+    async def _refresh(self):
+        etag = self._github_etag if self._manifest is not None else None
+        try:
+            data, github_etag = await self.github_adapter.fetch_latest_release(etag)
+        except Exception:
+            if self._manifest is not None:
+                # Keep serving the stale manifest; retry after another interval
+                self._fetched_at = time.monotonic()
+            raise
+        if data is not None:
+            manifest, complete = await self._build_manifest(data)
+            self._store_manifest(manifest)
+            # A fallback manifest must not be pinned by a 304 on the next check
+            self._github_etag = github_etag if complete else None
+        self._fetched_at = time.monotonic()
+
+    def _store_manifest(self, manifest: Dict):
+        body = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        self._manifest = manifest
+        self._manifest_body = body
+        self._manifest_etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    async def _build_manifest(self, data: Dict) -> Tuple[Dict, bool]:
         tag_name = data.get("tag_name", "")
-        
+
         # Normalize version (remove all leading v's then add exactly one)
         clean_version = tag_name.lstrip('v')
         display_version = f"v{clean_version}"
 
         # Check if there's a latest.json (Tauri v2 updater format)
         latest_json_asset = next((a for a in data.get("assets", []) if a["name"] == "latest.json"), None)
-        
+
         if latest_json_asset:
             try:
-                import json
                 content = await self.github_adapter.get_asset_content(latest_json_asset["id"])
                 tauri_data = json.loads(content)
                 # Keep our custom metadata for the landing page
@@ -27,11 +157,15 @@ class ReleaseService:
                     "tag_name": display_version,
                     "assets": self._get_legacy_assets(data)
                 })
-                return tauri_data
+                return tauri_data, True
             except Exception as e:
                 print(f"Failed to parse latest.json: {e}")
+                return self._fallback_manifest(data, display_version), False
+
+        return self._fallback_manifest(data, display_version), True
 
-        # Fallback: Construct a valid Tauri v2 JSON if latest.json is missing
+    def _fallback_manifest(self, data: Dict, display_version: str) -> Dict:
+        # Construct a valid Tauri v2 JSON if latest.json is missing
         return {
             "version": display_version,
             "notes": data.get("body", "New version available"),
@@ -55,4 +189,24 @@ class ReleaseService:
         return assets
 
     async def get_download_url(self, asset_id: int) -> Optional[str]:
-        return await self.github_adapter.get_asset_redirect(asset_id)
+        cached = self._redirects.get(asset_id)
+        if cached and time.time() < cached[1]:
+            return cached[0]
+
+        # Concurrent clicks on the same asset share one GitHub call
+        task = self._redirect_tasks.get(asset_id)
+        if task is None or task.done():
+            task = asyncio.get_running_loop().create_task(self._resolve_download_url(asset_id))
+            self._redirect_tasks[asset_id] = task
+        return await asyncio.shield(task)
+
+    async def _resolve_download_url(self, asset_id: int) -> Optional[str]:
+        try:
+            url = await self.github_adapter.get_asset_redirect(asset_id)
+        finally:
+            self._redirect_tasks.pop(asset_id, None)
+        if url:
+            expires_at = signed_url_expiry(url) or time.time() + settings.RELEASE_REDIRECT_FALLBACK_TTL
+            # Stop handing the URL out a little before it expires
+            self._redirects[asset_id] = (url, expires_at - settings.RELEASE_REDIRECT_REFRESH_MARGIN)
+        return url
@@ -1,20 +1,69 @@
 import asyncio
-from typing import List, Optional
-from app.domain.models import Station, Category, GlobalSearchResult, SummaryStats
-from app.application.interfaces import IRadioRepository, ICacheRepository
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from app.domain.models import StationRecord, Category, GlobalSearchResult, SummaryStats
+from app.application.interfaces import IRadioRepository, IAsyncCacheRepository
+from app.application.cursors import StationCursor, resume_index
+from app.application.autocomplete import AutocompleteIndex
+from app.core.concurrency import ClientGate
 from app.core.config import settings
 from app.core.curated import CURATED_STATIONS
 
 class StationService:
-    def __init__(self, radio_repo: IRadioRepository, cache_repo: ICacheRepository):
+    # Suggestions per kind in a global search, and how many upstream result sets are kept for reuse
+    GLOBAL_SEARCH_LIMITS = {"countries": 4, "languages": 4, "tags": 4, "stations": 20}
+    GLOBAL_SEARCH_REMEMBERED = 512
+
+    def __init__(self, radio_repo: IRadioRepository, cache_repo: IAsyncCacheRepository, snapshot=None, station_index=None):
         self.radio_repo = radio_repo
         self.cache_repo = cache_repo
+        # Optional bundled StationSnapshot consulted on cache misses (desktop sidecar)
+        self.snapshot = snapshot
+        # Optional memory-mapped StationIndex answering browses and category lists
+        self.station_index = station_index
+        self._snapshot_refreshes: Dict[str, asyncio.Task] = {}
+        self._snapshot_retry_at: Dict[str, float] = {}
+        # Type-ahead for search_global, rebuilt in the background from cached catalog data
+        self.autocomplete: Optional[AutocompleteIndex] = None
+        self._autocomplete_task: Optional[asyncio.Task] = None
+        self._autocomplete_retry_at = 0.0
+        # Type-ahead bursts: per-client debounce/supersede, and recent upstream results for prefix reuse
+        self.global_search_gate = ClientGate(
+            max_concurrent=settings.GLOBAL_SEARCH_PER_CLIENT, debounce=settings.GLOBAL_SEARCH_DEBOUNCE
+        )
+        self._global_results: "OrderedDict[str, Tuple[float, Dict[str, list]]]" = OrderedDict()
+
+    def _from_snapshot(self, cache_key: str, reload: Callable[[], Awaitable]) -> Optional[any]:
+        """
+        Bundled value for a cache miss, if the snapshot has one. The live value
+        is fetched in the background by `reload()` and lands in the cache for
+        later requests; while offline it is retried once per interval.
+        """
+        if self.snapshot is None:
+            return None
+        value = self.snapshot.get(cache_key)
+        if value is None:
+            return None
+
+        now = time.monotonic()
+        if cache_key not in self._snapshot_refreshes and now >= self._snapshot_retry_at.get(cache_key, 0.0):
+            self._snapshot_retry_at[cache_key] = now + settings.SNAPSHOT_RETRY_INTERVAL
+            task = asyncio.get_running_loop().create_task(reload())
+            self._snapshot_refreshes[cache_key] = task
+            task.add_done_callback(lambda t: self._snapshot_refresh_done(cache_key, t))
+        return value
+
+    def _snapshot_refresh_done(self, cache_key: str, task: asyncio.Task):
+        self._snapshot_refreshes.pop(cache_key, None)
+        if not task.cancelled() and task.exception():
+            print(f"Error refreshing snapshot entry {cache_key}: {task.exception()}")
 
-    async def get_featured_stations(self, region: str) -> List[Station]:
+    async def get_featured_stations(self, region: str) -> List[StationRecord]:
         cache_key = f"featured_{region.lower().replace(' ', '_')}"
-        cached = self.cache_repo.get(cache_key)
+        cached = await self.cache_repo.get(cache_key)
         if cached:
-            return [Station(**s) for s in cached]
+            return StationRecord.from_cached(cached)
 
         # Try to load from static metadata first for "instant" feel
         try:
@@ -26,9 +75,9 @@ class StationService:
                     static_metadata = json.load(f)
                     region_data = static_metadata.get(region)
                     if region_data:
-                        stations = [Station(**s) for s in region_data]
+                        stations = [StationRecord.from_dict(s) for s in region_data]
                         # Populate cache in background (optional, but good for TTL)
-                        self.cache_repo.set(cache_key, [s.dict() for s in stations], expire=settings.CACHE_TTL)
+                        await self.cache_repo.set(cache_key, [s.to_dict() for s in stations], expire=settings.CACHE_TTL)
                         return stations
         except Exception as e:
             print(f"Error loading curated metadata: {e}")
@@ -51,18 +100,41 @@ class StationService:
                 stations.append(res[0])
 
         if stations:
-            self.cache_repo.set(cache_key, [s.dict() for s in stations], expire=settings.CACHE_TTL)
+            await self.cache_repo.set(cache_key, [s.to_dict() for s in stations], expire=settings.CACHE_TTL)
         
         return stations
 
-    async def get_top_stations(self, limit: int = 100) -> List[Station]:
+    async def get_top_stations(self, limit: int = 100) -> List[StationRecord]:
         cache_key = f"top_{limit}_v2"
-        cached = self.cache_repo.get(cache_key)
-        if cached: return [Station(**s) for s in cached]
-        
+        cached = await self.cache_repo.get(cache_key)
+        if cached: return StationRecord.from_cached(cached)
+
+        bundled = self._from_snapshot(cache_key, lambda: self._load_top_stations(cache_key, limit))
+        if bundled: return StationRecord.from_cached(bundled)
+        return await self._load_top_stations(cache_key, limit)
+
+    async def _load_top_stations(self, cache_key: str, limit: int) -> List[StationRecord]:
         stations = await self.radio_repo.get_top_stations(limit)
         if stations:
-            self.cache_repo.set(cache_key, [s.dict() for s in stations], expire=settings.CACHE_TTL)
+            await self.cache_repo.set(cache_key, [s.to_dict() for s in stations], expire=settings.CACHE_TTL)
+        return stations
+
+    async def get_top_window(self, limit: int = 100, offset: int = 0) -> List[StationRecord]:
+        """A page of the top list. Pages past the first are cut from fixed-size cached chunks."""
+        if offset <= 0:
+            return await self.get_top_stations(limit)
+        return await self._chunk_window(self._get_top_chunk, limit, offset)
+
+    async def _get_top_chunk(self, index: int) -> List[StationRecord]:
+        # Like browse chunks: a deep page costs one upstream call, not a refetch of every station above it
+        cache_key = f"top_chunk{index}_v2"
+        cached = await self.cache_repo.get(cache_key)
+        if cached: return StationRecord.from_cached(cached)
+
+        chunk_size = settings.BROWSE_CHUNK_SIZE
+        stations = await self.radio_repo.get_top_stations(chunk_size, index * chunk_size)
+        if stations:
+            await self.cache_repo.set(cache_key, [s.to_dict() for s in stations], expire=settings.CACHE_TTL)
         return stations
 
     async def search_stations(
@@ -74,93 +146,413 @@ class StationService:
         tag: Optional[str] = None,
         limit: int = 100,
         offset: int = 0
-    ) -> List[Station]:
-        # We don't cache individual searches to avoid cache bloat, 
-        # but categories are cached in their respective repo/adapter logic if needed.
-        # However, for consistency with old behavior, we might cache browse-by-category.
+    ) -> List[StationRecord]:
+        # We don't cache individual searches to avoid cache bloat.
+        # Category browses are cached as ranked chunks keyed only by the filter
+        # tuple, so any limit/offset window is sliced locally from shared chunks.
         is_category_browse = (country or language or tag or countrycode) and not name
-        cache_key = f"browse_{country}_{countrycode}_{language}_{tag}_{limit}_{offset}" if is_category_browse else None
-        
-        if cache_key:
-            cached = self.cache_repo.get(cache_key)
-            if cached: return [Station(**s) for s in cached]
+        if is_category_browse:
+            return await self._browse_stations(country, countrycode, language, tag, limit, offset)
 
-        stations = await self.radio_repo.search_stations(name, country, countrycode, language, tag, limit, offset)
-        
-        if cache_key and stations:
-            self.cache_repo.set(cache_key, [s.dict() for s in stations], expire=86400) # 24h for browse
-            
+        return await self.radio_repo.search_stations(name, country, countrycode, language, tag, limit, offset)
+
+    async def _browse_stations(
+        self,
+        country: Optional[str],
+        countrycode: Optional[str],
+        language: Optional[str],
+        tag: Optional[str],
+        limit: int,
+        offset: int
+    ) -> List[StationRecord]:
+        if limit <= 0:
+            return []
+
+        filters = {"country": country, "countrycode": countrycode, "language": language, "tag": tag}
+        # Categories newer than the index still go upstream, on every page
+        if self.station_index is not None and self.station_index.covers(filters):
+            return [StationRecord.from_dict(s) for s in self.station_index.search(filters, limit, offset)]
+
+        return await self._chunk_window(
+            lambda index: self._get_browse_chunk(country, countrycode, language, tag, index), limit, offset
+        )
+
+    async def _chunk_window(
+        self, get_chunk: Callable[[int], Awaitable[List[StationRecord]]], limit: int, offset: int
+    ) -> List[StationRecord]:
+        """A limit/offset window sliced from the ranked chunks `get_chunk(index)` returns."""
+        if limit <= 0:
+            return []
+        chunk_size = settings.BROWSE_CHUNK_SIZE
+        first_chunk = offset // chunk_size
+        last_chunk = (offset + limit - 1) // chunk_size
+
+        stations = []
+        for index in range(first_chunk, last_chunk + 1):
+            chunk = await get_chunk(index)
+            stations.extend(chunk)
+            if len(chunk) < chunk_size:
+                break  # Reached the end of the results
+
+        start = offset - first_chunk * chunk_size
+        return stations[start:start + limit]
+
+    async def _get_search_chunk(
+        self,
+        name: Optional[str],
+        country: Optional[str],
+        countrycode: Optional[str],
+        language: Optional[str],
+        tag: Optional[str],
+        index: int
+    ) -> List[StationRecord]:
+        # Only cursor pages read these; the "search" family is admission-gated like browse
+        cache_key = f"search_{(name or '').lower()}_{country}_{countrycode}_{language}_{tag}_chunk{index}"
+        cached = await self.cache_repo.get(cache_key)
+        if cached: return StationRecord.from_cached(cached)
+
+        chunk_size = settings.BROWSE_CHUNK_SIZE
+        stations = await self.radio_repo.search_stations(
+            name, country, countrycode, language, tag, chunk_size, index * chunk_size
+        )
+        if stations:
+            await self.cache_repo.set(cache_key, [s.to_dict() for s in stations], expire=settings.SEARCH_CHUNK_TTL)
+        return stations
+
+    async def resume_search(
+        self,
+        cursor: StationCursor,
+        name: Optional[str] = None,
+        country: Optional[str] = None,
+        countrycode: Optional[str] = None,
+        language: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[StationRecord], int]:
+        """
+        The search page after `cursor`, read from cached ranked chunks, and
+        its offset in the ranked list. `limit=0` only resolves the offset.
+        """
+        if name or not (country or countrycode or language or tag):
+            async def window(size: int, offset: int) -> List[StationRecord]:
+                return await self._chunk_window(
+                    lambda index: self._get_search_chunk(name, country, countrycode, language, tag, index), size, offset
+                )
+        else:
+            async def window(size: int, offset: int) -> List[StationRecord]:
+                return await self._browse_stations(country, countrycode, language, tag, size, offset)
+        return await self._resume(cursor, window, "clickcount", limit)
+
+    async def resume_top_stations(self, cursor: StationCursor, limit: int = 100) -> Tuple[List[StationRecord], int]:
+        """Like resume_search() for the top list, which is ranked by votes."""
+        async def window(size: int, offset: int) -> List[StationRecord]:
+            return await self._chunk_window(self._get_top_chunk, size, offset)
+        return await self._resume(cursor, window, "votes", limit)
+
+    async def _resume(
+        self,
+        cursor: StationCursor,
+        window: Callable[[int, int], Awaitable[List[StationRecord]]],
+        sort_field: str,
+        limit: int
+    ) -> Tuple[List[StationRecord], int]:
+        # One window around the cursor re-synchronizes it and usually holds the whole page
+        slack = settings.CURSOR_RESYNC_WINDOW
+        start = max(0, cursor.position - slack)
+        size = cursor.position - start + slack + limit
+        stations = await window(size, start)
+        skip = resume_index(stations, cursor, sort_field, cursor.position - start)
+        page = stations[skip:skip + limit]
+        if len(page) < limit and len(stations) == size:
+            page += await window(limit - len(page), start + size)
+        return page, start + skip
+
+    async def stream_top_stations(self, limit: int = 100, offset: int = 0) -> AsyncIterator[StationRecord]:
+        """get_top_window() as a stream: every page, the first included, is yielded one cached chunk at a time."""
+        async for station in self._iter_chunks(self._get_top_chunk, limit, max(offset, 0)):
+            yield station
+
+    async def stream_stations(
+        self,
+        name: Optional[str] = None,
+        country: Optional[str] = None,
+        countrycode: Optional[str] = None,
+        language: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> AsyncIterator[StationRecord]:
+        """
+        search_stations() for NDJSON responses: stations are yielded as soon as
+        they are decoded (from the index, one cached browse chunk at a time, or
+        straight off the upstream response), so no full result list is built.
+        """
+        if limit <= 0:
+            return
+        if name or not (country or countrycode or language or tag):
+            async for station in self.radio_repo.iter_search_stations(
+                name, country, countrycode, language, tag, limit, offset
+            ):
+                yield station
+            return
+
+        filters = {"country": country, "countrycode": countrycode, "language": language, "tag": tag}
+        if self.station_index is not None and self.station_index.covers(filters):
+            for row in self.station_index.iter_search(filters, limit, offset):
+                yield StationRecord.from_dict(row)
+            return
+
+        async for station in self._iter_chunks(
+            lambda index: self._get_browse_chunk(country, countrycode, language, tag, index), limit, offset
+        ):
+            yield station
+
+    async def _iter_chunks(
+        self, get_chunk: Callable[[int], Awaitable[List[StationRecord]]], limit: int, offset: int
+    ) -> AsyncIterator[StationRecord]:
+        """_chunk_window() as a stream: each chunk is fetched only once the previous one is sent."""
+        chunk_size = settings.BROWSE_CHUNK_SIZE
+        index, start, remaining = offset // chunk_size, offset % chunk_size, limit
+        while remaining > 0:
+            chunk = await get_chunk(index)
+            for station in chunk[start:start + remaining]:
+                remaining -= 1
+                yield station
+            if len(chunk) < chunk_size:
+                return  # Reached the end of the results
+            index, start = index + 1, 0
+
+    async def _get_browse_chunk(
+        self,
+        country: Optional[str],
+        countrycode: Optional[str],
+        language: Optional[str],
+        tag: Optional[str],
+        index: int
+    ) -> List[StationRecord]:
+        cache_key = f"browse_{country}_{countrycode}_{language}_{tag}_chunk{index}"
+        cached = await self.cache_repo.get(cache_key)
+        if cached: return StationRecord.from_cached(cached)
+
+        bundled = self._from_snapshot(
+            cache_key, lambda: self._load_browse_chunk(cache_key, country, countrycode, language, tag, index)
+        )
+        if bundled: return StationRecord.from_cached(bundled)
+        return await self._load_browse_chunk(cache_key, country, countrycode, language, tag, index)
+
+    async def _load_browse_chunk(
+        self,
+        cache_key: str,
+        country: Optional[str],
+        countrycode: Optional[str],
+        language: Optional[str],
+        tag: Optional[str],
+        index: int
+    ) -> List[StationRecord]:
+        chunk_size = settings.BROWSE_CHUNK_SIZE
+        stations = await self.radio_repo.search_stations(
+            None, country, countrycode, language, tag, chunk_size, index * chunk_size
+        )
+        if stations:
+            await self.cache_repo.set(cache_key, [s.to_dict() for s in stations], expire=86400) # 24h for browse
         return stations
 
     async def get_countries(self, limit: int = 24, offset: int = 0, name: str = None) -> List[Category]:
+        indexed = self._indexed_categories("country", limit, offset, name)
+        if indexed:
+            return indexed
+
         cache_key = f"countries_{limit}_{offset}_{name or 'all'}"
-        cached = self.cache_repo.get(cache_key)
+        cached = await self.cache_repo.get(cache_key)
         
         if cached:
             return [Category(**c) for c in cached]
 
-        countries = await self.radio_repo.get_countries(limit=limit, offset=offset, name=name)
-        if countries:
-            self.cache_repo.set(cache_key, [c.dict() for c in countries], expire=86400) # 24h
-            
-        return countries
+        load = lambda: self._load_categories(cache_key, self.radio_repo.get_countries(limit=limit, offset=offset, name=name))
+        bundled = self._from_snapshot(cache_key, load)
+        if bundled:
+            return [Category(**c) for c in bundled]
+        return await load()
 
     async def get_languages(self, limit: int = 24, offset: int = 0, name: str = None) -> List[Category]:
+        indexed = self._indexed_categories("language", limit, offset, name)
+        if indexed:
+            return indexed
+
         cache_key = f"languages_{limit}_{offset}_{name or 'all'}"
-        cached = self.cache_repo.get(cache_key)
+        cached = await self.cache_repo.get(cache_key)
         
         if cached:
             return [Category(**l) for l in cached]
 
-        languages = await self.radio_repo.get_languages(limit=limit, offset=offset, name=name)
-        if languages:
-            self.cache_repo.set(cache_key, [l.dict() for l in languages], expire=86400)
-            
-        return languages
+        load = lambda: self._load_categories(cache_key, self.radio_repo.get_languages(limit=limit, offset=offset, name=name))
+        bundled = self._from_snapshot(cache_key, load)
+        if bundled:
+            return [Category(**l) for l in bundled]
+        return await load()
 
     async def get_tags(self, limit: int = 24, offset: int = 0, name: str = None) -> List[Category]:
+        indexed = self._indexed_categories("tag", limit, offset, name)
+        if indexed:
+            return indexed
+
         cache_key = f"tags_{limit}_{offset}_{name or 'all'}"
-        cached = self.cache_repo.get(cache_key)
+        cached = await self.cache_repo.get(cache_key)
         
         if cached:
             return [Category(**t) for t in cached]
 
-        tags = await self.radio_repo.get_tags(limit=limit, offset=offset, name=name)
-        if tags:
-            self.cache_repo.set(cache_key, [t.dict() for t in tags], expire=86400)
-            
-        return tags
+        load = lambda: self._load_categories(cache_key, self.radio_repo.get_tags(limit=limit, offset=offset, name=name))
+        bundled = self._from_snapshot(cache_key, load)
+        if bundled:
+            return [Category(**t) for t in bundled]
+        return await load()
+
+    def _indexed_categories(self, field: str, limit: int, offset: int, name: Optional[str]) -> List[Category]:
+        if self.station_index is None:
+            return []
+        return [
+            Category(name=category, stationcount=count)
+            for category, count in self.station_index.categories(field, limit, offset, name)
+        ]
+
+    async def _load_categories(self, cache_key: str, fetch: Awaitable[List[Category]]) -> List[Category]:
+        categories = await fetch
+        if categories:
+            await self.cache_repo.set(cache_key, [c.dict() for c in categories], expire=86400) # 24h
+        return categories
 
-    async def search_global(self, query: str) -> GlobalSearchResult:
+    async def search_global(self, query: str, client_id: Optional[str] = None) -> GlobalSearchResult:
         if not query or len(query) < 2:
             return GlobalSearchResult(countries=[], languages=[], tags=[], stations=[])
 
+        self._schedule_autocomplete_build()
+        if self.autocomplete is not None:
+            found = self.autocomplete.suggest(query, {"country": 4, "language": 4, "tag": 4, "station": 20})
+            # Queries matching no indexed station (e.g. a rarely played one) still go upstream
+            if found["station"]:
+                return GlobalSearchResult(
+                    countries=found["country"],
+                    languages=found["language"],
+                    tags=found["tag"],
+                    stations=[s.to_dict() for s in found["station"]]
+                )
+
+        # A newer query from the same client cancels this one (raising Superseded)
+        return await self.global_search_gate.run(client_id, lambda: self._search_global_upstream(query))
+
+    async def _search_global_upstream(self, query: str) -> GlobalSearchResult:
+        key = query.strip().casefold()
+        results = self._reuse_global_results(key)
+        fetch = {
+            "countries": lambda: self.get_countries(limit=4, name=query),
+            "languages": lambda: self.get_languages(limit=4, name=query),
+            "tags": lambda: self.get_tags(limit=4, name=query),
+            "stations": lambda: self.search_stations(name=query, limit=20),
+        }
+        missing = [kind for kind in fetch if kind not in results]
+
         # Execute searches in parallel
-        countries_task = self.get_countries(limit=4, name=query)
-        languages_task = self.get_languages(limit=4, name=query)
-        tags_task = self.get_tags(limit=4, name=query)
-        stations_task = self.search_stations(name=query, limit=20)
+        fetched = await asyncio.gather(*(fetch[kind]() for kind in missing))
+        results.update(zip(missing, fetched))
+        self._remember_global_results(key, results)
 
-        countries, languages, tags, stations = await asyncio.gather(
-            countries_task, languages_task, tags_task, stations_task
+        return GlobalSearchResult(
+            countries=results["countries"],
+            languages=results["languages"],
+            tags=results["tags"],
+            stations=[s.to_dict() for s in results["stations"]]
         )
 
-        return GlobalSearchResult(
-            countries=countries,
-            languages=languages,
-            tags=tags,
-            stations=stations
+    def _reuse_global_results(self, key: str) -> Dict[str, list]:
+        """
+        Result lists of an earlier query that `key` extends (e.g. "rad" for
+        "radi"). Upstream matches names by substring, so a list that held every
+        match of the shorter query (fewer than its limit) is exact once
+        filtered. Empty lists are not reused: they may be a failed call.
+        """
+        now = time.monotonic()
+        reused: Dict[str, list] = {}
+        for end in range(len(key), 1, -1):
+            entry = self._global_results.get(key[:end])
+            if entry is None or now - entry[0] > settings.GLOBAL_SEARCH_REUSE_TTL:
+                continue
+            for kind, items in entry[1].items():
+                if kind not in reused and 0 < len(items) < self.GLOBAL_SEARCH_LIMITS[kind]:
+                    reused[kind] = [item for item in items if key in item.name.casefold()]
+        return reused
+
+    def _remember_global_results(self, key: str, results: Dict[str, list]):
+        self._global_results[key] = (time.monotonic(), results)
+        self._global_results.move_to_end(key)
+        while len(self._global_results) > self.GLOBAL_SEARCH_REMEMBERED:
+            self._global_results.popitem(last=False)
+
+    def _schedule_autocomplete_build(self):
+        if self._autocomplete_task is not None and not self._autocomplete_task.done():
+            return
+        now = time.monotonic()
+        if self.autocomplete is not None and now - self.autocomplete.built_at < settings.AUTOCOMPLETE_REFRESH_INTERVAL:
+            return
+        # A failed build is retried soon rather than on the next refresh
+        if now < self._autocomplete_retry_at:
+            return
+        self._autocomplete_retry_at = now + settings.AUTOCOMPLETE_RETRY_INTERVAL
+        self._autocomplete_task = asyncio.get_running_loop().create_task(self.build_autocomplete())
+        self._autocomplete_task.add_done_callback(self._log_autocomplete_failure)
+
+    @staticmethod
+    def _log_autocomplete_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            print(f"Error building autocomplete index: {task.exception()}")
+
+    async def build_autocomplete(self) -> AutocompleteIndex:
+        """
+        Index the most popular stations and all known categories; lookups go
+        through the caches. Raises RuntimeError when no stations could be read.
+        """
+        limit = settings.AUTOCOMPLETE_MAX_STATIONS
+        stations = []
+        if self.station_index is not None:
+            stations = await asyncio.to_thread(
+                lambda: [StationRecord.from_dict(s) for s in self.station_index.ranked(limit)]
+            )
+        if not stations:
+            stations = await self.get_top_stations(limit)
+        if not stations:
+            # Radio Browser errors come back as empty lists: keep the previous index
+            raise RuntimeError("no stations to index")
+        countries, languages, tags = await asyncio.gather(
+            self.get_countries(limit=1000), self.get_languages(limit=1000), self.get_tags(limit=1000)
         )
 
+        entries = {
+            "station": [(s.name, (s.clickcount or 0) + (s.votes or 0), s) for s in stations],
+            "country": [(c.name, c.stationcount, c) for c in countries],
+            "language": [(c.name, c.stationcount, c) for c in languages],
+            "tag": [(c.name, c.stationcount, c) for c in tags],
+        }
+        # Tokenizing thousands of names would stall the event loop
+        self.autocomplete = await asyncio.to_thread(AutocompleteIndex, entries)
+        return self.autocomplete
+
     async def get_summary_stats(self) -> SummaryStats:
         cache_key = "summary_stats"
-        cached = self.cache_repo.get(cache_key)
+        cached = await self.cache_repo.get(cache_key)
         if cached: return SummaryStats(**cached)
 
+        bundled = self._from_snapshot(cache_key, lambda: self._load_summary_stats(cache_key))
+        if bundled: return SummaryStats(**bundled)
+        return SummaryStats(**await self._load_summary_stats(cache_key))
+
+    async def _load_summary_stats(self, cache_key: str) -> dict:
         stats = await self.radio_repo.get_summary_stats()
         if stats:
-            self.cache_repo.set(cache_key, stats, expire=settings.CACHE_TTL)
-        return SummaryStats(**stats)
+            await self.cache_repo.set(cache_key, stats, expire=settings.CACHE_TTL)
+        return stats
+
+    async def flush_cache(self):
+        await self.cache_repo.clear()
 
-    def flush_cache(self):
-        self.cache_repo.clear()
+    def get_cache_stats(self) -> dict:
+        return self.cache_repo.stats()
@@ -0,0 +1,189 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import weakref
+from datetime import datetime
+from typing import Dict, Optional
+from xml.sax.saxutils import escape
+import jinja2
+from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.content import render_markdown
+from app.models.blog import BlogPost
+from app.application.blog import list_post_summaries
+
+try:
+    import brotli
+except ImportError:  # Optional: only .gz variants are written without it
+    brotli = None
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+DEFAULT_LANDING_DIR = os.path.join(PROJECT_ROOT, "landing")
+
+COMPRESSIBLE = (".html", ".css", ".js", ".xml", ".svg", ".json", ".txt")
+MANIFEST_NAME = ".export-manifest.json"
+
+class StaticSiteExporter:
+    """
+    Renders the landing page, the blog index (BLOG_PAGE_SIZE posts per page,
+    like the SSR site) and every published post into a directory any static
+    file server or CDN can serve:
+
+        index.html, blog/index.html, blog/page/<n>/index.html,
+        blog/<slug>/index.html, static/... (landing assets), sitemap.xml
+
+    Each file gets precompressed .gz (and .br) siblings. A manifest of
+    content hashes makes re-runs incremental: unchanged files are not
+    rewritten and pages of deleted posts are removed.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        landing_dir: str = DEFAULT_LANDING_DIR,
+        site_url: str = settings.SITE_URL,
+        page_size: int = settings.BLOG_PAGE_SIZE
+    ):
+        self.output_dir = output_dir
+        self.landing_dir = landing_dir
+        self.site_url = site_url.rstrip("/")
+        self.page_size = page_size
+        self.env = jinja2.Environment(loader=jinja2.FileSystemLoader(landing_dir), autoescape=True)
+        self.env.globals["url_for"] = self._url_for
+        self.env.filters["markdown"] = render_markdown
+
+    @staticmethod
+    def _url_for(name: str, path: str = "", **_) -> str:
+        return f"/static/{path}" if name == "static" else "/"
+
+    async def export(self, db: AsyncSession) -> Dict[str, int]:
+        files: Dict[str, bytes] = {}
+
+        recent, _ = await list_post_summaries(db, limit=3)
+        files["index.html"] = self._render("index.html", posts=recent)
+
+        # The same pages as /blog and its cursors, with static links between them
+        page, cursor = 1, None
+        while True:
+            summaries, cursor = await list_post_summaries(db, limit=self.page_size, cursor=cursor)
+            next_url = f"/blog/page/{page + 1}/" if cursor else None
+            files[self._blog_page(page)] = self._render("blog.html", posts=summaries, next_cursor=cursor, next_url=next_url)
+            if not cursor:
+                break
+            page += 1
+
+        result = await db.execute(
+            select(BlogPost).where(BlogPost.is_published == True).order_by(desc(BlogPost.created_at))
+        )
+        posts = result.scalars().all()
+        for post in posts:
+            files[f"blog/{post.slug}/index.html"] = self._render(
+                "post.html", post=post, title=post.seo_title or post.title, description=post.meta_description
+            )
+
+        files.update(self._static_assets())
+        files["sitemap.xml"] = self._sitemap(posts)
+        return self._write(files)
+
+    @staticmethod
+    def _blog_page(number: int) -> str:
+        return "blog/index.html" if number == 1 else f"blog/page/{number}/index.html"
+
+    def _render(self, template: str, **context) -> bytes:
+        return self.env.get_template(template).render(**context).encode("utf-8")
+
+    def _static_assets(self) -> Dict[str, bytes]:
+        assets = {}
+        for root, _, names in os.walk(self.landing_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, self.landing_dir).replace(os.sep, "/")
+                # Templates are rendered above, not copied
+                if name.endswith(".html") or name.startswith("."):
+                    continue
+                with open(path, "rb") as f:
+                    assets[f"static/{rel}"] = f.read()
+        return assets
+
+    def _sitemap(self, posts) -> bytes:
+        entries = [(f"{self.site_url}/", None), (f"{self.site_url}/blog", None)]
+        for post in posts:
+            modified = post.updated_at or post.created_at
+            entries.append((f"{self.site_url}/blog/{post.slug}", modified))
+
+        lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+        for loc, modified in entries:
+            lastmod = f"<lastmod>{modified.date().isoformat()}</lastmod>" if isinstance(modified, datetime) else ""
+            lines.append(f"  <url><loc>{escape(loc)}</loc>{lastmod}</url>")
+        lines.append("</urlset>")
+        return "\n".join(lines).encode("utf-8")
+
+    def _write(self, files: Dict[str, bytes]) -> Dict[str, int]:
+        manifest_path = os.path.join(self.output_dir, MANIFEST_NAME)
+        try:
+            with open(manifest_path) as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+
+        current, written = {}, 0
+        for rel, content in files.items():
+            digest = hashlib.sha256(content).hexdigest()
+            current[rel] = digest
+            target = os.path.join(self.output_dir, rel)
+            if previous.get(rel) == digest and os.path.exists(target):
+                continue
+            self._write_file(target, content)
+            written += 1
+
+        removed = 0
+        for rel in set(previous) - set(current):
+            for suffix in ("", ".gz", ".br"):
+                try:
+                    os.remove(os.path.join(self.output_dir, rel + suffix))
+                except FileNotFoundError:
+                    pass
+            removed += 1
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(current, f, indent=0, sort_keys=True)
+        return {"files": len(current), "written": written, "removed": removed}
+
+    @staticmethod
+    def _write_file(target: str, content: bytes):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        variants = [("", content)]
+        if target.endswith(COMPRESSIBLE):
+            variants.append((".gz", gzip.compress(content, compresslevel=9, mtime=0)))
+            if brotli:
+                variants.append((".br", brotli.compress(content)))
+        for suffix, data in variants:
+            # Write-then-rename so a static server never sees a partial file
+            tmp = f"{target}{suffix}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target + suffix)
+
+_export_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+def _export_lock() -> asyncio.Lock:
+    # asyncio primitives are bound to one loop; tests and reloads may create several
+    loop = asyncio.get_running_loop()
+    lock = _export_locks.get(loop)
+    if lock is None:
+        lock = _export_locks[loop] = asyncio.Lock()
+    return lock
+
+async def export_static_site(output_dir: Optional[str] = None) -> Dict[str, int]:
+    from app.core.database import AsyncSessionLocal
+
+    output_dir = output_dir or settings.STATIC_EXPORT_DIR
+    async with _export_lock():
+        async with AsyncSessionLocal() as db:
+            report = await StaticSiteExporter(output_dir).export(db)
+    print(f"Static export to {output_dir}: {report}")
+    return report
@@ -0,0 +1,79 @@
+from typing import Iterable, Optional
+from urllib.parse import quote
+import httpx
+from fastapi import Response
+from app.core.config import settings
+
+class CachePolicy:
+    """
+    Cache-Control for one kind of public response. `max_age` applies to
+    browsers, `shared_max_age` (s-maxage) to the CDN in front of the API,
+    which is purged by surrogate key when the underlying data changes.
+    """
+
+    def __init__(self, max_age: int, shared_max_age: int, stale_while_revalidate: int = 0, stale_if_error: int = 0):
+        self.max_age = max_age
+        self.shared_max_age = shared_max_age
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+
+    def header(self) -> str:
+        parts = ["public", f"max-age={self.max_age}", f"s-maxage={self.shared_max_age}"]
+        if self.stale_while_revalidate:
+            parts.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        if self.stale_if_error:
+            parts.append(f"stale-if-error={self.stale_if_error}")
+        return ", ".join(parts)
+
+# Featured, top and stats: cached by StationService for CACHE_TTL
+STATION_LISTS = CachePolicy(max_age=300, shared_max_age=settings.CACHE_TTL, stale_while_revalidate=3600, stale_if_error=86400)
+# Browse results and category pages: StationService keeps those chunks for 24h
+STATION_BROWSE = CachePolicy(max_age=300, shared_max_age=86400, stale_while_revalidate=3600, stale_if_error=86400)
+# Name searches are not cached by StationService; keep them short
+STATION_SEARCH = CachePolicy(max_age=60, shared_max_age=600, stale_while_revalidate=60, stale_if_error=3600)
+# Updater manifest: re-checked against GitHub every RELEASE_REFRESH_INTERVAL, purged by the release webhook
+RELEASE_MANIFEST = CachePolicy(
+    max_age=60,
+    shared_max_age=settings.RELEASE_REFRESH_INTERVAL,
+    stale_while_revalidate=settings.RELEASE_REFRESH_INTERVAL,
+    stale_if_error=86400
+)
+# Landing page, SSR blog and the public blog API, purged on every blog write
+SITE_PAGES = CachePolicy(max_age=0, shared_max_age=settings.SSR_CACHE_TTL, stale_while_revalidate=60, stale_if_error=86400)
+
+# Landing page, SSR blog pages and the public blog API all carry this key
+BLOG_KEY = "blog"
+
+def surrogate_key(*parts: str) -> str:
+    """A header-safe surrogate key such as "browse:country:united%20states"."""
+    return ":".join(quote(str(part).strip().lower(), safe="") for part in parts)
+
+def set_cache_headers(response: Response, policy: CachePolicy, keys: Iterable[str]):
+    response.headers["Cache-Control"] = policy.header()
+    response.headers["Surrogate-Key"] = " ".join(keys)
+
+def set_no_store(response: Response):
+    response.headers["Cache-Control"] = "no-store"
+
+class CdnPurger:
+    """
+    Purges CDN objects by surrogate key by POSTing {"surrogate_keys": [...]}
+    to CDN_PURGE_URL (e.g. a small worker in front of the CDN's purge API).
+    Does nothing when no URL is configured; failures are logged, never raised.
+    """
+
+    def __init__(self, url: str = "", token: str = "", transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.url = url
+        self.token = token
+        self.transport = transport
+
+    async def purge(self, keys: Iterable[str]):
+        if not self.url:
+            return
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        try:
+            async with httpx.AsyncClient(timeout=10.0, transport=self.transport) as client:
+                response = await client.post(self.url, json={"surrogate_keys": list(keys)}, headers=headers)
+                response.raise_for_status()
+        except Exception as e:
+            print(f"Error in CdnPurger.purge: {e}")
@@ -0,0 +1,63 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+class Superseded(Exception):
+    """A newer call from the same client took this call's place."""
+
+class ClientGate:
+    """
+    Runs at most `max_concurrent` calls per client. A call arriving while its
+    client is at the limit cancels that client's oldest call, whose caller
+    gets Superseded. Each call first waits `debounce` seconds, so a burst of
+    keystrokes is collapsed before any upstream request is made.
+
+    Calls without a client id are run directly.
+    """
+
+    def __init__(self, max_concurrent: int = 1, debounce: float = 0.0):
+        self.max_concurrent = max(1, max_concurrent)
+        self.debounce = debounce
+        self._running: Dict[str, List[asyncio.Task]] = {}
+        self._superseded: Set[asyncio.Task] = set()
+        self.superseded_total = 0
+
+    async def run(self, client: Optional[str], work: Callable[[], Awaitable[T]]) -> T:
+        if not client:
+            return await work()
+
+        running = self._running.setdefault(client, [])
+        while len(running) >= self.max_concurrent:
+            oldest = running.pop(0)
+            self._superseded.add(oldest)
+            self.superseded_total += 1
+            oldest.cancel()
+
+        task = asyncio.get_running_loop().create_task(self._start(work))
+        running.append(task)
+        try:
+            # Cancelling the caller (e.g. on disconnect) cancels the task too
+            return await task
+        except asyncio.CancelledError:
+            if task in self._superseded:
+                raise Superseded() from None
+            raise
+        finally:
+            self._superseded.discard(task)
+            if task in running:
+                running.remove(task)
+            if not running and self._running.get(client) is running:
+                del self._running[client]
+
+    async def _start(self, work: Callable[[], Awaitable[T]]) -> T:
+        if self.debounce:
+            await asyncio.sleep(self.debounce)
+        return await work()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "clients": len(self._running),
+            "in_flight": sum(len(tasks) for tasks in self._running.values()),
+            "superseded": self.superseded_total,
+        }
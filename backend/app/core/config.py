@@ -3,15 +3,61 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Radiolite"
     API_V1_STR: str = "/api/v1"
+    # "full" serves the website and admin API; "sidecar" is the desktop app's
+    # bundled backend and only mounts stations, releases and health
+    APP_PROFILE: str = "full"
+    SIDECAR_ANALYTICS: bool = False  # Let the sidecar record analytics (needs the database)
     
     RADIO_BROWSER_URL: str = "https://de1.api.radio-browser.info/json"
     CACHE_MAX_SIZE: int = 100
     CACHE_TTL: int = 86400  # 24 hours
+    BROWSE_CACHE_MAX_ENTRIES: int = 2000
+    BROWSE_CHUNK_SIZE: int = 250  # Stations fetched per upstream browse call
+    SEARCH_CHUNK_TTL: int = 600  # Seconds name-search chunks read by cursor pages are cached
+    CURSOR_RESYNC_WINDOW: int = 50  # Stations around a cursor searched for its station when rankings shift
+    CURSOR_MAX_POSITION: int = 10000  # Deepest ranked position a station cursor may point at
+    AUTOCOMPLETE_MAX_STATIONS: int = 5000  # Most popular stations indexed for global-search type-ahead
+    AUTOCOMPLETE_REFRESH_INTERVAL: int = 21600  # Seconds between background rebuilds of the type-ahead index
+    AUTOCOMPLETE_RETRY_INTERVAL: int = 60  # Seconds before retrying a type-ahead build that found no stations
+    GLOBAL_SEARCH_PER_CLIENT: int = 1  # Upstream global searches in flight per X-Client-Id; newer ones cancel older
+    GLOBAL_SEARCH_DEBOUNCE: float = 0.1  # Seconds a client's upstream global search waits for a newer keystroke
+    GLOBAL_SEARCH_REUSE_TTL: int = 300  # Seconds complete upstream results answer longer queries they are a prefix of
+    CACHE_IO_WORKERS: int = 4
+    CACHE_IO_MAX_PENDING: int = 64
+
+    # "disk" keeps a per-process cache; "redis" shares one cache across workers
+    CACHE_BACKEND: str = "disk"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_NAMESPACE: str = "radiolite"
+    CACHE_GENERATION_TTL: float = 1.0  # Seconds before a worker re-checks for flushes
+
+    # Bundled offline snapshot (built by build_snapshot.py); empty = app/data/station_snapshot.bin if present
+    STATION_SNAPSHOT_PATH: str = ""
+    SNAPSHOT_RETRY_INTERVAL: int = 60  # Seconds between live refresh attempts for a snapshot-served key
+    # Memory-mapped station catalog (built by build_station_index.py); empty = app/data/station_index.bin if present
+    STATION_INDEX_PATH: str = ""
+
+    BLOG_PAGE_SIZE: int = 12
+    SITE_URL: str = "https://radiolite.onrender.com"
+    STATIC_EXPORT_DIR: str = ""  # When set, blog writes re-export the static site here
+    SSR_CACHE_TTL: int = 300  # Max age of cached landing/blog HTML on workers that missed a write
+    SSR_CACHE_MAX_PAGES: int = 256  # Rendered landing/blog pages kept per worker (least recently used dropped)
+    CACHE_ADMISSION_THRESHOLD: int = 2  # Requests seen before a browse key is cached (disk backend only)
+    COMPRESSION_MIN_SIZE: int = 1024  # Station API responses smaller than this are sent uncompressed
+    CDN_PURGE_URL: str = ""  # POSTed {"surrogate_keys": [...]} on cache flushes and blog/release changes (empty = off)
+    CDN_PURGE_TOKEN: str = ""  # Sent as a Bearer token to CDN_PURGE_URL
     
     GITHUB_TOKEN: str = ""
     GITHUB_REPO: str = ""
+    GITHUB_WEBHOOK_SECRET: str = ""
+    RELEASE_REFRESH_INTERVAL: int = 300  # Seconds between GitHub release checks
+    RELEASE_REDIRECT_REFRESH_MARGIN: int = 30  # Re-sign download URLs this long before expiry
+    RELEASE_REDIRECT_FALLBACK_TTL: int = 60  # For signed URLs without a readable expiry
 
     DATABASE_URL: str = "sqlite+aiosqlite:///./radiolite.db"
+    # "auto" runs create_all only when the models changed since the last sync,
+    # "always" runs it on every boot, "never" leaves the schema to migrations
+    DB_SCHEMA_SYNC: str = "auto"
     
     # Auth - Defaults are for local dev only. MUST be overridden in production.
     ADMIN_USERNAME: str = "admin"
@@ -19,6 +65,9 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "unsafe-local-secret-key-change-me"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PRINCIPAL_CACHE_TTL: int = 60  # Seconds an authenticated token skips the user lookup (0 = off)
+    PASSWORD_HASH_WORKERS: int = 2  # Threads running bcrypt off the event loop
+    PASSWORD_HASH_MAX_PENDING: int = 16  # Hash/verify operations queued before callers wait
 
     class Config:
         case_sensitive = True
@@ -0,0 +1,36 @@
+import html
+import math
+import re
+import markdown
+
+MARKDOWN_EXTENSIONS = ['fenced_code', 'tables']
+EXCERPT_LENGTH = 150
+WORDS_PER_MINUTE = 200
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+def render_markdown(text: str) -> str:
+    if not text:
+        return ""
+    return markdown.markdown(text, extensions=MARKDOWN_EXTENSIONS)
+
+def plain_text(rendered_html: str) -> str:
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", rendered_html))).strip()
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:") + "…"
+
+def reading_time(text: str) -> int:
+    """Estimated reading time in whole minutes (at least 1)."""
+    return max(1, math.ceil(len(text.split()) / WORDS_PER_MINUTE))
+
+def compile_post(post) -> None:
+    """Render a post's Markdown once at write time so page views don't have to."""
+    post.content_html = render_markdown(post.content)
+    text = plain_text(post.content_html)
+    post.excerpt = make_excerpt(text)
+    post.reading_time = reading_time(text)
@@ -1,8 +1,13 @@
+import hashlib
 import logging
+import time
+from contextlib import contextmanager
+from typing import Dict
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
-from sqlalchemy import text, select
+from sqlalchemy import text, select, inspect, delete, Table, Column, Integer, String
+from app.core.metrics import metrics
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -40,71 +45,131 @@ try:
     from app.models.admin_user import AdminUser, UserRole
     from app.models.blog import BlogPost
     from app.models.analytics import DailyStats, DailyStationStats, DailyCountryStats, UserActivity
-    from app.core.security import get_password_hash
+    from app.core.security import get_password_hash_async, verify_password_async, principal_cache
 except ImportError as e:
     logger.error(f"Failed to import models: {e}")
 
-logger.info(f"Registered tables in Metadata: {list(Base.metadata.tables.keys())}")
+# Records which model schema the database was last synced against
+schema_version = Table(
+    "schema_version", Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+)
+
+startup_report: Dict[str, any] = {}
+metrics.register("startup", lambda: dict(startup_report))
+
+@contextmanager
+def _phase(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_report[f"{name}_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+def schema_fingerprint() -> str:
+    """Hash of every table and column the models declare; changes whenever a model does."""
+    parts = []
+    for table in Base.metadata.sorted_tables:
+        if table is schema_version:
+            continue
+        columns = ",".join(f"{c.name}:{type(c.type).__name__}:{int(c.nullable)}" for c in table.columns)
+        parts.append(f"{table.name}({columns})")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+def add_missing_columns(sync_conn):
+    """
+    create_all never alters existing tables, so add nullable columns that were
+    introduced after a table was first created (e.g. blog_posts.content_html).
+    """
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in present or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            logger.info(f"Adding missing column {table.name}.{column.name} ({column_type})")
+            sync_conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
 
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
-async def init_db():
-    logger.info("Starting database initialization...")
-    
-    # 1. Force registration of models (redundant but safe)
-    from app.models.admin_user import AdminUser
-    from app.models.blog import BlogPost
-    from app.models.analytics import DailyStats, DailyStationStats, DailyCountryStats
-    
-    # PHASE 1: Schema Creation
+async def _stored_fingerprint():
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(select(schema_version.c.fingerprint).where(schema_version.c.id == 1))
+            return result.scalar_one_or_none()
+    except Exception:
+        # Fresh database: the marker table does not exist yet
+        return None
+
+async def sync_schema() -> str:
+    """
+    Create missing tables and columns, unless the stored fingerprint shows
+    the database already matches the models (DB_SCHEMA_SYNC=auto).
+    Returns what was done: "synced", "current" or "skipped".
+    """
+    mode = settings.DB_SCHEMA_SYNC
+    if mode == "never":
+        return "skipped"
+
+    fingerprint = schema_fingerprint()
+    if mode != "always" and await _stored_fingerprint() == fingerprint:
+        return "current"
+
     async with engine.begin() as conn:
-        # A. Diagnostic Check for logs
-        try:
-            diag = await conn.execute(text("SELECT tablename FROM pg_catalog.pg_tables WHERE schemaname = 'public'"))
-            existing = [row[0] for row in diag.fetchall()]
-            logger.info(f"Public tables at start: {existing}")
-        except: pass
-
-        # B. Run Create All
         logger.info("Syncing schema (Base.metadata.create_all)...")
         await conn.run_sync(Base.metadata.create_all)
-        
-        # C. Reachability Check
-        try:
-            await conn.execute(text("SELECT 1 FROM blog_posts LIMIT 1"))
-            logger.info("✓ Schema Verified: 'blog_posts' is reachable in transaction")
-        except Exception as e:
-            logger.warning(f"⚠️ Reachability check note: {e}")
-            
-    logger.info("✓ Schema creation transaction committed")
-
-    # PHASE 2: Seeding (Separate Transaction)
+        await conn.run_sync(add_missing_columns)
+        await conn.execute(delete(schema_version))
+        await conn.execute(schema_version.insert().values(id=1, fingerprint=fingerprint))
+    return "synced"
+
+async def seed_superadmin() -> str:
     async with AsyncSessionLocal() as db:
-        try:
-            logger.info("Starting Seeding...")
-            # Check if any user exists
-            result = await db.execute(select(AdminUser).where(AdminUser.username == settings.ADMIN_USERNAME))
-            existing_admin = result.scalars().first()
-            
-            if not existing_admin:
-                logger.info(f"Seeding new superadmin: {settings.ADMIN_USERNAME}")
-                new_admin = AdminUser(
-                    username=settings.ADMIN_USERNAME,
-                    hashed_password=get_password_hash(settings.ADMIN_PASSWORD),
-                    role=UserRole.SUPERADMIN
-                )
-                db.add(new_admin)
-                await db.commit()
-                logger.info("✓ New superadmin seeded")
-            else:
-                logger.info(f"Superadmin '{settings.ADMIN_USERNAME}' exists. Updating password.")
-                existing_admin.hashed_password = get_password_hash(settings.ADMIN_PASSWORD)
-                await db.commit()
-                logger.info("✓ Superadmin updated")
-        except Exception as e:
-            logger.error(f"Error seeding database: {e}")
-            # Don't raise, let the app run since schema is good
-
-    logger.info("✓ Database initialization finished")
+        result = await db.execute(select(AdminUser).where(AdminUser.username == settings.ADMIN_USERNAME))
+        existing_admin = result.scalars().first()
+
+        if not existing_admin:
+            logger.info(f"Seeding new superadmin: {settings.ADMIN_USERNAME}")
+            db.add(AdminUser(
+                username=settings.ADMIN_USERNAME,
+                hashed_password=await get_password_hash_async(settings.ADMIN_PASSWORD),
+                role=UserRole.SUPERADMIN
+            ))
+            await db.commit()
+            return "created"
+
+        # Only pay for a new bcrypt hash when the configured password changed
+        if await verify_password_async(settings.ADMIN_PASSWORD, existing_admin.hashed_password):
+            return "unchanged"
+
+        logger.info(f"Superadmin '{settings.ADMIN_USERNAME}' password changed. Updating.")
+        existing_admin.hashed_password = await get_password_hash_async(settings.ADMIN_PASSWORD)
+        await db.commit()
+        principal_cache.invalidate_user(existing_admin.username)
+        return "updated"
+
+async def init_db():
+    with _phase("init_db"):
+        with _phase("schema"):
+            startup_report["schema"] = await sync_schema()
+
+        with _phase("seed"):
+            try:
+                startup_report["superadmin"] = await seed_superadmin()
+            except Exception as e:
+                logger.error(f"Error seeding database: {e}")
+                # Don't raise, let the app run since schema is good
+                startup_report["superadmin"] = "error"
+
+    logger.info(
+        f"✓ Database initialized in {startup_report['init_db_ms']}ms "
+        f"(schema {startup_report['schema']} in {startup_report['schema_ms']}ms, "
+        f"superadmin {startup_report['superadmin']} in {startup_report['seed_ms']}ms)"
+    )
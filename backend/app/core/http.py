@@ -0,0 +1,192 @@
+import asyncio
+import gzip
+import hashlib
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Optional, Tuple, TypeVar
+from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: responses are only gzip-compressed without it
+    brotli = None
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    ours = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == ours:
+            return True
+    return False
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == coding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+def choose_encoding(accept_encoding: Optional[str], available=("br", "gzip")) -> Optional[str]:
+    """Pick the first of `available` content codings the client accepts."""
+    if not accept_encoding:
+        return None
+    for coding in available:
+        if _accepts(accept_encoding, coding):
+            return coding
+    return None
+
+T = TypeVar("T")
+
+class ClientDisconnected(Exception):
+    """The client went away before the response was ready."""
+
+async def _wait_for_disconnect(request: Request):
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+async def cancel_on_disconnect(request: Request, work: Awaitable[T]) -> T:
+    """
+    Await `work`, cancelling it (and any upstream calls it is making) if the
+    client disconnects first, in which case ClientDisconnected is raised.
+    Only for endpoints that do not read the request body.
+    """
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        watcher.cancel()
+    if not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        raise ClientDisconnected()
+    return task.result()
+
+def page_response(page, request: Request) -> Response:
+    """Serve a RenderedPage with ETag/Last-Modified revalidation and precompressed bodies."""
+    available = ("br", "gzip") if page.br is not None else ("gzip",)
+    coding = choose_encoding(request.headers.get("accept-encoding"), available)
+    headers = {"ETag": page.etag_for(coding), "Last-Modified": page.last_modified, "Vary": "Accept-Encoding"}
+
+    # Any representation of the same page revalidates it, whichever coding it was fetched in
+    if_none_match = request.headers.get("if-none-match")
+    if any(etag_matches(if_none_match, page.etag_for(c)) for c in (None, "gzip", "br")):
+        return Response(status_code=304, headers=headers)
+    if not if_none_match:
+        since = request.headers.get("if-modified-since")
+        try:
+            if since and int(page.rendered_at) <= parsedate_to_datetime(since).timestamp():
+                return Response(status_code=304, headers=headers)
+        except (TypeError, ValueError):
+            pass
+
+    if coding:
+        headers["Content-Encoding"] = coding
+        body = page.br if coding == "br" else page.gzip
+    else:
+        body = page.body
+    return Response(content=body, media_type="text/html; charset=utf-8", headers=headers)
+
+class ConditionalResponseMiddleware:
+    """
+    Strong ETags, If-None-Match -> 304 and gzip/brotli compression for GET
+    responses under `path_prefix`.
+
+    Successful responses are buffered and tagged with a hash of their body,
+    so an unchanged cached payload always yields the same ETag. Bodies of
+    at least `minimum_size` bytes are compressed for clients that accept
+    it; each encoding gets its own ETag ("<hash>-br", "<hash>-gzip") and
+    recently compressed bodies are kept so repeat polls skip compression.
+    Streaming responses (NDJSON, server-sent events), errors and bodies
+    that are already encoded pass through untouched.
+    """
+
+    STREAMING_TYPES = ("application/x-ndjson", "text/event-stream")
+
+    def __init__(self, app: ASGIApp, path_prefix: str, minimum_size: int = 1024, compressed_cache_size: int = 256):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.minimum_size = minimum_size
+        self.compressed_cache_size = compressed_cache_size
+        self._compressed: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self.codings = ("br", "gzip") if brotli else ("gzip",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start: Optional[Message] = None
+        chunks = []
+        passthrough = False
+
+        async def buffered_send(message: Message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if message["status"] != 200 or "content-encoding" in headers or content_type.startswith(self.STREAMING_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+            if passthrough:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                await self._respond(start, b"".join(chunks), request_headers, send)
+
+        await self.app(scope, receive, buffered_send)
+
+    async def _respond(self, start: Message, body: bytes, request_headers: Headers, send: Send):
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        coding = None
+        if len(body) >= self.minimum_size:
+            coding = choose_encoding(request_headers.get("accept-encoding"), self.codings)
+        etag = f'"{digest}-{coding}"' if coding else f'"{digest}"'
+
+        headers = MutableHeaders(raw=[(k, v) for k, v in start["headers"] if k.lower() != b"content-length"])
+        headers["ETag"] = etag
+        headers.add_vary_header("Accept-Encoding")
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if coding:
+            body = self._compress(digest, coding, body)
+            headers["Content-Encoding"] = coding
+        headers["Content-Length"] = str(len(body))
+        await send({"type": "http.response.start", "status": start["status"], "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    def _compress(self, digest: str, coding: str, body: bytes) -> bytes:
+        key = (digest, coding)
+        compressed = self._compressed.get(key)
+        if compressed is not None:
+            self._compressed.move_to_end(key)
+            return compressed
+        if coding == "br":
+            compressed = brotli.compress(body, quality=5)
+        else:
+            compressed = gzip.compress(body, compresslevel=6, mtime=0)
+        self._compressed[key] = compressed
+        if len(self._compressed) > self.compressed_cache_size:
+            self._compressed.popitem(last=False)
+        return compressed
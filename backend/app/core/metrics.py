@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class LatencyRecorder:
+    """Keeps a rolling window of durations (seconds) and reports them in ms."""
+
+    def __init__(self, window: int = 1024):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        if not self.samples:
+            return {"count": self.count, "last_ms": 0.0, "mean_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {
+            "count": self.count,
+            "last_ms": round(self.samples[-1] * 1000, 3),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+            "p99_ms": round(p99 * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes a sleeping coroutine.
+    Any blocking call in a coroutine shows up directly as lag.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.lag = LatencyRecorder()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag.record(max(0.0, loop.time() - started - self.interval))
+
+    def snapshot(self) -> Dict[str, float]:
+        return self.lag.snapshot()
+
+class MetricsRegistry:
+    def __init__(self):
+        self._providers: Dict[str, Callable[[], Dict]] = {}
+
+    def register(self, name: str, provider: Callable[[], Dict]):
+        self._providers[name] = provider
+
+    def collect(self) -> Dict[str, Dict]:
+        report = {}
+        for name, provider in self._providers.items():
+            try:
+                report[name] = provider()
+            except Exception as e:
+                logger.warning(f"Metrics provider '{name}' failed: {e}")
+        return report
+
+def timed(recorder: LatencyRecorder):
+    """Context manager recording the elapsed wall time into `recorder`."""
+    class _Timer:
+        def __enter__(self):
+            self.started = time.perf_counter()
+            return self
+
+        def __exit__(self, *exc):
+            recorder.record(time.perf_counter() - self.started)
+            return False
+
+    return _Timer()
+
+metrics = MetricsRegistry()
+loop_lag_monitor = EventLoopLagMonitor()
+metrics.register("event_loop_lag", loop_lag_monitor.snapshot)
@@ -1,7 +1,12 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from jose import jwt
 from app.core.config import settings
+from app.core.metrics import LatencyRecorder, metrics, timed
 
 from passlib.context import CryptContext
 # Explicitly import the bcrypt handler to ensure it's bundled correctly on Windows/macOS
@@ -24,3 +29,106 @@ def verify_password(plain_password, hashed_password):
 
 def get_password_hash(password):
     return pwd_context.hash(password)
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool (bcrypt releases the GIL)
+    so a login or user creation never stalls the event loop. At most
+    `max_pending` operations are queued at once; further callers wait.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16):
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password")
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self.waiting = 0
+        self.hash_latency = LatencyRecorder()
+        self.verify_latency = LatencyRecorder()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+        return semaphore
+
+    async def _run(self, recorder: LatencyRecorder, func, *args):
+        self.waiting += 1
+        try:
+            async with self._semaphore():
+                with timed(recorder):
+                    return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.waiting -= 1
+
+    async def verify(self, plain_password, hashed_password) -> bool:
+        return await self._run(self.verify_latency, verify_password, plain_password, hashed_password)
+
+    async def hash(self, password) -> str:
+        return await self._run(self.hash_latency, get_password_hash, password)
+
+    def stats(self) -> Dict:
+        return {
+            "in_flight": self.waiting,
+            "hash": self.hash_latency.snapshot(),
+            "verify": self.verify_latency.snapshot(),
+        }
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
+metrics.register("password_hashing", password_hasher.stats)
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await password_hasher.hash(password)
+
+class PrincipalCache:
+    """
+    Short-lived token -> user cache so authenticated requests skip the
+    user lookup. Entries never outlive the token's own expiry, and are
+    dropped when the user is deleted or their credentials change.
+    """
+
+    def __init__(self, ttl: int, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[any, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[any]:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if time.time() >= expires_at:
+            self._entries.pop(token, None)
+            return None
+        return user
+
+    def put(self, token: str, user, token_expires_at: Optional[float] = None):
+        if self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.time()
+                self._entries = {t: e for t, e in self._entries.items() if e[1] > now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[token] = (user, expires_at)
+
+    def invalidate_user(self, username: str):
+        with self._lock:
+            self._entries = {t: e for t, e in self._entries.items() if e[0].username != username}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+principal_cache = PrincipalCache(ttl=settings.PRINCIPAL_CACHE_TTL)
@@ -1,8 +1,18 @@
 import os
+from app.core.config import settings
+from app.core.cdn import CdnPurger
+from app.core.metrics import metrics
 from app.domain.utils import LocationNormalizer
 from app.infrastructure.external.radio_browser import RadioBrowserAdapter
 from app.infrastructure.external.github import GitHubAdapter
 from app.infrastructure.persistence.disk_cache import DiskCacheAdapter
+from app.infrastructure.persistence.redis_cache import RedisCacheAdapter
+from app.infrastructure.persistence.codecs import StationListCodec
+from app.infrastructure.persistence.cache_policy import TinyLFUCacheAdapter
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.page_cache import RenderedPageCache
+from app.infrastructure.persistence.snapshot import StationSnapshot
+from app.infrastructure.persistence.station_index import StationIndex
 from app.application.services import StationService
 from app.application.releases import ReleaseService
 
@@ -15,14 +25,69 @@ mapper = RadioBrowserMapper(normalizer=normalizer)
 # 2. Infrastructure Layer (Adapters)
 radio_repo = RadioBrowserAdapter(mapper=mapper)
 
-# Cache directory configuration
+# Cache backend configuration
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 cache_dir = os.path.join(project_root, ".cache")
-cache_repo = DiskCacheAdapter(cache_dir=cache_dir)
+if settings.CACHE_BACKEND == "redis":
+    storage = RedisCacheAdapter(
+        url=settings.REDIS_URL,
+        namespace=settings.CACHE_NAMESPACE,
+        default_ttl=settings.CACHE_TTL,
+        generation_ttl=settings.CACHE_GENERATION_TTL,
+        codec=StationListCodec()
+    )
+else:
+    storage = DiskCacheAdapter(cache_dir=cache_dir, codec=StationListCodec())
+
+if settings.CACHE_BACKEND == "redis":
+    # Shared by every worker: a per-process admission policy would evict the others'
+    # entries, so Redis' own maxmemory policy bounds the cache instead
+    policy = storage
+else:
+    policy = TinyLFUCacheAdapter(
+        backend=storage,
+        capacity=settings.BROWSE_CACHE_MAX_ENTRIES,
+        gated_families=("browse", "search"),
+        admission_threshold=settings.CACHE_ADMISSION_THRESHOLD
+    )
+
+cache_repo = AsyncCacheAdapter(
+    backend=policy,
+    max_workers=settings.CACHE_IO_WORKERS,
+    max_pending=settings.CACHE_IO_MAX_PENDING
+)
+
+# Rendered landing/blog HTML
+page_cache = RenderedPageCache(ttl=settings.SSR_CACHE_TTL, max_pages=settings.SSR_CACHE_MAX_PAGES)
+
+# Surrogate-key purges for the CDN in front of the API
+cdn_purger = CdnPurger(url=settings.CDN_PURGE_URL, token=settings.CDN_PURGE_TOKEN)
+
+# Bundled, read-only station data
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+# Offline station snapshot shipped with the desktop sidecar
+station_snapshot = StationSnapshot.load(settings.STATION_SNAPSHOT_PATH or os.path.join(data_dir, "station_snapshot.bin"))
+# Catalog shared by all workers through the page cache
+station_index = StationIndex.load(settings.STATION_INDEX_PATH or os.path.join(data_dir, "station_index.bin"))
 
 # 3. Application Layer (Services)
-station_service = StationService(radio_repo=radio_repo, cache_repo=cache_repo)
+station_service = StationService(
+    radio_repo=radio_repo,
+    cache_repo=cache_repo,
+    snapshot=station_snapshot,
+    station_index=station_index
+)
 release_service = ReleaseService(github_adapter=GitHubAdapter())
+metrics.register("global_search", station_service.global_search_gate.stats)
+
+def get_cache_repo():
+    return cache_repo
+
+def get_page_cache():
+    return page_cache
+
+def get_cdn_purger():
+    return cdn_purger
 
 # Export the application services to be used by the API layer
 def get_station_service():
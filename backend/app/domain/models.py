@@ -1,5 +1,7 @@
+import sys
+from operator import attrgetter
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 class Station(BaseModel):
     stationuuid: str
@@ -20,6 +22,111 @@ class Station(BaseModel):
     bitrate: Optional[int] = None
     changeuuid: Optional[str] = None
 
+class StationRecord:
+    """
+    Internal station used on hot paths (mapping, caching, browse slicing):
+    slots instead of a per-instance dict and no validation. Low-cardinality
+    strings are interned and tags are a tuple, so a large list shares one
+    copy of each country, language, codec and tag. Endpoints convert to the
+    API schema only when the response is serialized.
+    """
+
+    FIELDS = (
+        "stationuuid", "name", "url", "url_resolved", "homepage", "favicon", "country", "countrycode",
+        "state", "city", "language", "tags", "clickcount", "votes", "codec", "bitrate", "changeuuid",
+    )
+    __slots__ = FIELDS
+    _values = attrgetter(*FIELDS)
+
+    def __init__(
+        self,
+        stationuuid: str,
+        name: str,
+        url: str,
+        url_resolved: str,
+        homepage: Optional[str] = None,
+        favicon: Optional[str] = None,
+        country: str = "",
+        countrycode: Optional[str] = None,
+        state: str = "",
+        city: str = "",
+        language: str = "",
+        tags: Iterable[str] = (),
+        clickcount: int = 0,
+        votes: int = 0,
+        codec: Optional[str] = None,
+        bitrate: Optional[int] = None,
+        changeuuid: Optional[str] = None,
+    ):
+        intern = sys.intern
+        self.stationuuid = stationuuid
+        self.name = name
+        self.url = url
+        self.url_resolved = url_resolved
+        self.homepage = homepage
+        self.favicon = favicon
+        self.country = intern(country) if country else country
+        self.countrycode = intern(countrycode) if countrycode else countrycode
+        self.state = intern(state) if state else state
+        self.city = intern(city) if city else city
+        self.language = intern(language) if language else language
+        self.tags = tuple(intern(t) for t in tags)
+        self.clickcount = clickcount
+        self.votes = votes
+        self.codec = intern(codec) if codec else codec
+        self.bitrate = bitrate
+        self.changeuuid = changeuuid
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StationRecord":
+        return cls(**data)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> List["StationRecord"]:
+        """
+        Records from value tuples in FIELDS order (tags as tuples). __init__
+        is skipped and values are kept as given: the fast path for decoded
+        cache entries, whose strings are already shared.
+        """
+        new = object.__new__
+        records = []
+        append = records.append
+        for row in rows:
+            record = new(cls)
+            (
+                record.stationuuid, record.name, record.url, record.url_resolved, record.homepage,
+                record.favicon, record.country, record.countrycode, record.state, record.city,
+                record.language, record.tags, record.clickcount, record.votes, record.codec,
+                record.bitrate, record.changeuuid,
+            ) = row
+            append(record)
+        return records
+
+    @classmethod
+    def from_cached(cls, items: Sequence) -> List["StationRecord"]:
+        """A cached station list: codec-backed caches already return records, the others dicts."""
+        if items and isinstance(items[0], cls):
+            return list(items)
+        return [cls.from_dict(s) for s in items]
+
+    def to_dict(self) -> Dict:
+        """Plain dict for caches and responses (tags as a list)."""
+        data = dict(zip(self.FIELDS, self._values(self)))
+        data["tags"] = list(self.tags)
+        return data
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, StationRecord):
+            return NotImplemented
+        return self._values(self) == self._values(other)
+
+    def __hash__(self) -> int:
+        # Equal records share a uuid, so sets and dict keys dedupe by station
+        return hash(self.stationuuid)
+
+    def __repr__(self) -> str:
+        return f"StationRecord(stationuuid={self.stationuuid!r}, name={self.name!r})"
+
 class Category(BaseModel):
     name: str
     stationcount: int
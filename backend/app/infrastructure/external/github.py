@@ -1,5 +1,5 @@
 import httpx
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Tuple
 from app.core.config import settings
 from fastapi import HTTPException
 
@@ -23,6 +23,26 @@ class GitHubAdapter:
                 raise HTTPException(status_code=response.status_code, detail="Failed to fetch from GitHub")
             return response.json()
 
+    async def fetch_latest_release(self, etag: Optional[str] = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Conditional variant of get_latest_release. Returns (None, etag) when
+        GitHub answers 304 Not Modified, which does not count against the rate limit.
+        """
+        if not self.token or not self.repo:
+            raise HTTPException(status_code=500, detail="GitHub configuration missing")
+
+        headers = self.headers.copy()
+        if etag:
+            headers["If-None-Match"] = etag
+
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(f"{self.base_url}/releases/latest", headers=headers)
+            if response.status_code == 304:
+                return None, etag
+            if response.status_code != 200:
+                raise HTTPException(status_code=response.status_code, detail="Failed to fetch from GitHub")
+            return response.json(), response.headers.get("ETag")
+
     async def get_asset_redirect(self, asset_id: int) -> Optional[str]:
         if not self.token or not self.repo:
             raise HTTPException(status_code=500, detail="GitHub configuration missing")
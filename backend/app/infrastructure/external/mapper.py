@@ -1,5 +1,5 @@
-from typing import List, Dict
-from app.domain.models import Station, Category
+from typing import Dict
+from app.domain.models import StationRecord, Category
 
 class RadioBrowserMapper:
     def __init__(self, normalizer):
@@ -10,7 +10,7 @@ class RadioBrowserMapper:
         cleaned = name.strip('@*#$%()=!_- .').strip()
         return cleaned or name
 
-    def map_to_station(self, data: Dict) -> Station:
+    def map_to_station(self, data: Dict) -> StationRecord:
         name = self._sanitize_name(data.get('name', ''))
         city, state, country = self.normalizer.normalize(
             data.get('city', ''),
@@ -18,7 +18,7 @@ class RadioBrowserMapper:
             data.get('country', '')
         )
         
-        return Station(
+        return StationRecord(
             stationuuid=data.get('stationuuid', ''),
             name=name,
             url=data.get('url', ''),
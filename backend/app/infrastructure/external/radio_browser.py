@@ -1,20 +1,42 @@
+import json
 import httpx
-from typing import List, Optional, Dict
-from app.domain.models import Station, Category
-from app.application.interfaces import IRadioRepository
+from typing import AsyncIterator, List, Optional, Dict
+from app.domain.models import StationRecord, Category
+from app.application.interfaces import IRadioRepository, StationStreamError
 from app.core.config import settings
 
 from app.infrastructure.external.mapper import RadioBrowserMapper
 
+async def iter_json_array(chunks: AsyncIterator[str]) -> AsyncIterator[Dict]:
+    """Objects of a JSON array, decoded one by one as its text arrives."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    async for text in chunks:
+        buffer += text
+        position = 0
+        while True:
+            # Separators between top-level items
+            while position < len(buffer) and buffer[position] in "[, \t\r\n":
+                position += 1
+            if position == len(buffer) or buffer[position] == "]":
+                break
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # Item is still incomplete
+            yield item
+        buffer = buffer[position:]
+
 class RadioBrowserAdapter(IRadioRepository):
     def __init__(self, mapper: RadioBrowserMapper):
         self.base_url = settings.RADIO_BROWSER_URL
         self.mapper = mapper
 
-    async def get_top_stations(self, limit: int = 100) -> List[Station]:
+    async def get_top_stations(self, limit: int = 100, offset: int = 0) -> List[StationRecord]:
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/stations/topvote/{limit}")
+                params = {"offset": offset} if offset else None
+                response = await client.get(f"{self.base_url}/stations/topvote/{limit}", params=params)
                 response.raise_for_status()
                 data = response.json()
                 return [self.mapper.map_to_station(s) for s in data]
@@ -22,16 +44,16 @@ class RadioBrowserAdapter(IRadioRepository):
             print(f"Error in RadioBrowserAdapter.get_top_stations: {e}")
             return []
 
-    async def search_stations(
-        self, 
-        name: Optional[str] = None, 
-        country: Optional[str] = None, 
-        countrycode: Optional[str] = None,
-        language: Optional[str] = None,
-        tag: Optional[str] = None,
-        limit: int = 100,
-        offset: int = 0
-    ) -> List[Station]:
+    @staticmethod
+    def _search_params(
+        name: Optional[str],
+        country: Optional[str],
+        countrycode: Optional[str],
+        language: Optional[str],
+        tag: Optional[str],
+        limit: int,
+        offset: int
+    ) -> Dict:
         params = {
             "limit": limit,
             "offset": offset,
@@ -47,7 +69,19 @@ class RadioBrowserAdapter(IRadioRepository):
             params["countrycode"] = countrycode
         if language: params["language"] = language
         if tag: params["tag"] = tag
+        return params
 
+    async def search_stations(
+        self, 
+        name: Optional[str] = None, 
+        country: Optional[str] = None, 
+        countrycode: Optional[str] = None,
+        language: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[StationRecord]:
+        params = self._search_params(name, country, countrycode, language, tag, limit, offset)
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 response = await client.get(f"{self.base_url}/stations/search", params=params)
@@ -58,6 +92,28 @@ class RadioBrowserAdapter(IRadioRepository):
             print(f"Error in RadioBrowserAdapter.search_stations: {e}")
             return []
 
+    async def iter_search_stations(
+        self,
+        name: Optional[str] = None,
+        country: Optional[str] = None,
+        countrycode: Optional[str] = None,
+        language: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> AsyncIterator[StationRecord]:
+        params = self._search_params(name, country, countrycode, language, tag, limit, offset)
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                async with client.stream("GET", f"{self.base_url}/stations/search", params=params) as response:
+                    response.raise_for_status()
+                    async for data in iter_json_array(response.aiter_text()):
+                        yield self.mapper.map_to_station(data)
+        except Exception as e:
+            print(f"Error in RadioBrowserAdapter.iter_search_stations: {e}")
+            # Stations may already have been sent: the caller must not mistake this for the end of the results
+            raise StationStreamError(str(e)) from e
+
     async def get_countries(self, limit: int = 100, offset: int = 0, name: Optional[str] = None) -> List[Category]:
         params = {
             "limit": limit,
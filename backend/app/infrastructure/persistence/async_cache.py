@@ -0,0 +1,90 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from app.application.interfaces import ICacheRepository, IAsyncCacheRepository
+from app.core.metrics import LatencyRecorder, timed
+
+class AsyncCacheAdapter(IAsyncCacheRepository):
+    """
+    Runs a synchronous ICacheRepository on a dedicated thread pool so disk
+    I/O and unpickling never block the event loop.
+
+    At most `max_pending` operations are queued on the pool at once; callers
+    beyond that wait. Writes are buffered and flushed as one batch per loop
+    iteration, and reads see buffered writes immediately.
+    """
+
+    def __init__(self, backend: ICacheRepository, max_workers: int = 4, max_pending: int = 64):
+        self.backend = backend
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-io")
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self._write_buffer: Dict[str, Tuple[any, Optional[int]]] = {}
+        self._flushing: Dict[str, Tuple[any, Optional[int]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.read_latency = LatencyRecorder()
+        self.write_latency = LatencyRecorder()
+        self.batches = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # asyncio primitives are bound to one loop; tests and reloads may create several
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+        return semaphore
+
+    async def _run(self, func, *args):
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def get(self, key: str) -> Optional[any]:
+        for pending in (self._write_buffer, self._flushing):
+            if key in pending:
+                return pending[key][0]
+        with timed(self.read_latency):
+            return await self._run(self.backend.get, key)
+
+    async def set(self, key: str, value: any, expire: Optional[int] = None):
+        self._write_buffer[key] = (value, expire)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def _flush(self):
+        # Yield once so writes issued in the same loop iteration join the batch
+        await asyncio.sleep(0)
+        while self._write_buffer:
+            self._flushing, self._write_buffer = self._write_buffer, {}
+            items = [(key, value, expire) for key, (value, expire) in self._flushing.items()]
+            try:
+                with timed(self.write_latency):
+                    await self._run(self.backend.set_many, items)
+                self.batches += 1
+            except Exception as e:
+                print(f"Error flushing cache writes: {e}")
+            finally:
+                self._flushing = {}
+
+    async def flush(self):
+        if self._flush_task and not self._flush_task.done():
+            await self._flush_task
+
+    async def delete(self, key: str):
+        self._write_buffer.pop(key, None)
+        await self.flush()
+        await self._run(self.backend.delete, key)
+
+    async def clear(self):
+        self._write_buffer.clear()
+        await self.flush()
+        await self._run(self.backend.clear)
+
+    def stats(self) -> Dict[str, Dict]:
+        report = dict(self.backend.stats())
+        report["_io"] = {
+            "pending_writes": len(self._write_buffer) + len(self._flushing),
+            "write_batches": self.batches,
+            "read": self.read_latency.snapshot(),
+            "write": self.write_latency.snapshot(),
+        }
+        return report
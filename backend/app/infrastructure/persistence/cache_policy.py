@@ -0,0 +1,185 @@
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.application.interfaces import ICacheRepository
+
+class CountMinSketch:
+    """Approximate per-key access counter with periodic aging (TinyLFU reset)."""
+
+    def __init__(self, width: int = 4096, depth: int = 4, sample_size: Optional[int] = None):
+        self.width = width
+        self.depth = depth
+        self.sample_size = sample_size or width * 10
+        self.additions = 0
+        self.table = [array('I', [0]) * width for _ in range(depth)]
+
+    def _indexes(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4 * self.depth).digest()
+        return [int.from_bytes(digest[i * 4:(i + 1) * 4], "little") % self.width for i in range(self.depth)]
+
+    def increment(self, key: str):
+        for row, idx in zip(self.table, self._indexes(key)):
+            row[idx] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        return min(row[idx] for row, idx in zip(self.table, self._indexes(key)))
+
+    def _age(self):
+        # Halve every counter so old popularity fades and new keys can compete
+        for row in self.table:
+            for i in range(self.width):
+                row[i] >>= 1
+        self.additions //= 2
+
+class TinyLFUCacheAdapter(ICacheRepository):
+    """
+    Cache policy layer in front of another ICacheRepository.
+
+    Keys of gated families (the prefix before the first "_", e.g. "browse")
+    are only admitted once they have been requested `admission_threshold`
+    times, and at most `capacity` of them are kept. When full, the least
+    frequently used of the `eviction_sample` least recently used entries is
+    evicted, unless the candidate is less popular than that victim.
+    """
+
+    def __init__(
+        self,
+        backend: ICacheRepository,
+        capacity: int,
+        gated_families: Iterable[str] = ("browse",),
+        admission_threshold: int = 2,
+        eviction_sample: int = 5,
+        sketch: Optional[CountMinSketch] = None
+    ):
+        self.backend = backend
+        self.capacity = capacity
+        self.gated_families = set(gated_families)
+        self.admission_threshold = admission_threshold
+        self.eviction_sample = eviction_sample
+        self.sketch = sketch or CountMinSketch()
+        self._resident: "OrderedDict[str, None]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "admitted": 0, "rejected": 0, "evicted": 0}
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def family(key: str) -> str:
+        return key.split("_", 1)[0]
+
+    def get(self, key: str) -> Optional[any]:
+        family = self.family(key)
+        with self._lock:
+            self.sketch.increment(key)
+
+        value = self.backend.get(key)
+
+        evicted = []
+        with self._lock:
+            stats = self._stats[family]
+            if value is None:
+                stats["misses"] += 1
+                self._resident.pop(key, None)
+            else:
+                stats["hits"] += 1
+                if family in self.gated_families:
+                    # Entries written by a previous process are tracked on first hit
+                    self._resident[key] = None
+                    self._resident.move_to_end(key)
+                    evicted = self._evict_overflow()
+        for victim in evicted:
+            self.backend.delete(victim)
+        return value
+
+    def set(self, key: str, value: any, expire: Optional[int] = None):
+        admitted, evicted = self._admit(key)
+        for victim in evicted:
+            self.backend.delete(victim)
+        if admitted:
+            self.backend.set(key, value, expire=expire)
+
+    def set_many(self, items: Iterable[Tuple[str, any, Optional[int]]]):
+        batch = []
+        for key, value, expire in items:
+            admitted, evicted = self._admit(key)
+            for victim in evicted:
+                self.backend.delete(victim)
+            if admitted:
+                batch.append((key, value, expire))
+        if batch:
+            self.backend.set_many(batch)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._resident.pop(key, None)
+        self.backend.delete(key)
+
+    def clear(self):
+        with self._lock:
+            self._resident.clear()
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            report = {}
+            for family, counts in self._stats.items():
+                lookups = counts["hits"] + counts["misses"]
+                report[family] = {
+                    **counts,
+                    "hit_rate": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+                }
+            report["_policy"] = {
+                "resident": len(self._resident),
+                "capacity": self.capacity,
+                "gated_families": sorted(self.gated_families),
+            }
+            return report
+
+    def _admit(self, key: str) -> Tuple[bool, List[str]]:
+        family = self.family(key)
+        if family not in self.gated_families:
+            return True, []
+
+        with self._lock:
+            stats = self._stats[family]
+            if key in self._resident:
+                self._resident.move_to_end(key)
+                return True, []
+
+            frequency = self.sketch.estimate(key)
+            if frequency < self.admission_threshold:
+                stats["rejected"] += 1
+                return False, []
+            if len(self._resident) >= self.capacity:
+                victim = self._pick_victim()
+                if victim is not None and self.sketch.estimate(victim) > frequency:
+                    stats["rejected"] += 1
+                    return False, []
+            self._resident[key] = None
+            stats["admitted"] += 1
+            return True, self._evict_overflow()
+
+    def _pick_victim(self) -> Optional[str]:
+        # Among the oldest few entries, drop the one with the lowest frequency
+        candidates = []
+        for key in self._resident:
+            candidates.append(key)
+            if len(candidates) >= self.eviction_sample:
+                break
+        if not candidates:
+            return None
+        return min(candidates, key=self.sketch.estimate)
+
+    def _evict_overflow(self) -> List[str]:
+        evicted = []
+        while len(self._resident) > self.capacity:
+            victim = self._pick_victim()
+            self._resident.pop(victim, None)
+            self._stats[self.family(victim)]["evicted"] += 1
+            evicted.append(victim)
+        return evicted
@@ -0,0 +1,126 @@
+import struct
+import sys
+import zlib
+from array import array
+from itertools import accumulate
+from operator import itemgetter
+from typing import Dict, List
+from app.domain.models import StationRecord
+
+class StationListCodec:
+    """
+    Compact columnar encoding for cached lists of station dicts.
+
+    Every string (names, urls, countries, tags, ...) is stored once in a
+    shared string table and referenced by index, numbers are packed into
+    typed arrays, and field names are not repeated per station. The body is
+    deflated, which mostly pays off on the hex uuids and similar urls.
+    Values that are not station lists are left to the cache's default
+    pickling.
+
+    Decoding yields StationRecords built straight from the columns, which
+    is what a cache hit is turned into anyway; no per-station dict is made.
+    """
+
+    MAGIC = b"RLS\x01"
+    STRING_FIELDS = (
+        "stationuuid", "name", "url", "url_resolved", "homepage", "favicon", "country",
+        "countrycode", "state", "city", "language", "codec", "changeuuid",
+    )
+    INT_FIELDS = ("clickcount", "votes", "bitrate")
+    LIST_FIELD = "tags"
+    FIELDS = frozenset(STRING_FIELDS + INT_FIELDS + (LIST_FIELD,))
+
+    _HEADER = struct.Struct("<4sIIII")
+    _NULL_INT = -(2 ** 63)
+    _SWAP = sys.byteorder != "little"
+
+    def can_encode(self, value) -> bool:
+        return (
+            isinstance(value, list)
+            and len(value) > 0
+            and all(isinstance(item, dict) and item.keys() == self.FIELDS for item in value)
+        )
+
+    def is_encoded(self, value) -> bool:
+        return isinstance(value, bytes) and value[:4] == self.MAGIC
+
+    def encode(self, stations: List[Dict]) -> bytes:
+        # Index 0 is reserved for None
+        table: Dict[str, int] = {}
+        strings: List[str] = []
+
+        def intern(value) -> int:
+            if value is None:
+                return 0
+            index = table.get(value)
+            if index is None:
+                strings.append(value)
+                index = table[value] = len(strings)
+            return index
+
+        string_columns = [array("I", (intern(s[field]) for s in stations)) for field in self.STRING_FIELDS]
+        int_columns = [
+            array("q", (self._NULL_INT if s[field] is None else s[field] for s in stations))
+            for field in self.INT_FIELDS
+        ]
+        tag_counts = array("I", (len(s[self.LIST_FIELD]) for s in stations))
+        tag_refs = array("I", (intern(tag) for s in stations for tag in s[self.LIST_FIELD]))
+
+        lengths = array("I", (len(s) for s in strings))
+        text = "".join(strings).encode("utf-8")
+
+        parts = []
+        for column in [lengths, *string_columns, *int_columns, tag_counts, tag_refs]:
+            if self._SWAP:
+                column.byteswap()
+            parts.append(column.tobytes())
+        parts.append(text)
+        header = self._HEADER.pack(self.MAGIC, len(stations), len(strings), len(tag_refs), len(text))
+        return header + zlib.compress(b"".join(parts), 1)
+
+    def decode(self, data: bytes) -> List[StationRecord]:
+        _, count, n_strings, n_refs, text_size = self._HEADER.unpack_from(data)
+        view = memoryview(zlib.decompress(memoryview(data)[self._HEADER.size:]))
+        offset = 0
+
+        def read(typecode: str, length: int) -> array:
+            nonlocal offset
+            column = array(typecode)
+            end = offset + length * column.itemsize
+            column.frombytes(view[offset:end])
+            offset = end
+            if self._SWAP:
+                column.byteswap()
+            return column
+
+        lengths = read("I", n_strings)
+        string_columns = [read("I", count) for _ in self.STRING_FIELDS]
+        int_columns = [read("q", count) for _ in self.INT_FIELDS]
+        tag_counts = read("I", count)
+        tag_refs = read("I", n_refs)
+        text = bytes(view[offset:offset + text_size]).decode("utf-8")
+
+        bounds = [0, *accumulate(lengths)]
+        table = [None, *map(text.__getitem__, map(slice, bounds, bounds[1:]))]
+
+        columns = {field: self._lookup(table, column) for field, column in zip(self.STRING_FIELDS, string_columns)}
+        null = self._NULL_INT
+        for field, column in zip(self.INT_FIELDS, int_columns):
+            values = column.tolist()
+            if null in values:
+                values = [None if v == null else v for v in values]
+            columns[field] = values
+
+        tags = tuple(self._lookup(table, tag_refs))
+        tag_bounds = [0, *accumulate(tag_counts)]
+        columns[self.LIST_FIELD] = list(map(tags.__getitem__, map(slice, tag_bounds, tag_bounds[1:])))
+        return StationRecord.from_rows(zip(*(columns[field] for field in StationRecord.FIELDS)))
+
+    @staticmethod
+    def _lookup(table: List, indexes: array) -> List:
+        if len(indexes) == 0:
+            return []
+        if len(indexes) == 1:
+            return [table[indexes[0]]]
+        return list(itemgetter(*indexes)(table))
@@ -1,17 +1,35 @@
-import os
 from diskcache import Cache
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from app.application.interfaces import ICacheRepository
+from app.infrastructure.persistence.codecs import StationListCodec
 
 class DiskCacheAdapter(ICacheRepository):
-    def __init__(self, cache_dir: str):
+    def __init__(self, cache_dir: str, codec: Optional[StationListCodec] = None):
         self.cache = Cache(cache_dir)
+        self.codec = codec
+
+    def _encode(self, value: any) -> any:
+        if self.codec and self.codec.can_encode(value):
+            return self.codec.encode(value)
+        return value
 
     def get(self, key: str) -> Optional[any]:
-        return self.cache.get(key)
+        value = self.cache.get(key)
+        if self.codec and self.codec.is_encoded(value):
+            return self.codec.decode(value)
+        return value
 
     def set(self, key: str, value: any, expire: Optional[int] = None):
-        self.cache.set(key, value, expire=expire)
+        self.cache.set(key, self._encode(value), expire=expire)
+
+    def set_many(self, items: Iterable[Tuple[str, any, Optional[int]]]):
+        # One SQLite transaction for the whole batch
+        with self.cache.transact():
+            for key, value, expire in items:
+                self.cache.set(key, self._encode(value), expire=expire)
+
+    def delete(self, key: str):
+        self.cache.delete(key)
 
     def clear(self):
         self.cache.clear()
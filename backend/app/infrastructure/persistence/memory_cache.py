@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from app.application.interfaces import ICacheRepository
+
+class MemoryCacheAdapter(ICacheRepository):
+    def __init__(self):
+        self._data: Dict[str, Tuple[any, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: any, expire: Optional[int] = None):
+        expires_at = time.monotonic() + expire if expire else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def items(self) -> Dict[str, any]:
+        """Every live entry, e.g. to bundle a warmed cache into a snapshot."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: value for key, (value, expires_at) in self._data.items()
+                if expires_at is None or expires_at > now
+            }
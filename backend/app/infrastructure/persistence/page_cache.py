@@ -0,0 +1,77 @@
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip variants are stored without it
+    brotli = None
+
+class RenderedPage:
+    """Fully rendered HTML plus precompressed variants and validators."""
+
+    def __init__(self, html: str):
+        self.body = html.encode("utf-8")
+        self.gzip = gzip.compress(self.body, compresslevel=6)
+        self.br = brotli.compress(self.body) if brotli else None
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{self.digest}"'
+        self.rendered_at = time.time()
+        self.last_modified = formatdate(self.rendered_at, usegmt=True)
+
+    def etag_for(self, coding: Optional[str]) -> str:
+        """Strong ETag of one representation: each content coding gets its own ("<hash>-gzip")."""
+        return f'"{self.digest}-{coding}"' if coding else self.etag
+
+class RenderedPageCache:
+    """
+    In-process cache for server-rendered landing and blog pages.
+
+    Keys are prefixed with a content version that blog writes bump, so
+    every page rendered before a write is dropped at once. The TTL bounds
+    staleness on workers that did not see the write; at most `max_pages`
+    are kept, least recently used first out.
+    """
+
+    def __init__(self, ttl: int = 300, max_pages: int = 256):
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self.version = 0
+        self._pages: "OrderedDict[str, RenderedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, key: str) -> str:
+        return f"{self.version}:{key}"
+
+    def get(self, key: str) -> Optional[RenderedPage]:
+        key = self._key(key)
+        with self._lock:
+            page = self._pages.get(key)
+            if page is None:
+                return None
+            if time.time() - page.rendered_at >= self.ttl:
+                del self._pages[key]
+                return None
+            self._pages.move_to_end(key)
+            return page
+
+    def put(self, key: str, html: str) -> RenderedPage:
+        page = RenderedPage(html)
+        with self._lock:
+            self._pages[self._key(key)] = page
+            self._pages.move_to_end(self._key(key))
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return page
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+            self._pages.clear()
@@ -0,0 +1,197 @@
+import pickle
+import socket
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+from app.application.interfaces import ICacheRepository
+from app.infrastructure.persistence.codecs import StationListCodec
+
+class RedisError(Exception):
+    pass
+
+class RespConnection:
+    """Minimal blocking RESP2 client: enough for GET/SET/DEL/INCR with pipelining."""
+
+    def __init__(self, url: str, timeout: float = 2.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.sock: Optional[socket.socket] = None
+        self.reader = None
+
+    def connect(self):
+        self.sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self.reader = self.sock.makefile("rb")
+        if self.password:
+            self.execute("AUTH", self.password)
+        if self.db:
+            self.execute("SELECT", self.db)
+
+    def close(self):
+        if self.sock:
+            try:
+                self.sock.close()
+            finally:
+                self.sock = None
+                self.reader = None
+
+    @staticmethod
+    def _pack(args) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read_reply(self):
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            # Returned, not raised, so the replies after it are still read off the socket
+            return RedisError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    def pipeline(self, commands: List[Tuple]) -> List:
+        if self.sock is None:
+            self.connect()
+        try:
+            self.sock.sendall(b"".join(self._pack(cmd) for cmd in commands))
+            replies = [self._read_reply() for _ in commands]
+        except Exception:
+            # Unread replies would be taken as the answers to the next command
+            self.close()
+            raise
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def execute(self, *args):
+        return self.pipeline([args])[0]
+
+class RedisCacheAdapter(ICacheRepository):
+    """
+    Shared cache for multi-worker deployments, speaking the Redis protocol.
+
+    Keys are stored as "{namespace}:{generation}:{key}". clear() bumps the
+    generation counter instead of scanning keys, so every worker stops
+    seeing old entries once it re-reads the generation (at most
+    `generation_ttl` seconds later); old entries then expire on their TTL.
+    Connection errors and undecodable entries are treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        namespace: str = "radiolite",
+        default_ttl: int = 86400,
+        generation_ttl: float = 1.0,
+        codec: Optional[StationListCodec] = None
+    ):
+        self.url = url
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self.generation_ttl = generation_ttl
+        self.codec = codec
+        self._local = threading.local()
+        self._generation: Optional[int] = None
+        self._generation_checked = 0.0
+
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.namespace}:generation"
+
+    def _connection(self) -> RespConnection:
+        # One connection per cache I/O thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = RespConnection(self.url)
+        return conn
+
+    def _current_generation(self) -> int:
+        now = time.monotonic()
+        if self._generation is None or now - self._generation_checked >= self.generation_ttl:
+            value = self._connection().execute("GET", self._generation_key)
+            self._generation = int(value) if value else 0
+            self._generation_checked = now
+        return self._generation
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{self._current_generation()}:{key}"
+
+    def _dumps(self, value: any) -> bytes:
+        if self.codec and self.codec.can_encode(value):
+            return self.codec.encode(value)
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _loads(self, raw: Optional[bytes]) -> Optional[any]:
+        if raw is None:
+            return None
+        if self.codec and self.codec.is_encoded(raw):
+            return self.codec.decode(raw)
+        return pickle.loads(raw)
+
+    def _set_command(self, key: str, value: any, expire: Optional[int]) -> Tuple:
+        return ("SET", self._key(key), self._dumps(value), "EX", int(expire or self.default_ttl))
+
+    def get(self, key: str) -> Optional[any]:
+        try:
+            raw = self._connection().execute("GET", self._key(key))
+        except (OSError, ConnectionError, RedisError) as e:
+            print(f"Error in RedisCacheAdapter.get: {e}")
+            return None
+        try:
+            return self._loads(raw)
+        except Exception as e:
+            # Corrupt, or written by another code version: a miss, overwritten on the next set
+            print(f"Error decoding RedisCacheAdapter entry {key}: {e!r}")
+            return None
+
+    def set(self, key: str, value: any, expire: Optional[int] = None):
+        try:
+            self._connection().execute(*self._set_command(key, value, expire))
+        except (OSError, ConnectionError, RedisError) as e:
+            print(f"Error in RedisCacheAdapter.set: {e}")
+
+    def set_many(self, items: Iterable[Tuple[str, any, Optional[int]]]):
+        try:
+            commands = [self._set_command(key, value, expire) for key, value, expire in items]
+            if commands:
+                self._connection().pipeline(commands)
+        except (OSError, ConnectionError, RedisError) as e:
+            print(f"Error in RedisCacheAdapter.set_many: {e}")
+
+    def delete(self, key: str):
+        try:
+            self._connection().execute("DEL", self._key(key))
+        except (OSError, ConnectionError, RedisError) as e:
+            print(f"Error in RedisCacheAdapter.delete: {e}")
+
+    def clear(self):
+        try:
+            self._generation = self._connection().execute("INCR", self._generation_key)
+            self._generation_checked = time.monotonic()
+        except (OSError, ConnectionError, RedisError) as e:
+            print(f"Error in RedisCacheAdapter.clear: {e}")
@@ -0,0 +1,93 @@
+import json
+import mmap
+import os
+import struct
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+from app.infrastructure.persistence.codecs import StationListCodec
+
+class StationSnapshot:
+    """
+    Read-only bundle of cache entries shipped with the desktop sidecar so
+    the first launch (or an offline one) has stations to show.
+
+    Layout: an 8-byte magic, the index length, a JSON index mapping each
+    cache key to (offset, length, format), then the entry blobs. Station
+    lists use StationListCodec, anything else is JSON. The file is
+    memory-mapped and entries are decoded only when asked for.
+    """
+
+    MAGIC = b"RLSNAP\x01\x00"
+    _HEADER = struct.Struct("<8sI")
+
+    def __init__(self, path: str, codec: Optional[StationListCodec] = None):
+        self.path = path
+        self.codec = codec or StationListCodec()
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_size = self._HEADER.unpack_from(self._data)
+        if magic != self.MAGIC:
+            self._data.close()
+            raise ValueError(f"{path} is not a station snapshot")
+        start = self._HEADER.size
+        index = json.loads(self._data[start:start + index_size])
+        self.created_at: str = index["created_at"]
+        self._entries: Dict[str, list] = index["entries"]
+        self._base = start + index_size
+
+    @classmethod
+    def load(cls, path: str) -> Optional["StationSnapshot"]:
+        """The snapshot at `path`, or None when there is none (e.g. server deployments)."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"Error loading station snapshot: {e}")
+            return None
+
+    def keys(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        offset, length, kind = entry
+        start = self._base + offset
+        view = memoryview(self._data)[start:start + length]
+        try:
+            if kind == "codec":
+                return self.codec.decode(view)
+            return json.loads(bytes(view))
+        finally:
+            view.release()
+
+    @classmethod
+    def write(cls, path: str, entries: Dict[str, any], codec: Optional[StationListCodec] = None):
+        codec = codec or StationListCodec()
+        index, blobs, offset = {}, [], 0
+        for key, value in sorted(entries.items()):
+            if codec.can_encode(value):
+                blob, kind = codec.encode(value), "codec"
+            else:
+                blob, kind = json.dumps(value, separators=(",", ":")).encode("utf-8"), "json"
+            index[key] = [offset, len(blob), kind]
+            blobs.append(blob)
+            offset += len(blob)
+
+        header = json.dumps(
+            {"created_at": datetime.now(timezone.utc).isoformat(), "entries": index},
+            separators=(",", ":")
+        ).encode("utf-8")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(cls._HEADER.pack(cls.MAGIC, len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, path)
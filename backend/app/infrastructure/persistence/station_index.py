@@ -0,0 +1,292 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from heapq import merge
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.infrastructure.persistence.codecs import StationListCodec
+
+class StationIndex:
+    """
+    Read-only, memory-mapped station catalog. Every uvicorn worker maps the
+    same file, so the data lives once in the OS page cache and a query only
+    decodes the records it returns.
+
+    Layout: an 8-byte magic, the length of a JSON header describing the
+    sections, then 8-byte aligned little-endian sections:
+
+        strings       utf-8 text plus uint32 end offsets (string id 0 is None)
+        records       fixed-width rows: one uint32 string id per text field,
+                      one int64 per numeric field, then (tag start, tag count)
+        tag_refs      uint32 string ids referenced by the records
+        <field>_keys / <field>_starts / <field>_postings
+                      per filter field: key string ids sorted case-insensitively,
+                      and for each key the record numbers carrying it
+
+    Records are stored by clickcount, highest first, so a posting list in
+    record order is already ranked the way Radio Browser ranks searches.
+    """
+
+    MAGIC = b"RLIDX\x01\x00\x00"
+    _HEADER = struct.Struct("<8sI")
+    STRING_FIELDS = StationListCodec.STRING_FIELDS
+    INT_FIELDS = StationListCodec.INT_FIELDS
+    _RECORD = struct.Struct("<%dI%dqII" % (len(STRING_FIELDS), len(INT_FIELDS)))
+    _NULL_INT = -(2 ** 63)
+    _SWAP = sys.byteorder != "little"
+
+    # Filter field -> whether it matches substrings (Radio Browser's language
+    # and tag filters do) or whole values (country with countryexact, countrycode)
+    DIRECTORIES = {"country": False, "countrycode": False, "language": True, "tag": True}
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = self._HEADER.unpack_from(self._data)
+        if magic != self.MAGIC:
+            self._data.close()
+            raise ValueError(f"{path} is not a station index")
+        header = json.loads(self._data[self._HEADER.size:self._HEADER.size + header_size])
+        self.created_at: str = header["created_at"]
+        self.count: int = header["count"]
+        self._sections: Dict[str, List[int]] = header["sections"]
+
+        self._text_offset = self._sections["text"][0]
+        self._string_ends = self._u32("string_ends")
+        self._records_offset = self._sections["records"][0]
+        self._tag_refs = self._u32("tag_refs")
+        self._directory_keys: Dict[str, List[str]] = {}
+        self._category_counts: Dict[str, List[Tuple[str, int]]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> Optional["StationIndex"]:
+        """The index at `path`, or None when there is none or it is unreadable."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"Error loading station index: {e}")
+            return None
+
+    def _u32(self, section: str) -> Sequence[int]:
+        offset, length = self._sections[section]
+        view = memoryview(self._data)[offset:offset + length]
+        if not self._SWAP:
+            return view.cast("I")
+        column = array("I", view)
+        column.byteswap()
+        return column
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == 0:
+            return None
+        start = self._string_ends[string_id - 2] if string_id > 1 else 0
+        end = self._string_ends[string_id - 1]
+        return str(self._data[self._text_offset + start:self._text_offset + end], "utf-8")
+
+    def _record(self, number: int) -> Dict:
+        values = self._RECORD.unpack_from(self._data, self._records_offset + number * self._RECORD.size)
+        n_strings, n_ints = len(self.STRING_FIELDS), len(self.INT_FIELDS)
+        row = {field: self._string(v) for field, v in zip(self.STRING_FIELDS, values[:n_strings])}
+        for field, v in zip(self.INT_FIELDS, values[n_strings:n_strings + n_ints]):
+            row[field] = None if v == self._NULL_INT else v
+        tag_start, tag_count = values[-2:]
+        row["tags"] = [self._string(t) for t in self._tag_refs[tag_start:tag_start + tag_count]]
+        return row
+
+    def _keys(self, field: str) -> List[str]:
+        # Only the (small) key directory is decoded, once per worker
+        keys = self._directory_keys.get(field)
+        if keys is None:
+            keys = self._directory_keys[field] = [
+                self._string(string_id).casefold() for string_id in self._u32(f"{field}_keys")
+            ]
+        return keys
+
+    def has_key(self, field: str, value: str) -> bool:
+        """Whether any indexed station matches `value` for a filter field."""
+        keys = self._keys(field)
+        needle = value.casefold()
+        if not self.DIRECTORIES[field]:
+            position = bisect_left(keys, needle)
+            return position < len(keys) and keys[position] == needle
+        return any(needle in key for key in keys)
+
+    def covers(self, filters: Dict[str, Optional[str]]) -> bool:
+        """
+        Whether search(filters) is authoritative: every given filter names a
+        key in the index, so an empty page really is the end of the results.
+        """
+        active = [(field, value) for field, value in filters.items() if value]
+        return bool(active) and all(self.has_key(field, value) for field, value in active)
+
+    def _postings(self, field: str, value: str) -> Iterable[int]:
+        keys = self._keys(field)
+        starts = self._u32(f"{field}_starts")
+        postings = self._u32(f"{field}_postings")
+        needle = value.casefold()
+
+        if not self.DIRECTORIES[field]:
+            position = bisect_left(keys, needle)
+            if position < len(keys) and keys[position] == needle:
+                return postings[starts[position]:starts[position + 1]]
+            return ()
+
+        matches = [i for i, key in enumerate(keys) if needle in key]
+        if len(matches) == 1:
+            return postings[starts[matches[0]]:starts[matches[0] + 1]]
+        return self._unique(merge(*(postings[starts[i]:starts[i + 1]] for i in matches)))
+
+    @staticmethod
+    def _unique(numbers: Iterable[int]) -> Iterator[int]:
+        previous = None
+        for number in numbers:
+            if number != previous:
+                yield number
+                previous = number
+
+    def search(self, filters: Dict[str, Optional[str]], limit: int, offset: int = 0) -> List[Dict]:
+        """Stations matching every given filter, ranked by clickcount."""
+        return list(self.iter_search(filters, limit, offset))
+
+    def iter_search(self, filters: Dict[str, Optional[str]], limit: int, offset: int = 0) -> Iterator[Dict]:
+        """Like search(), decoding each record only when it is consumed."""
+        active = [(field, value) for field, value in filters.items() if value]
+        if not active or limit <= 0:
+            return iter(())
+        ranked = self._postings(*active[0])
+        for field, value in active[1:]:
+            ranked = filter(set(self._postings(field, value)).__contains__, ranked)
+        return map(self._record, islice(ranked, offset, offset + limit))
+
+    def ranked(self, limit: int) -> Iterator[Dict]:
+        """The `limit` most clicked stations, decoded as they are consumed."""
+        return map(self._record, range(min(limit, self.count)))
+
+    def categories(self, field: str, limit: int, offset: int = 0, name: Optional[str] = None) -> List[Tuple[str, int]]:
+        """(name, stationcount) pairs for a filter field, most stations first."""
+        counts = self._category_counts.get(field)
+        if counts is None:
+            starts = self._u32(f"{field}_starts")
+            names = [self._string(string_id) for string_id in self._u32(f"{field}_keys")]
+            counts = sorted(
+                ((names[i], starts[i + 1] - starts[i]) for i in range(len(names))),
+                key=lambda item: (-item[1], item[0])
+            )
+            self._category_counts[field] = counts
+        if name:
+            needle = name.casefold()
+            counts = [item for item in counts if needle in item[0].casefold()]
+        return counts[offset:offset + limit]
+
+    @classmethod
+    def _field_values(cls, field: str, station: Dict) -> List[str]:
+        if field == "tag":
+            values = station["tags"]
+        elif field == "language":
+            values = (station["language"] or "").split(",")
+        else:
+            values = [station[field] or ""]
+        return [v.strip() for v in values if v and v.strip()]
+
+    @classmethod
+    def write(cls, path: str, stations: List[Dict]):
+        stations = sorted(stations, key=lambda s: -(s["clickcount"] or 0))
+        table: Dict[str, int] = {}
+        strings: List[str] = []
+
+        def intern(value) -> int:
+            if value is None:
+                return 0
+            string_id = table.get(value)
+            if string_id is None:
+                strings.append(value)
+                string_id = table[value] = len(strings)
+            return string_id
+
+        records = bytearray()
+        tag_refs = array("I")
+        for s in stations:
+            ids = [intern(s[field]) for field in cls.STRING_FIELDS]
+            ints = [cls._NULL_INT if s[field] is None else s[field] for field in cls.INT_FIELDS]
+            tag_start = len(tag_refs)
+            tag_refs.extend(intern(tag) for tag in s["tags"])
+            records += cls._RECORD.pack(*ids, *ints, tag_start, len(s["tags"]))
+
+        sections: Dict[str, bytes] = {
+            "records": bytes(records),
+            "tag_refs": cls._pack(tag_refs),
+        }
+
+        for field in cls.DIRECTORIES:
+            postings: Dict[str, List[int]] = {}
+            display: Dict[str, str] = {}
+            for number, station in enumerate(stations):
+                for value in cls._field_values(field, station):
+                    key = value.casefold()
+                    display.setdefault(key, value)
+                    numbers = postings.setdefault(key, [])
+                    if not numbers or numbers[-1] != number:
+                        numbers.append(number)
+            keys = sorted(postings)
+            starts, flat = array("I", [0]), array("I")
+            for key in keys:
+                flat.extend(postings[key])
+                starts.append(len(flat))
+            sections[f"{field}_keys"] = cls._pack(array("I", (intern(display[key]) for key in keys)))
+            sections[f"{field}_starts"] = cls._pack(starts)
+            sections[f"{field}_postings"] = cls._pack(flat)
+
+        # Interned last so directory display names are included
+        encoded = [s.encode("utf-8") for s in strings]
+        ends, total = array("I"), 0
+        for chunk in encoded:
+            total += len(chunk)
+            ends.append(total)
+        sections["string_ends"] = cls._pack(ends)
+        sections["text"] = b"".join(encoded)
+
+        # Section offsets depend on the header length and vice versa: grow the
+        # reserved header space until the JSON fits, padding it with spaces
+        created_at = datetime.now(timezone.utc).isoformat()
+        header_size = 0
+        while True:
+            layout, position = {}, cls._align(cls._HEADER.size + header_size)
+            for name, blob in sections.items():
+                layout[name] = [position, len(blob)]
+                position = cls._align(position + len(blob))
+            header = json.dumps(
+                {"created_at": created_at, "count": len(stations), "sections": layout},
+                separators=(",", ":")
+            ).encode("utf-8")
+            if len(header) <= header_size:
+                header = header.ljust(header_size)
+                break
+            header_size = len(header)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(cls._HEADER.pack(cls.MAGIC, len(header)))
+            f.write(header)
+            for name, blob in sections.items():
+                f.write(b"\0" * (layout[name][0] - f.tell()))
+                f.write(blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def _pack(cls, column: array) -> bytes:
+        if cls._SWAP:
+            column.byteswap()
+        return column.tobytes()
+
+    @staticmethod
+    def _align(position: int) -> int:
+        return (position + 7) & ~7
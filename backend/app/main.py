@@ -1,35 +1,33 @@
-from fastapi import FastAPI, Request, Depends, HTTPException
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import os
 from contextlib import asynccontextmanager
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-import markdown
 from app.core.config import settings
-from app.api.v1.endpoints import stations, health, releases, analytics, admin, auth, blog, users
-from app.core.database import init_db, get_db
-from app.models.blog import BlogPost
-from app.models.admin_user import AdminUser
+from app.api.v1.endpoints import stations, health, releases
+from app.core.metrics import loop_lag_monitor
+from app.core.http import ConditionalResponseMiddleware
+from app.dependencies import get_cache_repo
 import logging
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Resolve landing directory path
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # app -> backend
-PROJECT_ROOT = os.path.dirname(BASE_DIR)
-LANDING_DIR = os.path.join(PROJECT_ROOT, "landing")
+# The desktop sidecar only serves stations and releases; the admin API, blog,
+# auth and (unless analytics are wanted) the database are never imported there
+SIDECAR = settings.APP_PROFILE == "sidecar"
+USE_DATABASE = not SIDECAR or settings.SIDECAR_ANALYTICS
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Initialize database
-    await init_db()
+    if USE_DATABASE:
+        from app.core.database import init_db
+        await init_db()
+    loop_lag_monitor.start()
     yield
-    # Shutdown: Add any cleanup here if needed
+    # Shutdown: persist buffered cache writes
+    await loop_lag_monitor.stop()
+    await get_cache_repo().flush()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -37,14 +35,12 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Debug paths for production
-logger.info(f"BASE_DIR: {BASE_DIR}")
-logger.info(f"PROJECT_ROOT: {PROJECT_ROOT}")
-logger.info(f"LANDING_DIR: {LANDING_DIR}")
-if os.path.exists(LANDING_DIR):
-    logger.info(f"LANDING_DIR exists. Contents: {os.listdir(LANDING_DIR)}")
-else:
-    logger.warning(f"LANDING_DIR DOES NOT EXIST at {LANDING_DIR}")
+# ETag/304 and compression for station lists polled by the desktop and web clients
+app.add_middleware(
+    ConditionalResponseMiddleware,
+    path_prefix=f"{settings.API_V1_STR}/stations/",
+    minimum_size=settings.COMPRESSION_MIN_SIZE
+)
 
 # Set all CORS enabled origins
 app.add_middleware(
@@ -63,80 +59,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Station pages carry their continuation cursor in a header
+    expose_headers=["X-Next-Cursor"],
 )
 
-# Setup templates and static files
-templates = None
-if os.path.exists(LANDING_DIR):
-    app.mount("/static", StaticFiles(directory=LANDING_DIR), name="static")
-    templates = Jinja2Templates(directory=LANDING_DIR)
-
-    # Add markdown filter
-    def render_markdown(text):
-        if not text:
-            return ""
-        return markdown.markdown(text, extensions=['fenced_code', 'tables'])
-
-    templates.env.filters["markdown"] = render_markdown
-else:
-    logger.warning(f"LANDING_DIR not found at {LANDING_DIR}. Static files and templates will be disabled.")
-
 app.include_router(stations.router, prefix=f"{settings.API_V1_STR}/stations", tags=["stations"])
 app.include_router(health.router, prefix=settings.API_V1_STR, tags=["health"])
 app.include_router(releases.router, prefix=f"{settings.API_V1_STR}/releases", tags=["releases"])
-app.include_router(analytics.router, prefix=f"{settings.API_V1_STR}", tags=["analytics"])
-app.include_router(admin.router, prefix=f"{settings.API_V1_STR}", tags=["admin"])
-app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
-app.include_router(blog.router, prefix=f"{settings.API_V1_STR}/blog", tags=["blog"])
-app.include_router(users.router, prefix=f"{settings.API_V1_STR}/admin", tags=["users"])
-
-# landing page SSR route
-@app.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def serve_landing(request: Request, db: AsyncSession = Depends(get_db)):
-    if not templates:
-        return HTMLResponse("<h1>Radiolite API</h1><p>Running successfully. Landing page assets not found in this environment.</p>")
-    try:
-        # Fetch 3 latest posts for the homepage
-        stmt = select(BlogPost).where(BlogPost.is_published == True).order_by(desc(BlogPost.created_at)).limit(3)
-        result = await db.execute(stmt)
-        posts = result.scalars().all()
-        return templates.TemplateResponse("index.html", {"request": request, "posts": posts})
-    except Exception as e:
-        logger.error(f"Error loading homepage: {e}")
-        # Try to run a quick diagnostic for the logs
-        try:
-            diag = await db.execute(text("SELECT current_database(), current_schema()"))
-            db_info = diag.fetchone()
-            logger.info(f"Homepage Error Diagnostic: DB={db_info[0] if db_info else '?'}, Schema={db_info[1] if db_info else '?'}")
-        except: pass
-        
-        # Return index with empty posts if DB is not ready
-        return templates.TemplateResponse("index.html", {"request": request, "posts": []})
 
-@app.get("/blog", include_in_schema=False)
-async def list_blog(request: Request, db: AsyncSession = Depends(get_db)):
-    if not templates:
-        return HTMLResponse("<h1>Radiolite Blog</h1><p>Blog assets not found in this environment.</p>")
-    stmt = select(BlogPost).where(BlogPost.is_published == True).order_by(desc(BlogPost.created_at))
-    result = await db.execute(stmt)
-    posts = result.scalars().all()
-    return templates.TemplateResponse("blog.html", {"request": request, "posts": posts})
+if USE_DATABASE:
+    from app.api.v1.endpoints import analytics
+    app.include_router(analytics.router, prefix=f"{settings.API_V1_STR}", tags=["analytics"])
 
-@app.get("/blog/{slug}", include_in_schema=False)
-async def view_post(slug: str, request: Request, db: AsyncSession = Depends(get_db)):
-    if not templates:
-        return HTMLResponse("<h1>Radiolite Blog</h1><p>Post assets not found in this environment.</p>")
-    result = await db.execute(select(BlogPost).where(BlogPost.slug == slug))
-    post = result.scalar_one_or_none()
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-        
-    return templates.TemplateResponse("post.html", {
-        "request": request,
-        "post": post,
-        "title": post.seo_title or post.title,
-        "description": post.meta_description
-    })
+if not SIDECAR:
+    from app.api.v1.endpoints import admin, auth, blog, users
+    from app.site import mount_site
+    app.include_router(admin.router, prefix=f"{settings.API_V1_STR}", tags=["admin"])
+    app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
+    app.include_router(blog.router, prefix=f"{settings.API_V1_STR}/blog", tags=["blog"])
+    app.include_router(users.router, prefix=f"{settings.API_V1_STR}/admin", tags=["users"])
+    # Landing page and server-rendered blog
+    mount_site(app)
 
 if __name__ == "__main__":
     import uvicorn
@@ -10,6 +10,9 @@ class BlogPost(Base):
     title = Column(String, nullable=False)
     slug = Column(String, unique=True, index=True, nullable=False)
     content = Column(Text, nullable=False)  # Markdown content
+    content_html = Column(Text, nullable=True)  # Compiled from content on every write
+    excerpt = Column(String, nullable=True)  # Plain-text summary for list pages
+    reading_time = Column(Integer, nullable=True)  # Minutes
     image_url = Column(String, nullable=True)
     image_source = Column(String, nullable=True)  # Small text under image
     image_link = Column(String, nullable=True)    # Link for the image
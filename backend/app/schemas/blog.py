@@ -44,9 +44,26 @@ class BlogUpdate(BaseModel):
 
 class BlogResponse(BlogBase):
     id: int
+    excerpt: Optional[str] = None
+    reading_time: Optional[int] = None
     author_id: Optional[int] = None
     author: Optional[UserResponse] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+class BlogSummary(BaseModel):
+    """List-page projection: no content columns, author reduced to a name."""
+    id: int
+    slug: str
+    title: str
+    image_url: Optional[str] = None
+    excerpt: str = ""
+    reading_time: Optional[int] = None
+    created_at: datetime
+    author_name: Optional[str] = None
+
+class BlogSummaryPage(BaseModel):
+    items: List[BlogSummary]
+    next_cursor: Optional[str] = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 class StationBase(BaseModel):
@@ -17,5 +17,8 @@ class StationBase(BaseModel):
     geo_lat: Optional[float] = None
     geo_long: Optional[float] = None
 
+    # Endpoints return internal StationRecord objects as-is
+    model_config = ConfigDict(from_attributes=True)
+
 class Station(StationBase):
     pass
@@ -0,0 +1,133 @@
+"""Server-rendered landing page and blog, mounted only in the full web profile."""
+import logging
+import os
+from typing import Optional, Sequence
+import jinja2
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse
+from fastapi.staticfiles import StaticFiles
+from fastapi.templating import Jinja2Templates
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cdn import BLOG_KEY, SITE_PAGES, set_cache_headers, set_no_store, surrogate_key
+from app.core.config import settings
+from app.core.content import render_markdown
+from app.core.database import get_db
+from app.core.http import page_response
+from app.application.blog import decode_cursor, list_post_summaries
+from app.dependencies import get_page_cache
+from app.infrastructure.persistence.page_cache import RenderedPage
+from app.models.blog import BlogPost
+
+logger = logging.getLogger(__name__)
+
+# Resolve landing directory path
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # app -> backend
+PROJECT_ROOT = os.path.dirname(BASE_DIR)
+LANDING_DIR = os.path.join(PROJECT_ROOT, "landing")
+
+router = APIRouter()
+
+# Setup templates
+templates = None
+if os.path.exists(LANDING_DIR):
+    templates = Jinja2Templates(directory=LANDING_DIR)
+
+    # Fallback for posts written before content_html existed
+    templates.env.filters["markdown"] = render_markdown
+
+    @jinja2.pass_context
+    def site_url_for(context, name: str, /, **path_params) -> str:
+        # Absolute URLs use SITE_URL, not the client's Host header, so one cached page serves every request
+        return settings.SITE_URL.rstrip("/") + context["request"].app.url_path_for(name, **path_params)
+
+    templates.env.globals["url_for"] = site_url_for
+else:
+    logger.warning(f"LANDING_DIR not found at {LANDING_DIR}. Static files and templates will be disabled.")
+
+def mount_site(app: FastAPI):
+    if templates:
+        app.mount("/static", StaticFiles(directory=LANDING_DIR), name="static")
+    app.include_router(router)
+
+# Rendered SSR pages are cached until a blog write invalidates them
+page_cache = get_page_cache()
+
+def site_response(page, request: Request, keys: Sequence[str]):
+    response = page_response(page, request)
+    set_cache_headers(response, SITE_PAGES, [BLOG_KEY, *keys])
+    return response
+
+def render_cached(request: Request, cache_key: str, template: str, context: dict, keys: Sequence[str] = ()):
+    response = templates.TemplateResponse(request, template, context)
+    page = page_cache.put(f"{cache_key}@{settings.SITE_URL}", response.body.decode("utf-8"))
+    return site_response(page, request, keys)
+
+def render_uncached(request: Request, template: str, context: dict, keys: Sequence[str] = ()):
+    response = templates.TemplateResponse(request, template, context)
+    return site_response(RenderedPage(response.body.decode("utf-8")), request, keys)
+
+def cached_page(request: Request, cache_key: str):
+    return page_cache.get(f"{cache_key}@{settings.SITE_URL}")
+
+# landing page SSR route
+@router.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def serve_landing(request: Request, db: AsyncSession = Depends(get_db)):
+    if not templates:
+        return HTMLResponse("<h1>Radiolite API</h1><p>Running successfully. Landing page assets not found in this environment.</p>")
+    page = cached_page(request, "landing")
+    if page:
+        return site_response(page, request, ["landing"])
+    try:
+        # Fetch 3 latest posts for the homepage
+        posts, _ = await list_post_summaries(db, limit=3)
+        return render_cached(request, "landing", "index.html", {"posts": posts}, ["landing"])
+    except Exception as e:
+        logger.error(f"Error loading homepage: {e}")
+        # Try to run a quick diagnostic for the logs
+        try:
+            diag = await db.execute(text("SELECT current_database(), current_schema()"))
+            db_info = diag.fetchone()
+            logger.info(f"Homepage Error Diagnostic: DB={db_info[0] if db_info else '?'}, Schema={db_info[1] if db_info else '?'}")
+        except: pass
+        
+        # Return index with empty posts if DB is not ready
+        return templates.TemplateResponse(request, "index.html", {"posts": []})
+
+@router.get("/blog", include_in_schema=False)
+async def list_blog(request: Request, cursor: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    if not templates:
+        return HTMLResponse("<h1>Radiolite Blog</h1><p>Blog assets not found in this environment.</p>")
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Cursors are client-supplied: only the first page is kept in the page cache
+        posts, next_cursor = await list_post_summaries(db, limit=settings.BLOG_PAGE_SIZE, cursor=cursor)
+        return render_uncached(request, "blog.html", {"posts": posts, "next_cursor": next_cursor})
+    page = cached_page(request, "blog")
+    if page:
+        return site_response(page, request, [])
+    posts, next_cursor = await list_post_summaries(db, limit=settings.BLOG_PAGE_SIZE)
+    return render_cached(request, "blog", "blog.html", {"posts": posts, "next_cursor": next_cursor})
+
+@router.get("/blog/{slug}", include_in_schema=False)
+async def view_post(slug: str, request: Request, db: AsyncSession = Depends(get_db)):
+    if not templates:
+        return HTMLResponse("<h1>Radiolite Blog</h1><p>Post assets not found in this environment.</p>")
+    page = cached_page(request, f"post:{slug}")
+    if page:
+        return site_response(page, request, [surrogate_key("post", slug)])
+    result = await db.execute(select(BlogPost).where(BlogPost.slug == slug))
+    post = result.scalar_one_or_none()
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+
+    context = {"post": post, "title": post.seo_title or post.title, "description": post.meta_description}
+    if not post.is_published:
+        # Drafts stay out of the page cache and any shared cache
+        response = render_uncached(request, "post.html", context)
+        set_no_store(response)
+        return response
+    return render_cached(request, f"post:{slug}", "post.html", context, [surrogate_key("post", slug)])
@@ -0,0 +1,24 @@
+import asyncio
+from sqlalchemy import select
+from app.core.content import compile_post
+from app.core.database import AsyncSessionLocal, init_db
+from app.models.blog import BlogPost
+
+async def backfill(force: bool = False):
+    # init_db adds the content_html/excerpt/reading_time columns to existing databases
+    await init_db()
+
+    async with AsyncSessionLocal() as session:
+        stmt = select(BlogPost)
+        if not force:
+            stmt = stmt.where(BlogPost.content_html.is_(None))
+        result = await session.execute(stmt)
+        posts = result.scalars().all()
+        for post in posts:
+            compile_post(post)
+        await session.commit()
+        print(f"✓ Compiled Markdown for {len(posts)} posts")
+
+if __name__ == "__main__":
+    import sys
+    asyncio.run(backfill(force="--force" in sys.argv))
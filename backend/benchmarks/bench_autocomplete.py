@@ -0,0 +1,46 @@
+"""
+Build time and query latency of the global-search AutocompleteIndex for
+catalogs of realistic size, with prefix, multi-word and misspelled queries.
+
+Run from backend/: python -m benchmarks.bench_autocomplete
+"""
+import random
+import time
+from app.application.autocomplete import AutocompleteIndex
+
+WORDS = [
+    "radio", "fm", "jazz", "rock", "classic", "hits", "news", "sport", "kiss", "energy", "antenne", "bayern",
+    "paradise", "smooth", "chill", "lounge", "dance", "country", "talk", "cafe", "deutschlandfunk", "nova",
+    "cadena", "ser", "rai", "bbc", "one", "capital", "heart", "absolute", "nostalgie", "europa", "plus",
+    "classica", "metal", "latino", "salsa", "reggae", "gospel", "soul", "funk", "blues", "techno", "house",
+]
+QUERIES = ["ra", "radi", "jazz ca", "deutschlan", "paradsie", "classci rock", "antene bay", "zzzz"]
+
+def make_entries(count: int):
+    rng = random.Random(7)
+    stations = []
+    for i in range(count):
+        name = " ".join(rng.sample(WORDS, rng.randint(1, 3))) + (f" {i % 100}" if i % 4 == 0 else "")
+        stations.append((name.title(), rng.randint(0, 50000), i))
+    tags = [(f"{a} {b}", rng.randint(1, 500), None) for a in WORDS for b in WORDS[:20]]
+    return {"station": stations, "tag": tags, "country": [], "language": []}
+
+def main():
+    limits = {"station": 20, "country": 4, "language": 4, "tag": 4}
+    for count in (5_000, 30_000):
+        entries = make_entries(count)
+        started = time.perf_counter()
+        index = AutocompleteIndex(entries)
+        built = time.perf_counter() - started
+        print(f"{count} stations: built in {built * 1000:.0f} ms")
+        for query in QUERIES:
+            runs = []
+            for _ in range(50):
+                started = time.perf_counter()
+                found = index.suggest(query, limits)
+                runs.append(time.perf_counter() - started)
+            runs.sort()
+            print(f"  {query!r:16} {len(found['station']):3} stations   p50 {runs[25] * 1000:6.2f} ms   p99 {runs[-1] * 1000:6.2f} ms")
+
+if __name__ == "__main__":
+    main()
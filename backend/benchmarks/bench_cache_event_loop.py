@@ -0,0 +1,41 @@
+"""
+Compares event-loop lag when the disk cache is called directly from
+coroutines versus through AsyncCacheAdapter.
+
+Run from backend/: python -m benchmarks.bench_cache_event_loop
+"""
+import asyncio
+import tempfile
+from app.core.metrics import EventLoopLagMonitor
+from app.infrastructure.persistence.disk_cache import DiskCacheAdapter
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+
+PAYLOAD = [{"stationuuid": f"uuid-{i}", "name": f"Station {i}", "tags": ["pop", "rock"]} for i in range(5000)]
+ROUNDS = 200
+
+async def run_sync(cache: DiskCacheAdapter):
+    for i in range(ROUNDS):
+        cache.set(f"key_{i % 20}", PAYLOAD)
+        cache.get(f"key_{(i + 7) % 20}")
+        await asyncio.sleep(0)
+
+async def run_async(cache: AsyncCacheAdapter):
+    for i in range(ROUNDS):
+        await cache.set(f"key_{i % 20}", PAYLOAD)
+        await cache.get(f"key_{(i + 7) % 20}")
+    await cache.flush()
+
+async def measure(label: str, workload):
+    monitor = EventLoopLagMonitor(interval=0.005)
+    monitor.start()
+    await workload
+    await monitor.stop()
+    print(f"{label:>22}: {monitor.snapshot()}")
+
+async def main():
+    with tempfile.TemporaryDirectory() as sync_dir, tempfile.TemporaryDirectory() as async_dir:
+        await measure("DiskCacheAdapter", run_sync(DiskCacheAdapter(sync_dir)))
+        await measure("AsyncCacheAdapter", run_async(AsyncCacheAdapter(DiskCacheAdapter(async_dir))))
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+Compares the default pickle path used by diskcache with StationListCodec
+for cached station lists: encoded size and cache hit time. A hit ends in
+StationRecords, so the pickle path includes StationRecord.from_dict; the
+codec builds records straight from its columns.
+
+Run from backend/: python -m benchmarks.bench_station_codec
+"""
+import json
+import pickle
+import random
+import timeit
+from app.domain.models import StationRecord
+from app.infrastructure.persistence.codecs import StationListCodec
+
+COUNTRIES = [("Germany", "DE", "german"), ("France", "FR", "french"), ("United States", "US", "english"), ("Brazil", "BR", "portuguese")]
+CODECS = ["MP3", "AAC", "AAC+", "OGG"]
+TAGS = ["pop", "rock", "news", "talk", "jazz", "classical", "electronic", "hits", "80s", "local"]
+
+def make_stations(count: int):
+    rng = random.Random(42)
+    stations = []
+    for i in range(count):
+        country, code, language = rng.choice(COUNTRIES)
+        stations.append({
+            "stationuuid": f"{rng.getrandbits(128):032x}",
+            "name": f"Radio {i}",
+            "url": f"http://stream{i}.example.com/live",
+            "url_resolved": f"http://stream{i}.example.com/live.mp3",
+            "homepage": f"https://radio{i}.example.com/",
+            "favicon": None if i % 3 else f"https://radio{i}.example.com/favicon.ico",
+            "country": country,
+            "countrycode": code,
+            "state": "",
+            "city": "",
+            "language": language,
+            "tags": rng.sample(TAGS, rng.randint(0, 4)),
+            "clickcount": rng.randint(0, 50000),
+            "votes": rng.randint(0, 5000),
+            "codec": rng.choice(CODECS),
+            "bitrate": rng.choice([64, 128, 192, 320, None]),
+            "changeuuid": f"{rng.getrandbits(128):032x}",
+        })
+    return stations
+
+def main():
+    codec = StationListCodec()
+    for count in (100, 1000, 10000):
+        # Round-trip through JSON so strings are distinct objects, as they are upstream
+        stations = json.loads(json.dumps(make_stations(count)))
+        pickled = pickle.dumps(stations, protocol=pickle.HIGHEST_PROTOCOL)
+        encoded = codec.encode(stations)
+        assert [s.to_dict() for s in codec.decode(encoded)] == stations
+
+        runs = max(5, 20000 // count)
+        loads_ms = timeit.timeit(lambda: pickle.loads(pickled), number=runs) / runs * 1000
+        pickle_ms = timeit.timeit(lambda: StationRecord.from_cached(pickle.loads(pickled)), number=runs) / runs * 1000
+        codec_ms = timeit.timeit(lambda: StationRecord.from_cached(codec.decode(encoded)), number=runs) / runs * 1000
+        print(
+            f"{count:>6} stations | pickle {len(pickled):>9} B {pickle_ms:7.3f} ms (loads alone {loads_ms:.3f} ms)"
+            f" | codec {len(encoded):>9} B {codec_ms:7.3f} ms"
+            f" | size {len(encoded) / len(pickled):.0%}"
+        )
+        assert codec_ms < pickle_ms, f"codec hit path slower than pickle for {count} stations"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compares the pydantic Station model with the internal StationRecord for
+large station lists: retained memory, re-hydration from cached dicts
+(every cache hit) and dumping back to dicts (every cache write).
+
+Run from backend/: python -m benchmarks.bench_station_records
+"""
+import gc
+import timeit
+import tracemalloc
+from app.domain.models import Station, StationRecord
+from benchmarks.bench_station_codec import make_stations
+
+def retained_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size
+
+def main():
+    for count in (10_000, 50_000):
+        # Cached dicts come back with fresh string objects, as after unpickling/decoding
+        dicts = [{k: (v.encode().decode() if isinstance(v, str) else v) for k, v in d.items()} for d in make_stations(count)]
+        models = [Station(**d) for d in dicts]
+        records = [StationRecord.from_dict(d) for d in dicts]
+
+        model_mem = retained_bytes(lambda: [Station(**d) for d in dicts])
+        record_mem = retained_bytes(lambda: [StationRecord.from_dict(d) for d in dicts])
+        model_load = min(timeit.repeat(lambda: [Station(**d) for d in dicts], number=1, repeat=3))
+        record_load = min(timeit.repeat(lambda: [StationRecord.from_dict(d) for d in dicts], number=1, repeat=3))
+        model_dump = min(timeit.repeat(lambda: [m.model_dump() for m in models], number=1, repeat=3))
+        record_dump = min(timeit.repeat(lambda: [r.to_dict() for r in records], number=1, repeat=3))
+
+        print(f"{count} stations")
+        print(f"  memory    pydantic {model_mem / 1024 / 1024:7.1f} MiB   record {record_mem / 1024 / 1024:7.1f} MiB   ({record_mem / model_mem:.0%})")
+        print(f"  hydrate   pydantic {model_load * 1000:7.1f} ms    record {record_load * 1000:7.1f} ms    ({model_load / record_load:.1f}x faster)")
+        print(f"  to dict   pydantic {model_dump * 1000:7.1f} ms    record {record_dump * 1000:7.1f} ms    ({model_dump / record_dump:.1f}x faster)")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,44 @@
 import PyInstaller.__main__
 import os
+import re
 import shutil
+import subprocess
 import sys
 
+def import_time_report(output_path: str, profile: str = "sidecar", top: int = 40):
+    """
+    Import `app.main` under `python -X importtime` with the given profile and
+    write the slowest modules (cumulative microseconds) to `output_path`.
+    """
+    env = dict(os.environ, APP_PROFILE=profile)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)", line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((int(cumulative_us), int(self_us), len(indent), module))
+
+    # Top-level imports (least indented) add up to the total import cost
+    min_indent = min((row[2] for row in rows), default=0)
+    total_us = sum(row[0] for row in rows if row[2] == min_indent)
+    lines = [
+        f"Import-time report for APP_PROFILE={profile}",
+        f"Total: {total_us / 1000:.1f} ms across {len(rows)} modules",
+        "",
+        f"{'cumulative ms':>14} {'self ms':>9}  module",
+    ]
+    for cumulative_us, self_us, _, module in sorted(rows, reverse=True)[:top]:
+        lines.append(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    print("\n".join(lines[:2]) + f"\nFull report: {output_path}")
+
 def build():
     # Define paths
     script_path = os.path.join("app", "main.py")
@@ -16,11 +52,18 @@ def build():
         shutil.rmtree(build_path)
     
     target = os.getenv("PYINSTALLER_TARGET", sys.platform)
+
+    # Offline station snapshot, shipped inside the bundled app package
+    try:
+        subprocess.run([sys.executable, "build_snapshot.py"], check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Station snapshot not refreshed ({e}); bundling the existing one if any")
     
     # PyInstaller arguments
     # --onefile: self-contained binary for reliable sidecar use
     # --noconsole: no pop-up windows
     # --name: typical sidecar name format for Tauri
+    # --runtime-hook: start in the sidecar profile (stations/releases only, no DB)
     args = [
         script_path,
         "--onefile",
@@ -30,9 +73,16 @@ def build():
         "--add-data", f"app{os.pathsep}app", # Include the app package
         "--hidden-import", "aiosqlite",
         "--hidden-import", "greenlet",
+        "--runtime-hook", "sidecar_hook.py",
     ]
     
     PyInstaller.__main__.run(args)
 
+    # Per-module import cost of what the sidecar actually loads at launch
+    import_time_report(os.path.join(dist_path, f"importtime-{target}.txt"))
+
 if __name__ == "__main__":
-    build()
+    if "--report-only" in sys.argv:
+        import_time_report(os.path.join("dist", "importtime-sidecar.txt"))
+    else:
+        build()
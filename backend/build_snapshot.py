@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import os
+from app.application.services import StationService
+from app.domain.utils import LocationNormalizer
+from app.infrastructure.external.mapper import RadioBrowserMapper
+from app.infrastructure.external.radio_browser import RadioBrowserAdapter
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from app.infrastructure.persistence.snapshot import StationSnapshot
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "data", "station_snapshot.bin")
+CATEGORY_PAGE_SIZE = 24  # Matches the desktop client's category pages
+
+async def collect(radio_repo, category_pages: int = 2, browse_categories: int = 10, top_limit: int = 100) -> dict:
+    """
+    Warm a scratch cache through StationService exactly as the desktop client
+    would on first launch, and return its entries keyed as the service caches them.
+    """
+    scratch = MemoryCacheAdapter()
+    cache = AsyncCacheAdapter(scratch, max_workers=1)
+    service = StationService(radio_repo=radio_repo, cache_repo=cache)
+
+    await service.get_summary_stats()
+    await service.get_top_stations(top_limit)
+
+    for filter_name, fetch in (("country", service.get_countries), ("language", service.get_languages), ("tag", service.get_tags)):
+        categories = []
+        for page in range(category_pages):
+            categories += await fetch(limit=CATEGORY_PAGE_SIZE, offset=page * CATEGORY_PAGE_SIZE)
+        # First browse chunk of the biggest categories
+        for category in sorted(categories, key=lambda c: c.stationcount, reverse=True)[:browse_categories]:
+            await service.search_stations(**{filter_name: category.name}, limit=100)
+
+    await cache.flush()
+    return scratch.items()
+
+async def main(output: str, category_pages: int, browse_categories: int):
+    mapper = RadioBrowserMapper(normalizer=LocationNormalizer())
+    entries = await collect(RadioBrowserAdapter(mapper=mapper), category_pages, browse_categories)
+    if not entries:
+        raise SystemExit("Radio Browser returned nothing; not writing an empty snapshot")
+    StationSnapshot.write(output, entries)
+    print(f"Wrote {len(entries)} entries ({os.path.getsize(output) / 1024:.0f} KiB) to {output}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot top stations, categories and first browse pages for offline use.")
+    parser.add_argument("output", nargs="?", default=DEFAULT_OUTPUT)
+    parser.add_argument("--category-pages", type=int, default=2)
+    parser.add_argument("--browse-categories", type=int, default=10, help="Categories per kind whose first browse page is bundled")
+    args = parser.parse_args()
+    asyncio.run(main(args.output, args.category_pages, args.browse_categories))
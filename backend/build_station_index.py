@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+import os
+from app.domain.utils import LocationNormalizer
+from app.infrastructure.external.mapper import RadioBrowserMapper
+from app.infrastructure.external.radio_browser import RadioBrowserAdapter
+from app.infrastructure.persistence.station_index import StationIndex
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "data", "station_index.bin")
+
+async def fetch_catalog(radio_repo, page_size: int = 10000) -> list:
+    stations, offset = [], 0
+    while True:
+        page = await radio_repo.search_stations(limit=page_size, offset=offset)
+        stations += [s.to_dict() for s in page]
+        if len(page) < page_size:
+            return stations
+        offset += page_size
+
+async def main(output: str, page_size: int):
+    mapper = RadioBrowserMapper(normalizer=LocationNormalizer())
+    stations = await fetch_catalog(RadioBrowserAdapter(mapper=mapper), page_size)
+    if not stations:
+        raise SystemExit("Radio Browser returned no stations; keeping the existing index")
+    # Written to a temp file and renamed, so running workers keep their old mapping
+    StationIndex.write(output, stations)
+    print(f"Indexed {len(stations)} stations ({os.path.getsize(output) / 1024 / 1024:.1f} MiB) into {output}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the memory-mapped station index from the full Radio Browser catalog.")
+    parser.add_argument("output", nargs="?", default=DEFAULT_OUTPUT)
+    parser.add_argument("--page-size", type=int, default=10000)
+    args = parser.parse_args()
+    asyncio.run(main(args.output, args.page_size))
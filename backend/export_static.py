@@ -0,0 +1,15 @@
+import argparse
+import asyncio
+from app.application.static_export import export_static_site
+from app.core.config import settings
+from app.core.database import init_db
+
+async def main(output_dir: str):
+    await init_db()
+    await export_static_site(output_dir)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the landing page and blog into a static directory.")
+    parser.add_argument("output_dir", nargs="?", default=settings.STATIC_EXPORT_DIR or "static_site")
+    args = parser.parse_args()
+    asyncio.run(main(args.output_dir))
@@ -0,0 +1,4 @@
+# PyInstaller runtime hook: the bundled desktop backend runs the sidecar profile
+import os
+
+os.environ.setdefault("APP_PROFILE", "sidecar")
@@ -0,0 +1,83 @@
+import asyncio
+import time
+import pytest
+from app.application.interfaces import IAsyncCacheRepository
+from app.core.metrics import EventLoopLagMonitor
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+
+class SlowCache(MemoryCacheAdapter):
+    """Simulates a slow disk: every call blocks its thread."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.batches = []
+
+    def get(self, key):
+        time.sleep(self.delay)
+        return super().get(key)
+
+    def set_many(self, items):
+        items = list(items)
+        self.batches.append([key for key, _, _ in items])
+        time.sleep(self.delay)
+        super().set_many(items)
+
+@pytest.mark.asyncio
+async def test_writes_are_batched_and_readable_before_flush():
+    backend = SlowCache(delay=0.01)
+    cache = AsyncCacheAdapter(backend)
+
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+
+    await cache.flush()
+    assert backend.batches == [["a", "b"]]
+    assert backend.get("b") == 2
+
+@pytest.mark.asyncio
+async def test_slow_backend_does_not_block_the_event_loop():
+    cache = AsyncCacheAdapter(SlowCache(delay=0.2))
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.gather(*(cache.get(f"k{i}") for i in range(4)))
+    await monitor.stop()
+
+    assert monitor.snapshot()["max_ms"] < 100
+
+@pytest.mark.asyncio
+async def test_pending_writes_reach_disk_at_shutdown(tmp_path, monkeypatch):
+    from app import main
+    from app.infrastructure.persistence.disk_cache import DiskCacheAdapter
+
+    disk = DiskCacheAdapter(cache_dir=str(tmp_path))
+    cache = AsyncCacheAdapter(disk)
+    monkeypatch.setattr(main, "get_cache_repo", lambda: cache)
+
+    async with main.lifespan(main.app):
+        await cache.set("summary_stats", {"stations": 1})
+        assert disk.get("summary_stats") is None
+    assert disk.get("summary_stats") == {"stations": 1}
+
+@pytest.mark.asyncio
+async def test_unbuffered_caches_have_nothing_to_flush():
+    class DictCache(IAsyncCacheRepository):
+        def __init__(self):
+            self.data = {}
+
+        async def get(self, key):
+            return self.data.get(key)
+
+        async def set(self, key, value, expire=None):
+            self.data[key] = value
+
+        async def delete(self, key):
+            self.data.pop(key, None)
+
+        async def clear(self):
+            self.data.clear()
+
+    # flush() is part of the interface, so shutdown can call it on any cache
+    await DictCache().flush()
@@ -46,3 +46,82 @@ async def test_login():
             }
         )
         assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_principal_cache_skips_lookup_until_user_deleted():
+    from app.core.security import principal_cache, create_access_token
+    from app.models.admin_user import AdminUser
+
+    principal_cache.clear()
+    user = AdminUser(id=1, username="cached-editor")
+    principal_cache.put("token-1", user)
+    assert principal_cache.get("token-1") is user
+
+    principal_cache.invalidate_user("cached-editor")
+    assert principal_cache.get("token-1") is None
+
+    # Entries never outlive the token itself
+    principal_cache.put("token-2", user, token_expires_at=0)
+    assert principal_cache.get("token-2") is None
+
+    from app.core.database import AsyncSessionLocal, get_db
+
+    # Record every statement the request sessions run
+    statements = []
+    async def spied_db():
+        async with AsyncSessionLocal() as session:
+            execute = session.execute
+            async def spy(statement, *args, **kwargs):
+                statements.append(str(statement))
+                return await execute(statement, *args, **kwargs)
+            session.execute = spy
+            yield session
+
+    def user_lookups():
+        return [s for s in statements if "FROM admin_users" in s]
+
+    app.dependency_overrides[get_db] = spied_db
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            token = create_access_token({"sub": settings.ADMIN_USERNAME})
+            headers = {"Authorization": f"Bearer {token}"}
+            response = await ac.get(f"{settings.API_V1_STR}/auth/me", headers=headers)
+            assert response.status_code == 200
+            assert principal_cache.get(token).username == settings.ADMIN_USERNAME
+            assert len(user_lookups()) == 1
+
+            # Cache hit: the user comes from the principal cache, not the database
+            response = await ac.get(f"{settings.API_V1_STR}/auth/me", headers=headers)
+            assert response.status_code == 200
+            assert response.json()["username"] == settings.ADMIN_USERNAME
+            assert len(user_lookups()) == 1
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+@pytest.mark.asyncio
+async def test_password_hashing_runs_off_the_event_loop():
+    import asyncio
+    from app.core.security import password_hasher, get_password_hash_async, verify_password_async
+
+    ticks = 0
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(ticker())
+    try:
+        hashed = await get_password_hash_async("s3cret")
+        assert await verify_password_async("s3cret", hashed)
+        assert not await verify_password_async("wrong", hashed)
+    finally:
+        task.cancel()
+
+    # The loop kept running while bcrypt worked on the pool
+    assert ticks > 10
+    stats = password_hasher.stats()
+    assert stats["hash"]["count"] >= 1
+    assert stats["verify"]["count"] >= 2
+    assert stats["in_flight"] == 0
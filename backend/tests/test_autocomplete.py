@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from app.application.autocomplete import AutocompleteIndex, edit_distance
+from app.application.services import StationService
+from app.core.config import settings
+from app.domain.models import Category
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from tests.test_station_service import FakeRadioRepo
+
+LIMITS = {"station": 3, "country": 2}
+
+def make_index() -> AutocompleteIndex:
+    names = [("Radio Paradise", 900), ("BBC Radio 1", 800), ("Rádio Comercial", 500), ("Jazz Radio", 100), ("Radar FM", 50)]
+    return AutocompleteIndex({
+        "station": [(name, popularity, name) for name, popularity in names],
+        "country": [("Germany", 3000, "Germany"), ("Georgia", 40, "Georgia"), ("Portugal", 900, "Portugal")],
+    })
+
+def test_prefixes_rank_by_popularity_and_ignore_accents():
+    index = make_index()
+    assert index.suggest("rad", LIMITS) == {"station": ["Radio Paradise", "BBC Radio 1", "Rádio Comercial"], "country": []}
+    assert index.suggest("radio com", LIMITS)["station"] == ["Rádio Comercial"]
+    assert index.suggest("ge", LIMITS)["country"] == ["Germany", "Georgia"]
+
+def test_typos_are_tolerated_once_prefixes_run_out():
+    index = make_index()
+    assert index.suggest("paradsie", LIMITS)["station"] == ["Radio Paradise"]
+    assert index.suggest("rdio jazz", LIMITS)["station"] == ["Jazz Radio"]
+    assert index.suggest("radoi jazz", LIMITS)["station"] == ["Jazz Radio"]
+    assert index.suggest("portgual", LIMITS)["country"] == ["Portugal"]
+    # Too short to guess at
+    assert index.suggest("xad", LIMITS)["station"] == []
+
+def test_edit_distance_to_words_and_prefixes():
+    assert edit_distance("radoi", "radio", prefix=False) == 1
+    assert edit_distance("paradsie", "paradise", prefix=False) == 1
+    assert edit_distance("raido", "radio", prefix=False) == 1
+    assert edit_distance("kitten", "sitting", prefix=False) == 3
+    assert edit_distance("radi", "radiohead", prefix=True) == 0
+    assert edit_distance("rdio", "radiohead", prefix=True) == 1
+
+@pytest.mark.asyncio
+async def test_global_search_is_answered_locally_once_built():
+    class CategoryRepo(FakeRadioRepo):
+        async def get_countries(self, limit=100, offset=0, name=None):
+            self.search_calls.append(("countries", name, limit, offset))
+            return [Category(name="Germany", stationcount=3000)]
+
+    repo = CategoryRepo(total=50)
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    await service.build_autocomplete()
+    repo.search_calls.clear()
+
+    result = await service.search_global("staton 1")
+    assert [s.stationuuid for s in result.stations][:2] == ["uuid-1", "uuid-10"]
+    assert result.countries == []
+    assert repo.search_calls == []
+
+    # Category matches alone don't answer a query: stations still come from upstream
+    await service.search_global("germ")
+    assert {call[0] for call in repo.search_calls} == {"countries", "germ"}
+
+@pytest.mark.asyncio
+async def test_failed_autocomplete_builds_are_not_installed():
+    class DownRepo(FakeRadioRepo):
+        async def get_top_stations(self, limit=100, offset=0):
+            return [] if self.down else await super().get_top_stations(limit, offset)
+
+    repo = DownRepo(total=50)
+    repo.down = True
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+
+    result = await service.search_global("station 1")
+    await asyncio.wait([service._autocomplete_task])
+    assert len(result.stations) == 20
+    assert service.autocomplete is None
+
+    # Not retried within the retry interval, then retried long before the refresh interval
+    repo.down = False
+    failed = service._autocomplete_task
+    await service.search_global("station 2")
+    assert service._autocomplete_task is failed
+    service._autocomplete_retry_at -= settings.AUTOCOMPLETE_RETRY_INTERVAL
+    await service.search_global("station 3")
+    await service._autocomplete_task
+    assert service.autocomplete is not None
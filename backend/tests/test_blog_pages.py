@@ -0,0 +1,128 @@
+import uuid
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.core.config import settings
+from app.core.database import init_db
+from app.infrastructure.persistence.page_cache import RenderedPageCache
+from app.site import page_cache
+
+@pytest_asyncio.fixture(autouse=True)
+async def lifespan():
+    await init_db()
+    yield
+
+async def auth_headers(ac: AsyncClient) -> dict:
+    response = await ac.post(
+        f"{settings.API_V1_STR}/auth/token",
+        data={"username": settings.ADMIN_USERNAME, "password": settings.ADMIN_PASSWORD}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.mark.asyncio
+async def test_post_pages_are_cached_and_invalidated_on_write():
+    slug = f"cache-test-{uuid.uuid4().hex[:8]}"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        headers = await auth_headers(ac)
+        response = await ac.post(f"{settings.API_V1_STR}/blog/", headers=headers, json={
+            "title": "Cache Test", "slug": slug, "content": "# Hello\n\nFirst version", "is_published": True
+        })
+        post_id = response.json()["id"]
+        assert response.json()["excerpt"] == "Hello First version"
+        assert response.json()["reading_time"] == 1
+
+        try:
+            response = await ac.get(f"/blog/{slug}", headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200
+            assert response.headers["content-encoding"] == "gzip"
+            assert "First version" in response.text
+            etag = response.headers["etag"]
+            assert etag.endswith('-gzip"')
+
+            # The identity representation revalidates against the gzip one, under its own ETag
+            response = await ac.get(f"/blog/{slug}", headers={"If-None-Match": etag, "Accept-Encoding": "identity"})
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag[:-len('-gzip"')] + '"'
+
+            await ac.patch(f"{settings.API_V1_STR}/blog/{post_id}", headers=headers, json={
+                "content": "# Hello\n\nSecond version"
+            })
+            response = await ac.get(f"/blog/{slug}", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert "Second version" in response.text
+        finally:
+            await ac.delete(f"{settings.API_V1_STR}/blog/{post_id}", headers=headers)
+
+        response = await ac.get(f"/blog/{slug}")
+        assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_summaries_use_keyset_pagination():
+    prefix = f"summary-test-{uuid.uuid4().hex[:8]}"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        headers = await auth_headers(ac)
+        ids = []
+        for i in range(3):
+            response = await ac.post(f"{settings.API_V1_STR}/blog/", headers=headers, json={
+                "title": f"Post {i}", "slug": f"{prefix}-{i}", "content": "Body " * 50, "is_published": True
+            })
+            ids.append(response.json()["id"])
+
+        try:
+            response = await ac.get(f"{settings.API_V1_STR}/blog/summaries", params={"limit": 2})
+            page = response.json()
+            assert [item["slug"] for item in page["items"]] == [f"{prefix}-2", f"{prefix}-1"]
+            assert "content" not in page["items"][0]
+            assert page["items"][0]["author_name"] == settings.ADMIN_USERNAME
+            assert page["items"][0]["excerpt"].startswith("Body Body")
+
+            response = await ac.get(f"{settings.API_V1_STR}/blog/summaries", params={"limit": 2, "cursor": page["next_cursor"]})
+            assert response.json()["items"][0]["slug"] == f"{prefix}-0"
+
+            response = await ac.get(f"{settings.API_V1_STR}/blog/summaries", params={"cursor": "not-a-cursor"})
+            assert response.status_code == 400
+
+            response = await ac.get("/blog")
+            assert response.status_code == 200
+            assert f"/blog/{prefix}-2" in response.text
+
+            cached = len(page_cache)
+            response = await ac.get("/blog", params={"cursor": "not-a-cursor"})
+            assert response.status_code == 400
+            response = await ac.get("/blog", params={"cursor": page["next_cursor"]})
+            assert response.status_code == 200
+            # Only the first page is cached
+            assert len(page_cache) == cached
+        finally:
+            for post_id in ids:
+                await ac.delete(f"{settings.API_V1_STR}/blog/{post_id}", headers=headers)
+
+def test_page_cache_is_bounded_and_drops_expired_pages():
+    cache = RenderedPageCache(ttl=300, max_pages=2)
+    cache.put("a", "<p>a</p>")
+    cache.put("b", "<p>b</p>")
+    assert cache.get("a") is not None
+    cache.put("c", "<p>c</p>")
+    # "b" was least recently used
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.ttl = 0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+@pytest.mark.asyncio
+async def test_host_header_does_not_key_cached_pages():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        await ac.get("/blog")
+        cached = len(page_cache)
+        for i in range(5):
+            response = await ac.get("/blog", headers={"Host": f"evil-{i}.example"})
+            assert response.status_code == 200
+            assert "evil-" not in response.text
+            assert settings.SITE_URL in response.text
+        assert len(page_cache) == cached
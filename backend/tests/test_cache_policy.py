@@ -0,0 +1,40 @@
+from app.infrastructure.persistence.cache_policy import TinyLFUCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+
+def test_browse_keys_need_reuse_before_admission():
+    backend = MemoryCacheAdapter()
+    cache = TinyLFUCacheAdapter(backend, capacity=10, admission_threshold=2)
+
+    assert cache.get("browse_Germany") is None
+    cache.set("browse_Germany", [1])
+    assert backend.get("browse_Germany") is None
+
+    assert cache.get("browse_Germany") is None
+    cache.set("browse_Germany", [1])
+    assert cache.get("browse_Germany") == [1]
+
+    # Non-gated families are written straight through
+    cache.set("top_100_v2", [2])
+    assert backend.get("top_100_v2") == [2]
+
+def test_eviction_prefers_popular_keys_and_reports_hit_rates():
+    backend = MemoryCacheAdapter()
+    cache = TinyLFUCacheAdapter(backend, capacity=2, admission_threshold=1)
+
+    for _ in range(5):
+        cache.get("browse_hot")
+    cache.set("browse_hot", "hot")
+    cache.get("browse_warm")
+    cache.set("browse_warm", "warm")
+    cache.get("browse_cold")
+    cache.set("browse_cold", "cold")
+
+    assert backend.get("browse_hot") == "hot"
+    assert backend.get("browse_warm") is None
+    assert backend.get("browse_cold") == "cold"
+
+    cache.get("browse_hot")
+    stats = cache.stats()
+    assert stats["browse"]["hits"] == 1
+    assert stats["browse"]["evicted"] == 1
+    assert 0 < stats["browse"]["hit_rate"] < 1
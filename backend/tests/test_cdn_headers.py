@@ -0,0 +1,170 @@
+import re
+import time
+import uuid
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from app.api.v1.endpoints import admin as admin_endpoint
+from app.api.v1.endpoints import blog as blog_endpoint
+from app.api.v1.endpoints import stations as stations_endpoint
+from app.application.services import StationService
+from app.core.cdn import CdnPurger, surrogate_key
+from app.core.config import settings
+from app.core.database import init_db
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from app.main import app
+from tests.test_station_service import FakeRadioRepo
+
+class CachingProxy:
+    """
+    Local stand-in for the CDN: caches public GET responses for their
+    s-maxage, indexes them by Surrogate-Key and purges them on POST /purge.
+    """
+
+    def __init__(self, upstream):
+        self.upstream = AsyncClient(transport=ASGITransport(app=upstream), base_url="http://origin")
+        self.entries = {}
+        self.purged = []
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        if request.method == "POST" and request.url.path == "/purge":
+            keys = set((await request.json())["surrogate_keys"])
+            self.purged.extend(sorted(keys))
+            self.entries = {k: e for k, e in self.entries.items() if not keys & e["keys"]}
+            response = JSONResponse({"status": "purged"})
+        else:
+            response = await self._fetch(request)
+        await response(scope, receive, send)
+
+    async def _fetch(self, request: Request) -> Response:
+        cache_key = str(request.url.replace(scheme="http", netloc="origin"))
+        entry = self.entries.get(cache_key)
+        if request.method == "GET" and entry and time.monotonic() < entry["expires"]:
+            return Response(entry["body"], headers={**entry["headers"], "X-Cache": "HIT"})
+
+        upstream = await self.upstream.request(request.method, cache_key, content=await request.body(), headers={
+            k: v for k, v in request.headers.items() if k not in ("host", "accept-encoding")
+        })
+        headers = {k: v for k, v in upstream.headers.items() if k not in ("content-length", "content-encoding")}
+        shared_max_age = re.search(r"s-maxage=(\d+)", upstream.headers.get("cache-control", ""))
+        if request.method == "GET" and upstream.status_code == 200 and shared_max_age:
+            self.entries[cache_key] = {
+                "body": upstream.content,
+                "headers": headers,
+                "keys": set(upstream.headers.get("surrogate-key", "").split()),
+                "expires": time.monotonic() + int(shared_max_age.group(1)),
+            }
+        return Response(upstream.content, status_code=upstream.status_code, headers={**headers, "X-Cache": "MISS"})
+
+class CountingRepo(FakeRadioRepo):
+    def __init__(self, total: int = 600):
+        super().__init__(total)
+        self.top_calls = 0
+
+    async def get_top_stations(self, limit=100, offset=0):
+        self.top_calls += 1
+        return await super().get_top_stations(limit, offset)
+
+@pytest_asyncio.fixture
+async def cdn(monkeypatch):
+    proxy = CachingProxy(app)
+    purger = CdnPurger(url="http://cdn/purge", transport=ASGITransport(app=proxy))
+    monkeypatch.setattr(admin_endpoint, "cdn_purger", purger)
+    monkeypatch.setattr(blog_endpoint, "cdn_purger", purger)
+    async with AsyncClient(transport=ASGITransport(app=proxy), base_url="http://cdn") as ac:
+        yield proxy, ac
+    await proxy.upstream.aclose()
+
+def test_surrogate_keys_are_header_safe():
+    assert surrogate_key("browse", "country", "United States") == "browse:country:united%20states"
+    assert surrogate_key("featured", "Europe") == "featured:europe"
+
+@pytest.mark.asyncio
+async def test_station_lists_are_served_by_the_cdn_until_flushed(cdn, monkeypatch):
+    proxy, ac = cdn
+    repo = CountingRepo()
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    monkeypatch.setattr(stations_endpoint, "station_service", service)
+
+    first = await ac.get(f"{settings.API_V1_STR}/stations/top?limit=5")
+    assert first.headers["x-cache"] == "MISS"
+    assert "s-maxage=%d" % settings.CACHE_TTL in first.headers["cache-control"]
+    assert "stale-while-revalidate=" in first.headers["cache-control"]
+    assert "stale-if-error=" in first.headers["cache-control"]
+    assert first.headers["surrogate-key"] == "stations top"
+
+    again = await ac.get(f"{settings.API_V1_STR}/stations/top?limit=5")
+    assert again.headers["x-cache"] == "HIT"
+    assert again.json() == first.json()
+    assert repo.top_calls == 1
+
+    browse = await ac.get(f"{settings.API_V1_STR}/stations/search?country=Germany&limit=5")
+    assert "browse:country:germany" in browse.headers["surrogate-key"].split()
+    stats = await ac.get(f"{settings.API_V1_STR}/stations/cache/stats")
+    assert stats.headers["cache-control"] == "no-store"
+
+    # Anyone may flush the origin cache, but only an admin purges the CDN
+    await ac.post(f"{settings.API_V1_STR}/stations/cache/flush")
+    assert proxy.purged == []
+    assert (await ac.get(f"{settings.API_V1_STR}/stations/top?limit=5")).headers["x-cache"] == "HIT"
+
+    await init_db()
+    assert (await ac.post(f"{settings.API_V1_STR}/admin/cache/purge")).status_code == 401
+    assert proxy.purged == []
+    response = await ac.post(
+        f"{settings.API_V1_STR}/auth/token",
+        data={"username": settings.ADMIN_USERNAME, "password": settings.ADMIN_PASSWORD}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    monkeypatch.setattr(admin_endpoint, "station_service", service)
+    await ac.post(f"{settings.API_V1_STR}/admin/cache/purge", headers=headers)
+    assert proxy.purged == ["stations"]
+    assert not proxy.entries
+
+    refreshed = await ac.get(f"{settings.API_V1_STR}/stations/top?limit=5")
+    assert refreshed.headers["x-cache"] == "MISS"
+    assert repo.top_calls == 2
+
+@pytest.mark.asyncio
+async def test_blog_writes_purge_cached_pages(cdn):
+    await init_db()
+    proxy, ac = cdn
+    slug = f"cdn-test-{uuid.uuid4().hex[:8]}"
+    response = await ac.post(
+        f"{settings.API_V1_STR}/auth/token",
+        data={"username": settings.ADMIN_USERNAME, "password": settings.ADMIN_PASSWORD}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await ac.post(f"{settings.API_V1_STR}/blog/", headers=headers, json={
+        "title": "CDN Test", "slug": slug, "content": "First version", "is_published": True
+    })
+    post_id = response.json()["id"]
+
+    try:
+        page = await ac.get(f"/blog/{slug}")
+        assert page.headers["x-cache"] == "MISS"
+        assert set(page.headers["surrogate-key"].split()) == {"blog", f"post:{slug}"}
+        assert (await ac.get(f"/blog/{slug}")).headers["x-cache"] == "HIT"
+
+        drafts = await ac.get(f"{settings.API_V1_STR}/blog/?published_only=false")
+        assert drafts.headers["cache-control"] == "no-store"
+
+        await ac.patch(f"{settings.API_V1_STR}/blog/{post_id}", headers=headers, json={"content": "Second version"})
+        assert "blog" in proxy.purged
+        page = await ac.get(f"/blog/{slug}")
+        assert page.headers["x-cache"] == "MISS"
+        assert "Second version" in page.text
+
+        # A post taken back to draft is never publicly cacheable
+        await ac.patch(f"{settings.API_V1_STR}/blog/{post_id}", headers=headers, json={"is_published": False})
+        api = await ac.get(f"{settings.API_V1_STR}/blog/{slug}")
+        assert api.headers["cache-control"] == "no-store"
+        page = await ac.get(f"/blog/{slug}")
+        assert page.headers["cache-control"] == "no-store"
+        assert page.headers["x-cache"] == "MISS"
+    finally:
+        await ac.delete(f"{settings.API_V1_STR}/blog/{post_id}", headers=headers)
@@ -0,0 +1,83 @@
+import gzip
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient, ASGITransport
+from app.core.http import ConditionalResponseMiddleware
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ConditionalResponseMiddleware, path_prefix="/api/v1/stations/", minimum_size=256)
+    payload = {"items": [{"name": f"Station {i}", "country": "Germany"} for i in range(50)]}
+
+    @app.get("/api/v1/stations/top")
+    async def top():
+        return payload
+
+    @app.get("/api/v1/stations/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/api/v1/stations/missing")
+    async def missing():
+        return StreamingResponse(iter([b"{}"]), status_code=404, media_type="application/json")
+
+    @app.get("/api/v1/stations/stream")
+    async def stream():
+        return StreamingResponse(iter([b'{"a":1}\n', b'{"a":2}\n']), media_type="application/x-ndjson")
+
+    @app.get("/api/v1/other")
+    async def other():
+        return payload
+
+    return app
+
+@pytest.mark.asyncio
+async def test_large_lists_are_compressed_and_revalidated():
+    transport = ASGITransport(app=make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        plain = await ac.get("/api/v1/stations/top", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["etag"].startswith('"') and "-" not in plain.headers["etag"]
+
+        zipped = await ac.get("/api/v1/stations/top", headers={"Accept-Encoding": "gzip"})
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+        assert "Accept-Encoding" in zipped.headers["vary"]
+        assert json.loads(zipped.content) == plain.json()  # httpx decodes gzip transparently
+        assert int(zipped.headers["content-length"]) < len(plain.content)
+
+        again = await ac.get(
+            "/api/v1/stations/top",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["etag"]}
+        )
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == zipped.headers["etag"]
+
+@pytest.mark.asyncio
+async def test_small_error_streaming_and_other_routes_are_left_alone():
+    transport = ASGITransport(app=make_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        small = await ac.get("/api/v1/stations/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers and "etag" in small.headers
+
+        missing = await ac.get("/api/v1/stations/missing", headers={"Accept-Encoding": "gzip"})
+        assert missing.status_code == 404 and "etag" not in missing.headers
+
+        stream = await ac.get("/api/v1/stations/stream", headers={"Accept-Encoding": "gzip"})
+        assert stream.text == '{"a":1}\n{"a":2}\n'
+        assert "etag" not in stream.headers and "content-encoding" not in stream.headers
+
+        other = await ac.get("/api/v1/other", headers={"Accept-Encoding": "gzip"})
+        assert "etag" not in other.headers
+
+def test_compressed_bodies_are_reused():
+    middleware = ConditionalResponseMiddleware(app=None, path_prefix="/", compressed_cache_size=1)
+    body = b"x" * 4096
+    first = middleware._compress("a", "gzip", body)
+    assert middleware._compress("a", "gzip", b"ignored") is first
+    assert gzip.decompress(first) == body
+    middleware._compress("b", "gzip", body)
+    assert ("a", "gzip") not in middleware._compressed
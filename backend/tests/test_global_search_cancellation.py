@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.api.v1.endpoints import stations as stations_endpoint
+from app.application.services import StationService
+from app.core.concurrency import ClientGate, Superseded
+from app.core.config import settings
+from app.core.http import ClientDisconnected, cancel_on_disconnect
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from app.main import app
+from tests.test_station_service import FakeRadioRepo, make_station
+
+class NamedRepo(FakeRadioRepo):
+    """Matches station names by substring, as Radio Browser does."""
+
+    def __init__(self, names):
+        super().__init__(total=0)
+        self.catalog = [make_station(i) for i in range(len(names))]
+        for station, name in zip(self.catalog, names):
+            station.name = name
+
+    async def search_stations(self, name=None, country=None, countrycode=None, language=None, tag=None, limit=100, offset=0):
+        self.search_calls.append((name, country, limit, offset))
+        matches = [s for s in self.catalog if name.casefold() in s.name.casefold()]
+        return matches[offset:offset + limit]
+
+def make_service(repo) -> StationService:
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    # Exercise the upstream path only: no local autocomplete index
+    service._schedule_autocomplete_build = lambda: None
+    return service
+
+def station_queries(repo):
+    return [call[0] for call in repo.search_calls]
+
+@pytest.mark.asyncio
+async def test_newer_call_supersedes_the_one_in_flight():
+    gate = ClientGate(max_concurrent=1, debounce=0.01)
+    started = []
+
+    async def work(query):
+        started.append(query)
+        await asyncio.sleep(0.05)
+        return query
+
+    first = asyncio.create_task(gate.run("tab", lambda: work("ra")))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(gate.run("tab", lambda: work("rad")))
+    other = asyncio.create_task(gate.run("other-tab", lambda: work("jazz")))
+
+    with pytest.raises(Superseded):
+        await first
+    assert await second == "rad"
+    assert await other == "jazz"
+    # Debounced: the superseded call never reached upstream
+    assert started == ["rad", "jazz"]
+    assert gate.stats() == {"clients": 0, "in_flight": 0, "superseded": 1}
+
+@pytest.mark.asyncio
+async def test_work_is_cancelled_when_the_client_disconnects():
+    disconnected = asyncio.Event()
+    cancelled = []
+
+    class FakeRequest:
+        async def receive(self):
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+    async def upstream():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    waiting = asyncio.create_task(cancel_on_disconnect(FakeRequest(), upstream()))
+    await asyncio.sleep(0.01)
+    disconnected.set()
+    with pytest.raises(ClientDisconnected):
+        await waiting
+    assert cancelled == [True]
+
+    assert await cancel_on_disconnect(FakeRequest(), asyncio.sleep(0, result="done")) == "done"
+
+@pytest.mark.asyncio
+async def test_longer_queries_reuse_complete_shorter_results():
+    repo = NamedRepo(["Radio Paradise", "Radar FM", "Jazz Radio", "BBC Radio 1"])
+    service = make_service(repo)
+
+    first = await service.search_global("rad")
+    assert [s.name for s in first.stations] == ["Radio Paradise", "Radar FM", "Jazz Radio", "BBC Radio 1"]
+
+    second = await service.search_global("radi")
+    assert [s.name for s in second.stations] == ["Radio Paradise", "Jazz Radio", "BBC Radio 1"]
+    assert station_queries(repo) == ["rad"]
+
+    # "bbc" shares no prefix with earlier queries
+    await service.search_global("bbc")
+    assert station_queries(repo) == ["rad", "bbc"]
+
+@pytest.mark.asyncio
+async def test_truncated_results_are_fetched_again():
+    repo = NamedRepo([f"Radio {i}" for i in range(30)])
+    service = make_service(repo)
+
+    await service.search_global("rad")
+    result = await service.search_global("radio 2")
+    # "rad" hit the 20-station limit, so "Radio 2x" stations may have been cut off
+    assert station_queries(repo) == ["rad", "radio 2"]
+    assert len(result.stations) == 11
+
+@pytest.mark.asyncio
+async def test_superseded_requests_get_an_uncached_empty_result(monkeypatch):
+    repo = NamedRepo(["Radio Paradise"])
+    service = make_service(repo)
+    monkeypatch.setattr(stations_endpoint, "station_service", service)
+    url = f"{settings.API_V1_STR}/stations/global-search"
+    headers = {"X-Client-Id": "tab-1"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        older, newer = await asyncio.gather(
+            ac.get(url, params={"query": "rad"}, headers=headers),
+            ac.get(url, params={"query": "radio"}, headers=headers),
+        )
+
+    assert older.json() == {"countries": [], "languages": [], "tags": [], "stations": [], "locations": []}
+    assert older.headers["cache-control"] == "no-store"
+    assert [s["name"] for s in newer.json()["stations"]] == ["Radio Paradise"]
+    assert "s-maxage" in newer.headers["cache-control"]
+    assert station_queries(repo) == ["radio"]
@@ -0,0 +1,109 @@
+import socketserver
+import threading
+import pytest
+from app.infrastructure.persistence.codecs import StationListCodec
+from app.infrastructure.persistence.redis_cache import RedisCacheAdapter, RedisError, RespConnection
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """Tiny local stand-in for a Redis server (GET/SET/DEL/INCR only)."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), RespHandler)
+        self.data = {}
+        self.lock = threading.Lock()
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        store = self.server.data
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            with self.server.lock:
+                if name == b"GET":
+                    value = store.get(args[1])
+                    reply = b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+                elif name == b"SET":
+                    store[args[1]] = args[2]
+                    reply = b"+OK\r\n"
+                elif name == b"DEL":
+                    reply = b":%d\r\n" % (1 if store.pop(args[1], None) is not None else 0)
+                elif name == b"INCR":
+                    value = int(store.get(args[1], b"0")) + 1
+                    store[args[1]] = str(value).encode()
+                    reply = b":%d\r\n" % value
+                else:
+                    reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+@pytest.fixture
+def redis_url():
+    server = RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+def test_workers_share_entries_and_flushes(redis_url):
+    worker_a = RedisCacheAdapter(redis_url, generation_ttl=0, codec=StationListCodec())
+    worker_b = RedisCacheAdapter(redis_url, generation_ttl=0, codec=StationListCodec())
+
+    worker_a.set("summary_stats", {"stations": 10}, expire=60)
+    worker_a.set_many([("countries_24_0_all", [{"name": "Germany", "stationcount": 3}], 60)])
+    assert worker_b.get("summary_stats") == {"stations": 10}
+    assert worker_b.get("countries_24_0_all") == [{"name": "Germany", "stationcount": 3}]
+
+    worker_b.clear()
+    assert worker_a.get("summary_stats") is None
+
+    worker_a.set("summary_stats", {"stations": 11})
+    assert worker_b.get("summary_stats") == {"stations": 11}
+    worker_b.delete("summary_stats")
+    assert worker_a.get("summary_stats") is None
+
+def test_namespaces_are_isolated_and_outages_are_misses(redis_url):
+    app_cache = RedisCacheAdapter(redis_url, namespace="radiolite")
+    other_cache = RedisCacheAdapter(redis_url, namespace="staging")
+    app_cache.set("top_100_v2", [1])
+    assert other_cache.get("top_100_v2") is None
+
+    unreachable = RedisCacheAdapter("redis://127.0.0.1:1/0")
+    assert unreachable.get("top_100_v2") is None
+    unreachable.set("top_100_v2", [1])
+
+def test_error_replies_do_not_leave_replies_unread(redis_url):
+    connection = RespConnection(redis_url)
+    connection.execute("SET", "a", "1")
+    connection.execute("SET", "b", "2")
+    with pytest.raises(RedisError):
+        connection.pipeline([("GET", "a"), ("BOGUS",), ("GET", "a")])
+    # The next command gets its own reply, not one left over from the pipeline
+    assert connection.execute("GET", "b") == b"2"
+    connection.close()
+
+def test_undecodable_entries_are_misses(redis_url):
+    cache = RedisCacheAdapter(redis_url, codec=StationListCodec())
+    cache.set("top_100_v2", [1])
+    connection = RespConnection(redis_url)
+    connection.execute("SET", cache._key("top_100_v2"), b"\x80\x05not a pickle")
+    connection.execute("SET", cache._key("browse_chunk0"), StationListCodec.MAGIC + b"truncated")
+    connection.close()
+
+    assert cache.get("top_100_v2") is None
+    assert cache.get("browse_chunk0") is None
+    cache.set("top_100_v2", [2])
+    assert cache.get("top_100_v2") == [2]
@@ -0,0 +1,184 @@
+import json
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.core.config import settings
+from app.application.releases import ReleaseService
+from app.api.v1.endpoints import releases as releases_endpoint
+
+RELEASE = {
+    "tag_name": "v1.2.0",
+    "body": "Notes",
+    "published_at": "2026-01-01T00:00:00Z",
+    "assets": [
+        {"id": 1, "name": "latest.json", "size": 10},
+        {"id": 2, "name": "Radiolite.dmg", "size": 100},
+    ],
+}
+
+class FakeGitHubAdapter:
+    def __init__(self):
+        self.release_calls = []
+        self.content_calls = 0
+        self.latest = RELEASE
+
+    async def fetch_latest_release(self, etag=None):
+        self.release_calls.append(etag)
+        if etag == '"r1"':
+            return None, etag
+        return self.latest, '"r1"'
+
+    async def get_asset_content(self, asset_id):
+        self.content_calls += 1
+        return json.dumps({"version": "1.2.0", "platforms": {"darwin-aarch64": {}}})
+
+    async def get_asset_redirect(self, asset_id):
+        return f"https://objects.example.com/{asset_id}"
+
+@pytest.mark.asyncio
+async def test_manifest_is_cached_and_revalidated_with_etag():
+    github = FakeGitHubAdapter()
+    service = ReleaseService(github, refresh_interval=3600)
+
+    first = await service.get_latest_release()
+    second = await service.get_latest_release()
+    assert first == second
+    assert first["tag_name"] == "v1.2.0"
+    assert first["assets"][0]["name"] == "Radiolite.dmg"
+    assert github.release_calls == [None]
+    assert github.content_calls == 1
+
+    # A stale manifest triggers a conditional request that GitHub answers with 304
+    service.refresh_interval = 0
+    await service.get_latest_release()
+    await service._refresh_task
+    assert github.release_calls == [None, '"r1"']
+    assert github.content_calls == 1
+
+@pytest.mark.asyncio
+async def test_latest_endpoint_supports_if_none_match(monkeypatch):
+    monkeypatch.setattr(releases_endpoint, "release_service", ReleaseService(FakeGitHubAdapter()))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get(f"{settings.API_V1_STR}/releases/latest")
+        assert response.status_code == 200
+        assert response.json()["version"] == "1.2.0"
+        etag = response.headers["etag"]
+
+        response = await ac.get(f"{settings.API_V1_STR}/releases/latest", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+def test_signed_url_expiry_formats():
+    from app.application.releases import signed_url_expiry
+    assert signed_url_expiry(
+        "https://objects.example.com/a?X-Amz-Date=20260101T000000Z&X-Amz-Expires=300&X-Amz-Signature=x"
+    ) == 1767225600 + 300
+    assert signed_url_expiry("https://cdn.example.com/a?Expires=1767225900") == 1767225900
+    assert signed_url_expiry("https://blob.example.com/a?sv=2025&se=2026-01-01T00%3A05%3A00Z&sig=x") == 1767225900
+    assert signed_url_expiry("https://example.com/a") is None
+
+@pytest.mark.asyncio
+async def test_download_redirects_are_cached_and_coalesced():
+    import asyncio
+    import time
+    from datetime import datetime, timezone
+
+    class SlowGitHub(FakeGitHubAdapter):
+        def __init__(self):
+            super().__init__()
+            self.redirect_calls = 0
+
+        async def get_asset_redirect(self, asset_id):
+            self.redirect_calls += 1
+            await asyncio.sleep(0.01)
+            signed_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            return f"https://objects.example.com/{asset_id}?X-Amz-Date={signed_at}&X-Amz-Expires=300"
+
+    github = SlowGitHub()
+    service = ReleaseService(github)
+    urls = await asyncio.gather(*(service.get_download_url(7) for _ in range(10)))
+    assert len(set(urls)) == 1
+    assert github.redirect_calls == 1
+
+    await service.get_download_url(7)
+    assert github.redirect_calls == 1
+
+    # Past the refresh margin the URL is re-resolved
+    url, _ = service._redirects[7]
+    service._redirects[7] = (url, time.time() - 1)
+    await service.get_download_url(7)
+    assert github.redirect_calls == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_refresh():
+    import asyncio
+
+    class SlowGitHub(FakeGitHubAdapter):
+        async def fetch_latest_release(self, etag=None):
+            await asyncio.sleep(0.01)
+            return await super().fetch_latest_release(etag)
+
+    service = ReleaseService(SlowGitHub())
+    first = asyncio.create_task(service.get_latest_release())
+    second = asyncio.create_task(service.get_latest_release())
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)["tag_name"] == "v1.2.0"
+    assert first.cancelled()
+    assert not service._refresh_task.cancelled()
+
+def signed(body: bytes, secret: str) -> str:
+    import hashlib
+    import hmac
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+@pytest.mark.asyncio
+async def test_release_webhook_rebuilds_manifest(monkeypatch):
+    secret = "test-webhook-secret"
+    monkeypatch.setattr(settings, "GITHUB_WEBHOOK_SECRET", secret)
+    github = FakeGitHubAdapter()
+    service = ReleaseService(github, refresh_interval=86400)
+    monkeypatch.setattr(releases_endpoint, "release_service", service)
+    await service.get_latest_release()
+
+    new_release = {**RELEASE, "tag_name": "v1.3.0", "draft": False, "prerelease": False}
+    url = f"{settings.API_V1_STR}/releases/webhook"
+
+    async def deliver(ac, action, release, secret=secret):
+        body = json.dumps({"action": action, "release": release}).encode()
+        return await ac.post(url, content=body, headers={
+            "X-GitHub-Event": "release", "X-Hub-Signature-256": signed(body, secret)
+        })
+
+    async def latest_tag(ac):
+        return (await ac.get(f"{settings.API_V1_STR}/releases/latest")).json()["tag_name"]
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        assert (await deliver(ac, "released", new_release, secret="wrong-secret")).status_code == 401
+
+        response = await ac.post(url, content=b"{not json", headers={
+            "X-GitHub-Event": "release", "X-Hub-Signature-256": signed(b"{not json", secret)
+        })
+        assert response.status_code == 400
+
+        # GitHub sends "published" and then "released" for the same release: only the latter applies it
+        assert (await deliver(ac, "published", new_release)).json() == {"status": "ignored"}
+        assert await latest_tag(ac) == "v1.2.0"
+        assert (await deliver(ac, "released", new_release)).status_code == 202
+        assert await latest_tag(ac) == "v1.3.0"
+        assert github.release_calls == [None]
+
+        # A backport published after it is checked against GitHub instead of replacing it
+        github.latest = new_release
+        backport = {**new_release, "tag_name": "v1.2.1"}
+        assert (await deliver(ac, "released", backport)).status_code == 202
+        assert await latest_tag(ac) == "v1.3.0"
+        assert github.release_calls == [None, None]
+
+def test_version_keys_order_release_tags():
+    from app.application.releases import version_key
+    assert version_key("v1.10.0") > version_key("v1.9.3") > version_key("1.9")
+    assert version_key("v2.0.0-beta.1") == (2, 0, 0)
+    assert version_key("nightly") is None
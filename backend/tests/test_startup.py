@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import select, update
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, init_db, startup_report, schema_fingerprint, schema_version
+from app.models.admin_user import AdminUser
+
+async def _admin_hash() -> str:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(AdminUser.hashed_password).where(AdminUser.username == settings.ADMIN_USERNAME))
+        return result.scalar_one()
+
+@pytest.mark.asyncio
+async def test_second_boot_skips_schema_sync_and_rehash():
+    await init_db()
+    first_hash = await _admin_hash()
+
+    await init_db()
+    assert startup_report["schema"] == "current"
+    assert startup_report["superadmin"] == "unchanged"
+    assert await _admin_hash() == first_hash
+    assert {"init_db_ms", "schema_ms", "seed_ms"} <= startup_report.keys()
+
+@pytest.mark.asyncio
+async def test_stale_fingerprint_and_changed_password_are_resynced():
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(schema_version).values(fingerprint="outdated"))
+        await db.execute(
+            update(AdminUser).where(AdminUser.username == settings.ADMIN_USERNAME).values(hashed_password="$2b$12$" + "x" * 53)
+        )
+        await db.commit()
+
+    await init_db()
+    assert startup_report["schema"] == "synced"
+    assert startup_report["superadmin"] == "updated"
+    async with AsyncSessionLocal() as db:
+        stored = (await db.execute(select(schema_version.c.fingerprint))).scalar_one()
+    assert stored == schema_fingerprint()
+
+def test_sidecar_profile_skips_website_admin_and_database():
+    import json
+    import os
+    import subprocess
+    import sys
+
+    script = (
+        "import json, sys; from app.main import app, USE_DATABASE;"
+        "print(json.dumps({'db': USE_DATABASE, 'paths': list(app.openapi()['paths']),"
+        "'loaded': [m for m in ('jinja2', 'passlib', 'jose', 'sqlalchemy', 'app.core.database', 'app.site') if m in sys.modules]}))"
+    )
+    env = dict(os.environ, APP_PROFILE="sidecar")
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert report["db"] is False
+    assert report["loaded"] == []
+    assert f"{settings.API_V1_STR}/stations/featured" in report["paths"]
+    assert f"{settings.API_V1_STR}/releases/latest" in report["paths"]
+    assert not any(path.startswith((f"{settings.API_V1_STR}/blog", f"{settings.API_V1_STR}/auth")) for path in report["paths"])
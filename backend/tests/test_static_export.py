@@ -0,0 +1,86 @@
+import os
+import pytest
+import pytest_asyncio
+from app.application.static_export import StaticSiteExporter
+from app.core.database import AsyncSessionLocal, init_db
+from sqlalchemy import func, select
+from app.models.blog import BlogPost
+
+@pytest_asyncio.fixture(autouse=True)
+async def lifespan():
+    await init_db()
+    yield
+
+@pytest.mark.asyncio
+async def test_export_is_complete_and_incremental(tmp_path):
+    output = str(tmp_path)
+    async with AsyncSessionLocal() as db:
+        post = BlogPost(title="Static Test", slug="static-export-test", content="Hello **static**", is_published=True)
+        db.add(post)
+        await db.commit()
+
+        try:
+            exporter = StaticSiteExporter(output, site_url="https://example.com")
+            first = await exporter.export(db)
+            assert first["written"] == first["files"]
+
+            for rel in ("index.html", "blog/index.html", "blog/static-export-test/index.html", "static/style.css"):
+                assert os.path.exists(os.path.join(output, rel))
+            assert os.path.exists(os.path.join(output, "blog/static-export-test/index.html.gz"))
+            with open(os.path.join(output, "sitemap.xml")) as f:
+                assert "https://example.com/blog/static-export-test" in f.read()
+            with open(os.path.join(output, "index.html")) as f:
+                assert "/static/style.css" in f.read()
+
+            second = await exporter.export(db)
+            assert second["written"] == 0
+
+            await db.delete(post)
+            await db.commit()
+            third = await exporter.export(db)
+            assert third["removed"] == 1
+            assert not os.path.exists(os.path.join(output, "blog/static-export-test/index.html"))
+        finally:
+            if await db.get(BlogPost, post.id):
+                await db.delete(post)
+                await db.commit()
+
+@pytest.mark.asyncio
+async def test_blog_index_is_paginated_like_the_site(tmp_path):
+    output = str(tmp_path)
+    async with AsyncSessionLocal() as db:
+        posts = [
+            BlogPost(title=f"Paged {i}", slug=f"static-paged-{i}", content="Body", is_published=True)
+            for i in range(3)
+        ]
+        db.add_all(posts)
+        await db.commit()
+
+        try:
+            published = await db.scalar(select(func.count()).select_from(BlogPost).where(BlogPost.is_published == True))
+            pages = -(-published // 2)
+            await StaticSiteExporter(output, page_size=2).export(db)
+
+            with open(os.path.join(output, "blog/index.html")) as f:
+                first = f.read()
+            assert "static-paged-2" in first and "static-paged-1" in first
+            assert 'href="/blog/page/2/"' in first
+            with open(os.path.join(output, f"blog/page/{pages}/index.html")) as f:
+                assert "Older posts" not in f.read()
+            assert not os.path.exists(os.path.join(output, f"blog/page/{pages + 1}/index.html"))
+        finally:
+            for post in posts:
+                await db.delete(post)
+            await db.commit()
+
+def test_export_lock_belongs_to_the_running_loop():
+    import asyncio
+    from app.application.static_export import _export_lock
+
+    async def locks():
+        return _export_lock(), _export_lock()
+
+    first, again = asyncio.run(locks())
+    other, _ = asyncio.run(locks())
+    assert first is again
+    assert other is not first
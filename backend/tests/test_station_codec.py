@@ -0,0 +1,41 @@
+from app.domain.models import StationRecord
+from app.infrastructure.persistence.codecs import StationListCodec
+from app.infrastructure.persistence.disk_cache import DiskCacheAdapter
+
+def station_dict(i: int, **overrides) -> dict:
+    data = {
+        "stationuuid": f"uuid-{i}", "name": f"Radio {i}", "url": "http://a", "url_resolved": "http://a",
+        "homepage": None, "favicon": None, "country": "Germany", "countrycode": "DE", "state": "",
+        "city": "", "language": "german", "tags": ["pop", "rock"], "clickcount": i, "votes": 0,
+        "codec": "MP3", "bitrate": None, "changeuuid": None,
+    }
+    data.update(overrides)
+    return data
+
+def test_round_trip_yields_equal_station_records():
+    codec = StationListCodec()
+    stations = [
+        station_dict(1),
+        station_dict(2, name="Rádio Ñandú 📻", tags=[], bitrate=128, homepage="https://x"),
+        station_dict(3, tags=["pop"], clickcount=2 ** 40),
+    ]
+    assert codec.can_encode(stations)
+    encoded = codec.encode(stations)
+    assert codec.is_encoded(encoded)
+    decoded = codec.decode(encoded)
+    assert decoded == [StationRecord.from_dict(s) for s in stations]
+    assert [s.to_dict() for s in decoded] == stations
+    assert StationRecord.from_cached(decoded) == decoded
+
+def test_non_station_values_are_not_encoded(tmp_path):
+    codec = StationListCodec()
+    assert not codec.can_encode([{"name": "Germany", "stationcount": 10}])
+    assert not codec.can_encode({"stations": 1})
+    assert not codec.can_encode([])
+
+    cache = DiskCacheAdapter(str(tmp_path), codec=codec)
+    cache.set("countries", [{"name": "Germany", "stationcount": 10}])
+    cache.set("browse", [station_dict(1)])
+    assert cache.get("countries") == [{"name": "Germany", "stationcount": 10}]
+    assert cache.get("browse") == [StationRecord.from_dict(station_dict(1))]
+    assert codec.is_encoded(cache.cache.get("browse"))
@@ -0,0 +1,106 @@
+import base64
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.api.v1.endpoints import stations as stations_endpoint
+from app.application.cursors import StationCursor, decode_station_cursor, encode_station_cursor, resume_index
+from app.application.services import StationService
+from app.core.config import settings
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from app.main import app
+from tests.test_station_service import FakeRadioRepo, make_station
+
+def test_resume_index_follows_the_cursor_station():
+    window = [make_station(i) for i in range(10)]
+    cursor = StationCursor(position=5, rank=window[4].clickcount, stationuuid="uuid-4")
+    assert resume_index(window, cursor, "clickcount", 5) == 5
+
+    # Two stations climbed above the cursor: it moved down, the page still starts after it
+    shifted = [make_station(100), make_station(101)] + window
+    assert resume_index(shifted, cursor, "clickcount", 5) == 7
+
+    # The cursor's station is gone: continue with the first station ranked below it
+    gone = [s for s in window if s.stationuuid != "uuid-4"]
+    assert gone[resume_index(gone, cursor, "clickcount", 5)].stationuuid == "uuid-5"
+
+@pytest.mark.asyncio
+async def test_cursor_pages_do_not_repeat_after_the_ranking_changes():
+    repo = FakeRadioRepo(total=60)
+    cache = AsyncCacheAdapter(MemoryCacheAdapter())
+    service = StationService(radio_repo=repo, cache_repo=cache)
+
+    first = await service.search_stations(country="Germany", limit=10)
+    cursor = StationCursor(10, first[-1].clickcount, first[-1].stationuuid)
+
+    # New popular stations appear and the cached chunks expire
+    repo.catalog[:0] = [make_station(-1), make_station(-2)]
+    await service.flush_cache()
+
+    second, offset = await service.resume_search(cursor, country="Germany", limit=10)
+    assert [s.stationuuid for s in second] == [f"uuid-{i}" for i in range(10, 20)]
+    assert offset == 12
+
+@pytest.mark.asyncio
+async def test_json_pages_carry_the_next_cursor_header(monkeypatch):
+    repo = FakeRadioRepo(total=25)
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    monkeypatch.setattr(stations_endpoint, "station_service", service)
+    url = f"{settings.API_V1_STR}/stations/search"
+
+    seen = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(url, params={"name": "jazz", "limit": 10})
+        while True:
+            seen += [s["stationuuid"] for s in response.json()]
+            cursor = response.headers.get("x-next-cursor")
+            if not cursor:
+                break
+            response = await ac.get(url, params={"name": "jazz", "limit": 10, "cursor": cursor})
+
+        assert seen == [f"uuid-{i}" for i in range(25)]
+        # Cursor pages of a name search share one cached ranked chunk
+        assert [call for call in repo.search_calls if call[3] == 0] == [
+            ("jazz", None, 10, 0), ("jazz", None, settings.BROWSE_CHUNK_SIZE, 0)
+        ]
+
+        bad = await ac.get(url, params={"name": "jazz", "cursor": "not-a-cursor"})
+        assert bad.status_code == 400
+
+def test_cursors_are_signed_and_bounded():
+    query = ("top",)
+    token = encode_station_cursor(StationCursor(100, 5, "uuid-99"), query)
+    assert decode_station_cursor(token, query) == StationCursor(100, 5, "uuid-99")
+
+    raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+    forged = base64.urlsafe_b64encode(raw.replace("100|", "9999999|", 1).encode()).decode().rstrip("=")
+    with pytest.raises(ValueError):
+        decode_station_cursor(forged, query)
+    with pytest.raises(ValueError):
+        decode_station_cursor(token, ("search", "jazz", None, None, None, None))
+
+    deep = encode_station_cursor(StationCursor(settings.CURSOR_MAX_POSITION + 1, 0, "uuid-x"), query)
+    with pytest.raises(ValueError):
+        decode_station_cursor(deep, query)
+
+@pytest.mark.asyncio
+async def test_top_pages_are_read_from_chunks():
+    class TopRepo(FakeRadioRepo):
+        def __init__(self, total):
+            super().__init__(total)
+            self.top_calls = []
+
+        async def get_top_stations(self, limit=100, offset=0):
+            self.top_calls.append((limit, offset))
+            return await super().get_top_stations(limit, offset)
+
+    repo = TopRepo(total=3 * settings.BROWSE_CHUNK_SIZE)
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    chunk = settings.BROWSE_CHUNK_SIZE
+
+    cursor = StationCursor(2 * chunk + 10, repo.catalog[2 * chunk + 9].votes, repo.catalog[2 * chunk + 9].stationuuid)
+    page, offset = await service.resume_top_stations(cursor, limit=20)
+    assert offset == 2 * chunk + 10
+    assert [s.stationuuid for s in page] == [f"uuid-{i}" for i in range(2 * chunk + 10, 2 * chunk + 30)]
+    # Only the chunks around the cursor, never the whole list above it
+    assert all(limit == chunk for limit, _ in repo.top_calls)
+    assert {offset for _, offset in repo.top_calls} <= {chunk, 2 * chunk}
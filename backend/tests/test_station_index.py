@@ -0,0 +1,90 @@
+import pytest
+from app.application.cursors import StationCursor
+from app.application.services import StationService
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from app.infrastructure.persistence.station_index import StationIndex
+from tests.test_station_codec import station_dict
+from tests.test_station_service import FakeRadioRepo
+
+CATALOG = [
+    station_dict(1, country="Germany", language="german", tags=["rock"], clickcount=50),
+    station_dict(2, country="France", countrycode="FR", language="french", tags=["jazz"], clickcount=90),
+    station_dict(3, country="Germany", language="german,english", tags=["classic rock", "pop"], clickcount=70, bitrate=128),
+    station_dict(4, country="Germany", language="english", tags=["news"], clickcount=10, name="Rádio Ñandú 📻"),
+]
+
+@pytest.fixture
+def index(tmp_path):
+    path = str(tmp_path / "index.bin")
+    StationIndex.write(path, CATALOG)
+    return StationIndex.load(path)
+
+def uuids(stations):
+    return [s["stationuuid"] for s in stations]
+
+def test_records_round_trip(index):
+    assert index.count == 4
+    assert index.search({"language": "english"}, limit=10) == [CATALOG[2], CATALOG[3]]
+    assert index.search({"country": "Germany"}, limit=1)[0]["bitrate"] == 128
+
+def test_only_known_keys_are_covered(index):
+    assert index.has_key("country", "GERMANY")
+    assert not index.has_key("country", "germ")
+    assert index.has_key("tag", "rock")
+    assert index.covers({"country": "Germany", "tag": "jazz", "language": None})
+    assert not index.covers({"country": "Germany", "tag": "polka"})
+    assert not index.covers({"country": None})
+
+def test_search_is_ranked_by_clickcount_with_radio_browser_matching(index):
+    # Exact, case-insensitive country; substring tags and languages
+    assert uuids(index.search({"country": "germany"}, limit=10)) == ["uuid-3", "uuid-1", "uuid-4"]
+    assert uuids(index.search({"country": "germ"}, limit=10)) == []
+    assert uuids(index.search({"tag": "rock"}, limit=10)) == ["uuid-3", "uuid-1"]
+    assert uuids(index.search({"language": "english", "country": "Germany"}, limit=10)) == ["uuid-3", "uuid-4"]
+    assert uuids(index.search({"country": "Germany"}, limit=1, offset=1)) == ["uuid-1"]
+
+def test_categories_are_counted_from_the_catalog(index):
+    assert index.categories("country", limit=10) == [("Germany", 3), ("France", 1)]
+    assert index.categories("tag", limit=10, name="ROCK") == [("classic rock", 1), ("rock", 1)]
+
+def test_missing_or_foreign_files_are_ignored(tmp_path):
+    assert StationIndex.load(str(tmp_path / "missing.bin")) is None
+    foreign = tmp_path / "foreign.bin"
+    foreign.write_bytes(b"\0" * 64)
+    assert StationIndex.load(str(foreign)) is None
+
+@pytest.mark.asyncio
+async def test_service_browses_from_the_index_before_going_upstream(index):
+    repo = FakeRadioRepo()
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()), station_index=index)
+
+    stations = await service.search_stations(country="Germany", limit=2)
+    assert [s.stationuuid for s in stations] == ["uuid-3", "uuid-1"]
+    assert [c.name for c in await service.get_countries()] == ["Germany", "France"]
+    assert repo.search_calls == []
+
+    # A category the index has never seen falls back to Radio Browser
+    await service.search_stations(country="Atlantis", limit=2)
+    assert len(repo.search_calls) == 1
+
+@pytest.mark.asyncio
+async def test_every_page_of_an_unindexed_category_goes_upstream(index):
+    repo = FakeRadioRepo(total=60)
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()), station_index=index)
+
+    second = await service.search_stations(tag="polka", limit=20, offset=20)
+    assert [s.stationuuid for s in second] == [f"uuid-{i}" for i in range(20, 40)]
+
+    streamed = [s.stationuuid async for s in service.stream_stations(tag="polka", limit=20, offset=40)]
+    assert streamed == [f"uuid-{i}" for i in range(40, 60)]
+
+    cursor = StationCursor(40, second[-1].clickcount, second[-1].stationuuid)
+    third, offset = await service.resume_search(cursor, tag="polka", limit=20)
+    assert [s.stationuuid for s in third] == [f"uuid-{i}" for i in range(40, 60)]
+    assert offset == 40
+
+    # An indexed category with no further results stays local
+    calls = len(repo.search_calls)
+    assert await service.search_stations(country="Germany", limit=20, offset=20) == []
+    assert len(repo.search_calls) == calls
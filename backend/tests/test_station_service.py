@@ -0,0 +1,123 @@
+import pytest
+from app.application.interfaces import IRadioRepository
+from app.application.services import StationService
+from app.core.config import settings
+from app.domain.models import StationRecord
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+
+def make_station(i: int, country: str = "Germany") -> StationRecord:
+    return StationRecord(
+        stationuuid=f"uuid-{i}", name=f"Station {i}", url=f"http://s{i}", url_resolved=f"http://s{i}",
+        country=country, countrycode="DE", state="", city="", language="german",
+        tags=["pop"], clickcount=10_000 - i, votes=i
+    )
+
+class FakeRadioRepo(IRadioRepository):
+    def __init__(self, total: int = 600):
+        self.catalog = [make_station(i) for i in range(total)]
+        self.search_calls = []
+
+    async def get_top_stations(self, limit=100, offset=0):
+        return self.catalog[offset:offset + limit]
+
+    async def search_stations(self, name=None, country=None, countrycode=None, language=None, tag=None, limit=100, offset=0):
+        self.search_calls.append((name, country, limit, offset))
+        return self.catalog[offset:offset + limit]
+
+    async def get_countries(self, limit=100, offset=0, name=None):
+        return []
+
+    async def get_languages(self, limit=100, offset=0, name=None):
+        return []
+
+    async def get_tags(self, limit=100, offset=0, name=None):
+        return []
+
+    async def get_summary_stats(self):
+        return {"countries": 0, "languages": 0, "tags": 0, "stations": len(self.catalog)}
+
+@pytest.mark.asyncio
+async def test_browse_windows_share_cached_chunks():
+    repo = FakeRadioRepo()
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    chunk = settings.BROWSE_CHUNK_SIZE
+
+    first = await service.search_stations(country="Germany", limit=20, offset=0)
+    wider = await service.search_stations(country="Germany", limit=50, offset=0)
+    assert [s.stationuuid for s in first] == [f"uuid-{i}" for i in range(20)]
+    assert [s.stationuuid for s in wider] == [f"uuid-{i}" for i in range(50)]
+    assert repo.search_calls == [(None, "Germany", chunk, 0)]
+
+    # A window spanning a chunk boundary is stitched from two chunks
+    window = await service.search_stations(country="Germany", limit=20, offset=chunk - 10)
+    assert [s.stationuuid for s in window] == [f"uuid-{i}" for i in range(chunk - 10, chunk + 10)]
+    assert len(repo.search_calls) == 2
+
+@pytest.mark.asyncio
+async def test_name_searches_bypass_the_browse_cache():
+    repo = FakeRadioRepo()
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+
+    await service.search_stations(name="jazz", limit=10)
+    await service.search_stations(name="jazz", limit=10)
+    assert repo.search_calls == [("jazz", None, 10, 0), ("jazz", None, 10, 0)]
+
+@pytest.mark.asyncio
+async def test_snapshot_serves_misses_and_refreshes_in_background(tmp_path):
+    import asyncio
+    from app.infrastructure.persistence.snapshot import StationSnapshot
+
+    bundled = [make_station(i, country="Bundled").to_dict() for i in range(3)]
+    path = str(tmp_path / "snapshot.bin")
+    StationSnapshot.write(path, {"top_100_v2": bundled, "summary_stats": {"countries": 1, "languages": 1, "tags": 1, "stations": 3}})
+    snapshot = StationSnapshot.load(path)
+    assert [s.to_dict() for s in snapshot.get("top_100_v2")] == bundled
+
+    repo = FakeRadioRepo()
+    cache = AsyncCacheAdapter(MemoryCacheAdapter())
+    service = StationService(radio_repo=repo, cache_repo=cache, snapshot=snapshot)
+
+    first = await service.get_top_stations(100)
+    assert [s.country for s in first] == ["Bundled"] * 3
+    assert (await service.get_summary_stats()).stations == 3
+
+    # The live lists replace the bundled ones once the background refresh lands
+    await asyncio.gather(*service._snapshot_refreshes.values())
+    await cache.flush()
+    live = await service.get_top_stations(100)
+    assert len(live) == 100 and live[0].country == "Germany"
+    assert (await service.get_summary_stats()).stations == len(repo.catalog)
+
+def test_snapshot_load_ignores_missing_or_foreign_files(tmp_path):
+    from app.infrastructure.persistence.snapshot import StationSnapshot
+
+    assert StationSnapshot.load(str(tmp_path / "missing.bin")) is None
+    foreign = tmp_path / "foreign.bin"
+    foreign.write_bytes(b"not a snapshot at all")
+    assert StationSnapshot.load(str(foreign)) is None
+
+def test_station_records_round_trip_and_share_repeated_strings():
+    a = StationRecord.from_dict(make_station(1).to_dict())
+    b = StationRecord.from_dict({**make_station(2).to_dict(), "country": "".join(["Ger", "many"])})
+    assert a == make_station(1)
+    assert a.to_dict()["tags"] == ["pop"]
+    assert a.country is b.country
+    assert not hasattr(a, "__dict__")
+    # Hashable like the dicts and models they replace
+    assert len({a, make_station(1), b}) == 2
+
+@pytest.mark.asyncio
+async def test_endpoints_serialize_records_with_the_api_schema(monkeypatch):
+    from httpx import AsyncClient, ASGITransport
+    from app.api.v1.endpoints import stations as stations_endpoint
+    from app.main import app
+
+    service = StationService(radio_repo=FakeRadioRepo(total=5), cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    monkeypatch.setattr(stations_endpoint, "station_service", service)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(f"{settings.API_V1_STR}/stations/top?limit=2")
+    assert response.status_code == 200
+    body = response.json()
+    assert [s["stationuuid"] for s in body] == ["uuid-0", "uuid-1"]
+    assert body[0]["country"] == "Germany"
@@ -0,0 +1,118 @@
+import json
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.api.v1.endpoints import stations as stations_endpoint
+from app.application.interfaces import StationStreamError
+from app.application.services import StationService
+from app.core.config import settings
+from app.infrastructure.external.radio_browser import iter_json_array
+from app.infrastructure.persistence.async_cache import AsyncCacheAdapter
+from app.infrastructure.persistence.memory_cache import MemoryCacheAdapter
+from app.main import app
+from tests.test_station_service import FakeRadioRepo
+
+async def text_chunks(text: str, size: int):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+@pytest.mark.asyncio
+async def test_json_arrays_are_decoded_as_they_arrive():
+    items = [{"name": f"Radio {i}", "tags": "a,b", "nested": {"x": [i, "]"]}} for i in range(20)]
+    text = json.dumps(items, indent=1)
+    decoded = [item async for item in iter_json_array(text_chunks(text, 7))]
+    assert decoded == items
+    assert [item async for item in iter_json_array(text_chunks("[]", 1))] == []
+
+@pytest.mark.asyncio
+async def test_browse_streams_across_chunks_without_building_the_window():
+    repo = FakeRadioRepo()
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    chunk = settings.BROWSE_CHUNK_SIZE
+
+    stream = service.stream_stations(country="Germany", limit=20, offset=chunk - 10)
+    first = await stream.__anext__()
+    assert first.stationuuid == f"uuid-{chunk - 10}"
+    # Only the first chunk has been fetched so far
+    assert repo.search_calls == [(None, "Germany", chunk, 0)]
+    rest = [s.stationuuid async for s in stream]
+    assert rest == [f"uuid-{i}" for i in range(chunk - 9, chunk + 10)]
+    assert len(repo.search_calls) == 2
+
+@pytest.mark.asyncio
+async def test_ndjson_search_continues_with_cursors(monkeypatch):
+    repo = FakeRadioRepo(total=25)
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    monkeypatch.setattr(stations_endpoint, "station_service", service)
+    url = f"{settings.API_V1_STR}/stations/search"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(url, params={"name": "radio", "limit": 10}, headers={"Accept": "application/x-ndjson"})
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "Accept" in response.headers["vary"]
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [s["stationuuid"] for s in lines[:-1]] == [f"uuid-{i}" for i in range(10)]
+        cursor = lines[-1]["next_cursor"]
+
+        seen = len(lines) - 1
+        while cursor:
+            response = await ac.get(url, params={"name": "radio", "limit": 10, "cursor": cursor, "stream": 1})
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert lines[0]["stationuuid"] == f"uuid-{seen}"
+            seen += len(lines) - 1
+            cursor = lines[-1]["next_cursor"]
+        assert seen == 25
+
+        # A cursor is bound to the query it was issued for
+        response = await ac.get(url, params={"name": "radio", "limit": 10}, headers={"Accept": "application/x-ndjson"})
+        cursor = response.text.splitlines()[-1]
+        other = await ac.get(url, params={"name": "jazz", "cursor": json.loads(cursor)["next_cursor"], "stream": 1})
+        assert other.status_code == 400
+
+        plain = await ac.get(f"{settings.API_V1_STR}/stations/top", params={"limit": 5})
+        assert plain.headers["content-type"] == "application/json"
+        streamed = await ac.get(f"{settings.API_V1_STR}/stations/top", params={"limit": 5, "stream": 1})
+        assert [json.loads(line) for line in streamed.text.splitlines()[:-1]] == plain.json()
+
+@pytest.mark.asyncio
+async def test_top_streams_read_one_chunk_at_a_time():
+    class TopRepo(FakeRadioRepo):
+        def __init__(self, total):
+            super().__init__(total)
+            self.top_calls = []
+
+        async def get_top_stations(self, limit=100, offset=0):
+            self.top_calls.append((limit, offset))
+            return await super().get_top_stations(limit, offset)
+
+    chunk = settings.BROWSE_CHUNK_SIZE
+    repo = TopRepo(total=3 * chunk)
+    service = StationService(radio_repo=repo, cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+
+    streamed = [s.stationuuid async for s in service.stream_top_stations(limit=10, offset=2 * chunk)]
+    assert streamed == [f"uuid-{i}" for i in range(2 * chunk, 2 * chunk + 10)]
+    assert repo.top_calls == [(chunk, 2 * chunk)]
+
+    # The first page is streamed from chunks too, never as one list of `limit` stations
+    stream = service.stream_top_stations(limit=chunk + 5)
+    assert (await stream.__anext__()).stationuuid == "uuid-0"
+    assert repo.top_calls[1:] == [(chunk, 0)]
+    assert len([s async for s in stream]) == chunk + 4
+    assert repo.top_calls[1:] == [(chunk, 0), (chunk, chunk)]
+
+@pytest.mark.asyncio
+async def test_interrupted_streams_end_with_an_error_record(monkeypatch):
+    class BrokenRepo(FakeRadioRepo):
+        async def iter_search_stations(self, *args, **kwargs):
+            for station in self.catalog[:3]:
+                yield station
+            raise StationStreamError("connection reset")
+
+    service = StationService(radio_repo=BrokenRepo(total=25), cache_repo=AsyncCacheAdapter(MemoryCacheAdapter()))
+    monkeypatch.setattr(stations_endpoint, "station_service", service)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(f"{settings.API_V1_STR}/stations/search", params={"name": "radio", "limit": 10, "stream": 1})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 4
+    assert "error" in lines[-1]
+    assert all("next_cursor" not in line for line in lines)
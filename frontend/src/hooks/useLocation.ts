@@ -1,6 +1,6 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef } from 'react';
 import { Station } from '../types/station';
-import { apiFetch } from '../services/apiClient';
+import { apiFetchPage } from '../services/apiClient';
 
 export function useLocation() {
   const [nearMeStations, setNearMeStations] = useState<Station[]>(() => {
@@ -14,6 +14,8 @@ export function useLocation() {
     return localStorage.getItem('radiolite_user_country_code');
   });
   const [loading, setLoading] = useState(false);
+  // Continuation of the near-me list, from the X-Next-Cursor response header
+  const nextCursor = useRef<string | null>(null);
 
   const detectLocation = useCallback(async () => {
     console.log("Detecting location via IP...");
@@ -103,15 +105,20 @@ export function useLocation() {
   const fetchNearMeStations = useCallback(async (countryCode: string, options: { append?: boolean, offset?: number } = {}) => {
     if (!countryCode || countryCode === "Unknown") return [];
     
-    const shouldAppend = options.append || false;
+    const cursor = options.append ? nextCursor.current : null;
+    // Nothing left to append
+    if (options.append && !cursor) return [];
+    const shouldAppend = cursor !== null;
     const currentOffset = options.offset || 0;
 
     setLoading(true);
     try {
       console.log(`Fetching near me stations for country: ${countryCode}...`);
       // Use countrycode (2-letter code) instead of full country name for much better reliability
-      const url = `/stations/search?countrycode=${encodeURIComponent(countryCode)}&limit=100&offset=${currentOffset}&hidebroken=true&order=clickcount&reverse=true`;
-      const data = await apiFetch<Station[]>(url);
+      let url = `/stations/search?countrycode=${encodeURIComponent(countryCode)}&limit=100&hidebroken=true&order=clickcount&reverse=true`;
+      url += cursor ? `&cursor=${encodeURIComponent(cursor)}` : `&offset=${currentOffset}`;
+      const { data, nextCursor: next } = await apiFetchPage<Station[]>(url);
+      nextCursor.current = next;
       
       console.log(`Fetch success: Found ${data.length} stations for ${countryCode}`);
       
@@ -1,6 +1,9 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef } from 'react';
 import { Station } from '../types/station';
-import { apiFetch } from '../services/apiClient';
+import { apiFetch, apiFetchPage } from '../services/apiClient';
+
+// Identifies this tab to the backend, which cancels its superseded type-ahead queries
+const CLIENT_ID = crypto.randomUUID();
 
 export function useSearch() {
   const [stations, setStations] = useState<Station[]>([]);
@@ -15,10 +18,14 @@ export function useSearch() {
     locations: any[];
     stations: Station[];
   } | null>(null);
+  const globalSearchAbort = useRef<AbortController | null>(null);
+  // Continuation of the last station list, from the X-Next-Cursor response header
+  const nextCursor = useRef<string | null>(null);
 
   const resetPagination = useCallback(() => {
     setOffset(0);
     setHasMore(true);
+    nextCursor.current = null;
   }, []);
 
   const searchStations = useCallback(async (
@@ -31,7 +38,8 @@ export function useSearch() {
       return;
     }
     
-    const shouldAppend = options.append || false;
+    const cursor = options.append && !options.resetOffset ? nextCursor.current : null;
+    const shouldAppend = cursor !== null;
     const newOffset = options.resetOffset ? 0 : (options.offset ?? 0);
     
     setLoading(true);
@@ -39,22 +47,26 @@ export function useSearch() {
     if (!shouldAppend) setStations([]);
 
     try {
-      let url = `/stations/search?limit=100&offset=${newOffset}&hidebroken=true&order=clickcount&reverse=true`;
+      let url = `/stations/search?limit=100&hidebroken=true&order=clickcount&reverse=true`;
+      // Later pages continue from the cursor, which stays put when the ranking shifts
+      url += cursor ? `&cursor=${encodeURIComponent(cursor)}` : `&offset=${newOffset}`;
       if (query) url += `&name=${encodeURIComponent(query)}`;
       if (filters.country) url += `&country=${encodeURIComponent(filters.country)}`;
       if (filters.language) url += `&language=${encodeURIComponent(filters.language)}`;
       if (filters.tag) url += `&tag=${encodeURIComponent(filters.tag)}`;
       
-      const data = await apiFetch<Station[]>(url);
+      const { data, nextCursor: next } = await apiFetchPage<Station[]>(url);
+      nextCursor.current = next;
       
       if (shouldAppend) {
         setStations(prev => [...prev, ...data]);
+        setOffset(prev => prev + data.length);
       } else {
         setStations(data);
+        setOffset(newOffset);
       }
       
-      setOffset(newOffset);
-      setHasMore(data.length === 100);
+      setHasMore(next !== null);
     } catch (err) {
       console.error("Search failed", err);
       setError("Failed to connect to backend.");
@@ -64,6 +76,8 @@ export function useSearch() {
   }, []);
 
   const searchGlobal = useCallback(async (query: string) => {
+    // Only the latest query's results are wanted: abort the request still in flight
+    globalSearchAbort.current?.abort();
     if (!query || query.length < 2) {
         setGlobalSearchResults(null);
         setStations([]);
@@ -76,15 +90,24 @@ export function useSearch() {
     setGlobalSearchResults(null);
     setLoading(true);
     setError(null);
+    const controller = new AbortController();
+    globalSearchAbort.current = controller;
     try {
-        const data = await apiFetch<any>(`/stations/global-search?query=${encodeURIComponent(query)}`);
+        const data = await apiFetch<any>(`/stations/global-search?query=${encodeURIComponent(query)}`, {
+          signal: controller.signal,
+          headers: { 'X-Client-Id': CLIENT_ID },
+        });
         setGlobalSearchResults(data);
         setHasMore(data.stations.length >= 20);
     } catch (err) {
+        if (controller.signal.aborted) return;
         console.error("Global search failed", err);
         setError("Failed to search.");
     } finally {
-        setLoading(false);
+        if (globalSearchAbort.current === controller) {
+          globalSearchAbort.current = null;
+          setLoading(false);
+        }
     }
   }, [resetPagination]);
 
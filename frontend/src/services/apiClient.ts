@@ -7,11 +7,27 @@ if (!API_URL.includes('/api/v1') && !API_URL.includes('localhost')) {
 
 export const BASE_URL = API_URL;
 
-export async function apiFetch<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
+async function request(endpoint: string, options: RequestInit): Promise<Response> {
   const url = endpoint.startsWith('http') ? endpoint : `${BASE_URL}${endpoint}`;
   const response = await fetch(url, options);
   if (!response.ok) {
     throw new Error(`API Error: ${response.status} ${response.statusText}`);
   }
+  return response;
+}
+
+export async function apiFetch<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
+  const response = await request(endpoint, options);
   return response.json();
 }
+
+export interface ApiPage<T> {
+  data: T;
+  // Token for the following page (sent back as `cursor`), or null after the last page
+  nextCursor: string | null;
+}
+
+export async function apiFetchPage<T>(endpoint: string, options: RequestInit = {}): Promise<ApiPage<T>> {
+  const response = await request(endpoint, options);
+  return { data: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+}